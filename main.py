@@ -23,6 +23,7 @@ import shutil
 import sys
 import threading
 import time
+import traceback
 from importlib import reload
 from importlib.util import find_spec
 
@@ -184,11 +185,15 @@ for module_name, module in list(sys.modules.items()):
 from scripts.clan import clan_class
 from scripts.game_structure.audio import sound_manager, music_manager
 from scripts.game_structure.load_cat import load_cats, version_convert
-from scripts.game_structure.windows import SaveCheck
+from scripts.game_structure.windows import SaveCheck, SaveError
 from scripts.game_structure.screen_settings import screen_scale, MANAGER, screen
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure import constants
-from scripts.game_structure.game.save_load import read_clans
+from scripts.game_structure.game.save_load import (
+    collect_background_save_errors,
+    read_clans,
+    wait_for_background_saves,
+)
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game.switches import (
     switch_get_value,
@@ -326,6 +331,9 @@ def load_game():
     """
     global finished_loading
 
+    # the Clan being switched away from has to be on disk before anything is loaded
+    wait_for_background_saves()
+
     game.cur_events_list.clear()
     game.patrol_cats.clear()
     game.patrolled.clear()
@@ -374,6 +382,9 @@ while 1:
     if switch_get_value(Switch.switch_clan):
         load_game()
 
+    for save_error in collect_background_save_errors():
+        SaveError("".join(traceback.format_exception(save_error)))
+
     # Draw screens
     # This occurs before events are handled to stop pygame_gui buttons from blinking.
     game.all_screens[game.current_screen].on_use()
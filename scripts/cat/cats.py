@@ -16,15 +16,18 @@ import ujson  # type: ignore
 
 import scripts.game_structure.localization as pronouns
 from scripts.cat.enums import CatAge, CatRank, CatSocial, CatGroup
+from scripts.cat.faded_archive import faded_archive
 from scripts.cat.history import History
 from scripts.cat.names import Name
 from scripts.cat.pelts import Pelt
+from scripts.cat.registry import CatRegistry
 from scripts.cat.personality import Personality
 from scripts.cat.skills import CatSkills
 from scripts.cat.status import Status, StatusDict
 from scripts.cat.thoughts import Thoughts
-from scripts.cat_relations.inheritance import Inheritance
+from scripts.cat_relations.inheritance import Inheritance, Kinship, family_graph
 from scripts.cat_relations.relationship import Relationship
+from scripts.cat_relations.relationship_store import RelationshipRow
 from scripts.clan_package.settings import get_clan_setting
 from scripts.conditions import (
     Illness,
@@ -36,11 +39,17 @@ from scripts.conditions import (
 from scripts.event_class import Single_Event
 from scripts.events_module.generate_events import GenerateEvents
 from scripts.game_structure import image_cache, constants
-from scripts.game_structure.game.save_load import safe_save
+from scripts.game_structure.game.save_load import (
+    on_save_failure,
+    safe_remove,
+    safe_save,
+    wait_for_background_saves,
+)
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.localization import load_lang_resource
+from scripts.game_structure.profiling import profiled
 from scripts.game_structure.screen_settings import screen
 from scripts.housekeeping.datadir import get_save_dir
 from scripts.utility import (
@@ -105,7 +114,7 @@ class Cat:
         "master": (321, 321),
     }
 
-    all_cats: Dict[str, Cat] = {}  # ID: object
+    all_cats: CatRegistry = CatRegistry()  # ID: object, indexed by group, rank and age
     outside_cats: Dict[str, Cat] = {}  # cats outside the clan
     id_iter = itertools.count()
 
@@ -157,6 +166,8 @@ class Cat:
         """
 
         self._history = None
+        # conditions as last written to the save, to skip unchanged condition files
+        self._saved_conditions = None
 
         if (
             faded
@@ -174,17 +185,17 @@ class Cat:
         # Public attributes
         self.gender = gender
         self.species = species
-        self.status: Status = Status(**status_dict) if status_dict else Status()
+        self.status = Status(**status_dict) if status_dict else Status()
         self.backstory = backstory
-        self.age = None
+        self._age = None
         self.skills = CatSkills(skill_dict=skill_dict)
         self.personality = Personality(
             trait="troublesome", lawful=0, aggress=0, stable=0, social=0
         )
-        self.parent1 = parent1
-        self.parent2 = parent2
+        self._parent1 = parent1
+        self._parent2 = parent2
         self.par2species = par2species
-        self.adoptive_parents = adoptive_parents if adoptive_parents else []
+        self._adoptive_parents = adoptive_parents if adoptive_parents else []
         self.pelt = pelt if pelt else Pelt()
         self.former_mentor = []
         self.patrol_with_mentor = 0
@@ -209,7 +220,7 @@ class Cat:
 
         # Various behavior toggles
         self.no_kits = False
-        self.no_mates = False
+        self._no_mates = False
         self.no_retire = False
 
         self.prevent_fading = False  # Prevents a cat from fading
@@ -240,6 +251,7 @@ class Cat:
             self.ID = potential_id
         else:
             self.ID = ID
+        family_graph.refile(self)
 
         # species
         if species is None:
@@ -372,9 +384,11 @@ class Cat:
         :return: None
         """
         self.ID = ID
-        self.parent1 = None
-        self.parent2 = None
-        self.adoptive_parents = []
+        # set directly, the setters refile the cat and need both parents to exist
+        self._parent1 = None
+        self._parent2 = None
+        self._adoptive_parents = []
+        self._no_mates = False
         self.mate = []
         self.status = Status(**status) if status else Status()
         self._pronouns = {}  # Needs to be set as a dict
@@ -564,6 +578,67 @@ class Cat:
     def __hash__(self):
         return hash(self.ID)
 
+    @property
+    def parent1(self) -> Optional[str]:
+        return self._parent1
+
+    @parent1.setter
+    def parent1(self, value: Optional[str]):
+        self._parent1 = value
+        family_graph.refile(self)
+
+    @property
+    def parent2(self) -> Optional[str]:
+        return self._parent2
+
+    @parent2.setter
+    def parent2(self, value: Optional[str]):
+        self._parent2 = value
+        family_graph.refile(self)
+
+    @property
+    def adoptive_parents(self) -> List[str]:
+        """Changing the list in place doesn't update the family graph, the cat is filed again with their next
+        Inheritance."""
+        return self._adoptive_parents
+
+    @adoptive_parents.setter
+    def adoptive_parents(self, value: List[str]):
+        self._adoptive_parents = value
+        family_graph.refile(self)
+
+    @property
+    def age(self) -> Optional[CatAge]:
+        return self._age
+
+    @age.setter
+    def age(self, value: Optional[CatAge]):
+        self._age = value
+        self._refile()
+
+    @property
+    def status(self) -> Status:
+        return self._status
+
+    @status.setter
+    def status(self, value: Status):
+        self._status = value
+        value.on_change = self._refile
+        self._refile()
+
+    @property
+    def no_mates(self) -> bool:
+        return self._no_mates
+
+    @no_mates.setter
+    def no_mates(self, value: bool):
+        self._no_mates = value
+        self._refile()
+
+    def _refile(self):
+        """Keep the indexes of Cat.all_cats up to date after the cat's group, rank, age or no_mates changed"""
+        Cat.all_cats.refile(self)
+
     @property
     def dead(self) -> bool:
         return self.status.group and self.status.group.is_afterlife()
@@ -607,6 +682,20 @@ class Cat:
                 "\nCat.mentor has to be either None (no mentor) or the mentor's ID as a string."
             )
 
+    @property
+    def relationships(self) -> RelationshipRow:
+        """The cat's relationships to other cats, keyed by their ID."""
+        return self._relationships
+
+    @relationships.setter
+    def relationships(self, relationships: Dict[str, Relationship]):
+        """Replaces all of the cat's relationships with the given ones."""
+        row = RelationshipRow(self)
+        if relationships:
+            for cat_id, relationship in relationships.items():
+                row[cat_id] = relationship
+        self._relationships = row
+
     @property
     def pronouns(self) -> List[Dict[str, Union[str, int]]]:
         """
@@ -656,6 +745,11 @@ class Cat:
     def history(self, val: History):
         self._history = val
 
+    @property
+    def history_changed(self) -> bool:
+        """True if the history is loaded and has changed since it was last saved"""
+        return self._history is not None and self._history.dirty
+
     def get_genderalign_string(self):
         # translate it if it's default
         if self.genderalign in (
@@ -1169,6 +1263,7 @@ class Cat:
                 {"involved": None, "text": scar, "moon": "?"} for scar in scar_events
             )
         self.history = History(died_by=deaths, scar_events=scars, cat=self)
+        self.history.dirty = True
 
     def load_history(self):
         """Load this cat's history"""
@@ -1186,6 +1281,8 @@ class Cat:
 
         history_directory = f"{get_save_dir()}/{clanname}/history/"
         cat_history_directory = history_directory + self.ID + "_history.json"
+        # the file may still be written by a background save
+        wait_for_background_saves()
 
         if not os.path.exists(cat_history_directory):
             self._history = History(
@@ -1256,23 +1353,15 @@ class Cat:
         if not os.path.exists(history_dir):
             os.makedirs(history_dir)
 
-        history_dict = self.history.make_dict()
+        history = self.history
         try:
-            safe_save(f"{history_dir}/{self.ID}_history.json", history_dict)
-        except:
-            self.history = History(
-                beginning={},
-                mentor_influence={},
-                app_ceremony={},
-                lead_ceremony=None,
-                possible_history={},
-                died_by=[],
-                scar_events=[],
-                murder={},
-                cat=self,
-            )
-
+            safe_save(f"{history_dir}/{self.ID}_history.json", history.make_dict())
+        except Exception:
+            # the history stays dirty, so the next save tries again
             print(f"WARNING: saving history of cat #{self.ID} didn't work")
+            return
+        history.dirty = False
+        on_save_failure(setattr, history, "dirty", True)
 
     def generate_lead_ceremony(self):
         """Create a leader ceremony and add it to the history"""
@@ -1593,6 +1682,7 @@ class Cat:
     #                              moon skip functions                             #
     # ---------------------------------------------------------------------------- #
 
+    @profiled("cat updates")
     def one_moon(self):
         """Handles a moon skip for an alive cat."""
         old_age = self.age
@@ -1623,6 +1713,7 @@ class Cat:
         if self.status.rank.is_any_apprentice_rank():
             self.update_mentor()
 
+    @profiled("thoughts")
     def thoughts(self):
         """Generates a thought for the cat, which displays on their profile."""
         all_cats = self.all_cats
@@ -1706,6 +1797,7 @@ class Cat:
         # insert thought
         self.thought = str(chosen_thought)
 
+    @profiled("interactions")
     def relationship_interaction(self):
         """Randomly choose a cat of the Clan and have an interaction with them."""
         cats_to_choose = [
@@ -1883,19 +1975,19 @@ class Cat:
         """Check if the cat is the grandparent of the other cat."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
-        return other_cat.ID in self.inheritance.grand_kits.keys()
+        return Kinship.GRAND_KIT in self.inheritance.get_kinship(other_cat.ID)
 
     def is_parent(self, other_cat: Cat):
         """Check if the cat is the parent of the other cat."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
-        return other_cat.ID in self.inheritance.kits.keys()
+        return Kinship.KIT in self.inheritance.get_kinship(other_cat.ID)
 
     def is_sibling(self, other_cat: Cat):
         """Check if the cats are siblings."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
-        return other_cat.ID in self.inheritance.siblings.keys()
+        return Kinship.SIBLING in self.inheritance.get_kinship(other_cat.ID)
 
     def is_littermate(self, other_cat: Cat):
         """Check if the cats are littermates."""
@@ -1912,13 +2004,13 @@ class Cat:
         """Check if the cats are related as uncle/aunt and niece/nephew."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
-        return other_cat.ID in self.inheritance.siblings_kits.keys()
+        return Kinship.SIBLINGS_KIT in self.inheritance.get_kinship(other_cat.ID)
 
     def is_cousin(self, other_cat: Cat):
         """Check if this cat and other_cat are cousins."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
-        return other_cat.ID in self.inheritance.cousins.keys()
+        return Kinship.COUSIN in self.inheritance.get_kinship(other_cat.ID)
 
     def is_related(self, other_cat, cousin_allowed):
         """Checks if the given cat is related to the current cat, according to the inheritance."""
@@ -1928,8 +2020,8 @@ class Cat:
             return other_cat.ID in self.inheritance.all_but_cousins
         return other_cat.ID in self.inheritance.all_involved
 
-    def get_relatives(self, cousin_allowed=True) -> list:
-        """Returns a list of ids of all nearly related ancestors."""
+    def get_relatives(self, cousin_allowed=True) -> set:
+        """Returns a set of ids of all nearly related ancestors."""
         if not self.inheritance:
             self.inheritance = Inheritance(self)
         if cousin_allowed:
@@ -2305,8 +2397,11 @@ class Cat:
                 )
                 self.get_ill(illness_name)
 
-    def save_condition(self):
-        # save conditions for each cat
+    def save_condition(self) -> bool:
+        """
+        Save the conditions of this cat, if they changed since the last save.
+        :return: True if the condition file was written
+        """
         clanname = None
         if switch_get_value(Switch.clan_name) != "":
             clanname = switch_get_value(Switch.clan_name)
@@ -2323,9 +2418,11 @@ class Cat:
             or self.dead
             or self.status.is_outsider
         ):
-            if os.path.exists(condition_file_path):
-                os.remove(condition_file_path)
-            return
+            if self._saved_conditions is not None:
+                safe_remove(condition_file_path)
+                self._saved_conditions = None
+                on_save_failure(self._conditions_not_saved)
+            return False
 
         conditions = {}
 
@@ -2338,7 +2435,20 @@ class Cat:
         if self.is_disabled():
             conditions["permanent conditions"] = self.permanent_condition
 
-        safe_save(condition_file_path, conditions)
+        # conditions are changed in place from many places, so compare with what was saved
+        condition_data = ujson.dumps(conditions, indent=4)
+        if condition_data == self._saved_conditions:
+            return False
+
+        safe_save(condition_file_path, condition_data)
+        self._saved_conditions = condition_data
+        on_save_failure(self._conditions_not_saved)
+        return True
+
+    def _conditions_not_saved(self):
+        """The condition file couldn't be written or removed, so it's saved again on the next save"""
+        # unlike None this has an outdated file removed, and it matches no condition data
+        self._saved_conditions = ""
 
     def load_conditions(self):
         if switch_get_value(Switch.clan_name) != "":
@@ -2348,6 +2458,8 @@ class Cat:
 
         condition_directory = get_save_dir() + "/" + clanname + "/conditions/"
         condition_cat_directory = condition_directory + self.ID + "_conditions.json"
+        # the file may still be written by a background save
+        wait_for_background_saves()
         if not os.path.exists(condition_cat_directory):
             return
 
@@ -2357,6 +2469,7 @@ class Cat:
                 self.illnesses = rel_data.get("illnesses", {})
                 self.injuries = rel_data.get("injuries", {})
                 self.permanent_condition = rel_data.get("permanent conditions", {})
+                self._saved_conditions = ujson.dumps(rel_data, indent=4)
 
             if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
                 self.pelt.paralyzed = True
@@ -2727,8 +2840,8 @@ class Cat:
             # if they are not outside of the Clan at the same time
             if self.status.group != inter_cat.status.group:
                 continue
-            inter_cat.relationships[self.ID] = Relationship(inter_cat, self)
-            self.relationships[inter_cat.ID] = Relationship(self, inter_cat)
+            inter_cat.relationships.add(self)
+            self.relationships.add(inter_cat)
 
     def init_all_relationships(self):
         """Create Relationships to all current Clancats."""
@@ -2798,9 +2911,8 @@ class Cat:
                 if siblings and like < 30:
                     like = 30
 
-                rel = Relationship(
-                    cat_from=self,
-                    cat_to=the_cat,
+                self.relationships.add(
+                    the_cat,
                     mates=mates,
                     family=related,
                     romantic_love=romantic_love,
@@ -2811,28 +2923,11 @@ class Cat:
                     jealousy=jealousy,
                     trust=trust,
                 )
-                self.relationships[the_cat.ID] = rel
 
     def save_relationship_of_cat(self, relationship_dir):
         # save relationships for each cat
 
-        rel = []
-        for r in self.relationships.values():
-            r_data = {
-                "cat_from_id": r.cat_from.ID,
-                "cat_to_id": r.cat_to.ID,
-                "mates": r.mates,
-                "family": r.family,
-                "romantic_love": r.romantic_love,
-                "platonic_like": r.platonic_like,
-                "dislike": r.dislike,
-                "admiration": r.admiration,
-                "comfortable": r.comfortable,
-                "jealousy": r.jealousy,
-                "trust": r.trust,
-                "log": r.log,
-            }
-            rel.append(r_data)
+        rel = list(self.relationships.records())
 
         safe_save(f"{relationship_dir}/{self.ID}_relations.json", rel)
 
@@ -2844,6 +2939,8 @@ class Cat:
 
         relation_directory = get_save_dir() + "/" + clanname + "/relationships/"
         relation_cat_directory = relation_directory + self.ID + "_relations.json"
+        # the file may still be written by a background save
+        wait_for_background_saves()
 
         self.relationships = {}
         if os.path.exists(relation_directory):
@@ -2859,21 +2956,8 @@ class Cat:
                         cat_to = self.all_cats.get(rel["cat_to_id"])
                         if cat_to is None or rel["cat_to_id"] == self.ID:
                             continue
-                        new_rel = Relationship(
-                            cat_from=self,
-                            cat_to=cat_to,
-                            mates=rel["mates"] or False,
-                            family=rel["family"] or False,
-                            romantic_love=(rel["romantic_love"] or 0),
-                            platonic_like=(rel["platonic_like"] or 0),
-                            dislike=rel["dislike"] or 0,
-                            admiration=rel["admiration"] or 0,
-                            comfortable=rel["comfortable"] or 0,
-                            jealousy=rel["jealousy"] or 0,
-                            trust=rel["trust"] or 0,
-                            log=rel["log"],
-                        )
-                        self.relationships[rel["cat_to_id"]] = new_rel
+                        self.relationships.add_record(cat_to, rel)
+                self.relationships.dirty = False
             except:
                 print(
                     f"WARNING: There was an error reading the relationship file of cat #{self}."
@@ -3226,7 +3310,8 @@ class Cat:
 
     @staticmethod
     def load_faded_cat(cat: str):
-        """Loads a faded cat, returning the cat object. This object is saved nowhere else."""
+        """Loads a faded cat, returning the cat object. The object is kept by the faded archive, so the next time
+        the cat is asked for the same object is returned."""
 
         # just preventing any attempts to load something that isn't a cat ID
         if not cat.isdigit():
@@ -3239,63 +3324,46 @@ class Cat:
                 if game.clan is None
                 else game.clan.name
             )
-
-            with open(
-                get_save_dir() + "/" + clan + "/faded_cats/" + cat + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
-                # If loading cats is attempted before the Clan is loaded, we would need to use this.
-
         except (
             AttributeError
         ):  # NOPE, cats are always loaded before the Clan, so doesn't make sense to throw an error
-            with open(
-                get_save_dir()
-                + "/"
-                + switch_get_value(Switch.clan_list)[0]
-                + "/faded_cats/"
-                + cat
-                + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
-        except:
-            print("ERROR: in loading faded cat")
+            clan = switch_get_value(Switch.clan_list)[0]
+
+        record = faded_archive.get(clan, cat)
+        if record is None:
             return False
+        if cat in faded_archive.cats:
+            return faded_archive.cats[cat]
 
-        if isinstance(cat_info["status"], str):
-            status_dict = {"rank": cat_info["status"]}
+        if isinstance(record.status, str):
+            status_dict = {"rank": record.status}
         else:
-            status_dict = cat_info["status"]
+            status_dict = dict(record.status)
 
         cat_ob = Cat(
-            ID=cat_info["ID"],
-            prefix=cat_info["name_prefix"],
-            suffix=cat_info["name_suffix"],
+            ID=record.ID,
+            prefix=record.name_prefix,
+            suffix=record.name_suffix,
             status_dict=status_dict,
-            moons=cat_info["moons"],
+            moons=record.moons,
             faded=True,
         )
-        if cat_info["parent1"]:
-            cat_ob.parent1 = cat_info["parent1"]
-        if cat_info["parent2"]:
-            cat_ob.parent2 = cat_info["parent2"]
-        cat_ob.faded_offspring = cat_info["faded_offspring"]
-        cat_ob.adoptive_parents = (
-            cat_info["adoptive_parents"] if "adoptive_parents" in cat_info else []
-        )
+        if record.parent1:
+            cat_ob.parent1 = record.parent1
+        if record.parent2:
+            cat_ob.parent2 = record.parent2
+        cat_ob.faded_offspring = list(record.faded_offspring)
+        cat_ob.adoptive_parents = list(record.adoptive_parents)
         cat_ob.faded = True
 
-        if cat_info.get("df"):
+        if record.df:
             cat_ob.status.send_to_afterlife(target=CatGroup.DARK_FOREST)
-        elif isinstance(cat_info["status"], str):
+        elif isinstance(record.status, str):
             cat_ob.status.send_to_afterlife(target=CatGroup.STARCLAN)
 
-        cat_ob.dead_for = cat_info["dead_for"] if "dead_for" in cat_info else 1
+        cat_ob.dead_for = record.dead_for
 
+        faded_archive.cats[cat] = cat_ob
         return cat_ob
 
     # ---------------------------------------------------------------------------- #
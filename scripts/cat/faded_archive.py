@@ -0,0 +1,194 @@
+"""
+Archive of the faded cats of a Clan.
+
+A faded cat only keeps what is needed to work out the family of the cats still in the save: its name, status, age,
+parents and faded offspring. All faded cats of a Clan are kept as FadedCat records in one file, with one JSON record
+per line. The file is read the first time a faded cat is asked for, and after that the records are looked up in
+memory, so following a family through many faded generations doesn't open a file per cat.
+
+Saves made before the archive have a file per faded cat in the faded_cats folder. They are read in once, and the
+folder is replaced by the archive on the next save.
+"""
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+import ujson
+
+from scripts.game_structure.game.save_load import (
+    on_save_failure,
+    run_save_operation,
+    safe_save,
+    wait_for_background_saves,
+)
+from scripts.housekeeping.datadir import get_save_dir
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+FADED_CATS_FILE = "faded_cats.ndjson"
+"""Single faded cat file of a Clan, holding one JSON record per faded cat"""
+
+FADED_CATS_DIR = "faded_cats"
+"""Folder of the faded cats of older saves, holding a file per faded cat"""
+
+
+class FadedCat:
+    """The little that is kept of a faded cat"""
+
+    __slots__ = (
+        "ID",
+        "name_prefix",
+        "name_suffix",
+        "species",
+        "status",
+        "moons",
+        "dead_for",
+        "parent1",
+        "parent2",
+        "adoptive_parents",
+        "faded_offspring",
+        "df",
+    )
+
+    def __init__(self, cat_info: dict):
+        """
+        :param cat_info: the faded save dict of the cat, as made by Cat.get_save_dict(faded=True)
+        """
+        self.ID: str = cat_info["ID"]
+        self.name_prefix = cat_info["name_prefix"]
+        self.name_suffix = cat_info["name_suffix"]
+        self.species = cat_info.get("species")
+        # very old saves have the rank as the status
+        self.status = cat_info["status"]
+        self.moons = cat_info["moons"]
+        self.dead_for = cat_info.get("dead_for", 1)
+        self.parent1 = cat_info["parent1"]
+        self.parent2 = cat_info["parent2"]
+        self.adoptive_parents = cat_info.get("adoptive_parents", [])
+        self.faded_offspring = cat_info["faded_offspring"]
+        self.df = cat_info.get("df", False)
+
+    def to_dict(self) -> dict:
+        cat_info = {
+            "ID": self.ID,
+            "name_prefix": self.name_prefix,
+            "name_suffix": self.name_suffix,
+            "species": self.species,
+            "status": self.status,
+            "moons": self.moons,
+            "dead_for": self.dead_for,
+            "parent1": self.parent1,
+            "parent2": self.parent2,
+            "adoptive_parents": self.adoptive_parents,
+            "faded_offspring": self.faded_offspring,
+        }
+        if self.df:
+            cat_info["df"] = True
+        return cat_info
+
+
+class FadedArchive:
+    """The faded cats of the current Clan, read from its save once and kept in memory"""
+
+    def __init__(self):
+        self.clan_name: Optional[str] = None
+        self.records: Dict[str, FadedCat] = {}
+        # Cat objects already made from the records
+        self.cats: Dict[str, "Cat"] = {}
+        # if the archive has changes the save doesn't have yet
+        self.dirty = False
+
+    def reset(self):
+        """Forget the archive, so it's read again the next time a faded cat is asked for"""
+        self.clan_name = None
+        self.records = {}
+        self.cats = {}
+        self.dirty = False
+
+    def load(self, clan_name: str):
+        """Read the faded cats of the Clan, unless they are read already"""
+        if self.clan_name == clan_name:
+            return
+        self.reset()
+        self.clan_name = clan_name
+
+        directory = Path(get_save_dir()) / clan_name
+        archive_file = directory / FADED_CATS_FILE
+        # the archive may still be written by a background save
+        wait_for_background_saves()
+
+        if archive_file.exists():
+            with open(archive_file, "r", encoding="utf-8") as read_file:
+                for line_number, line in enumerate(read_file, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = FadedCat(ujson.loads(line))
+                    except (ujson.JSONDecodeError, KeyError, TypeError):
+                        print(
+                            f"WARNING: Line {line_number} of {archive_file} is malformed and was skipped."
+                        )
+                        continue
+                    self.records[record.ID] = record
+            return
+
+        faded_dir = directory / FADED_CATS_DIR
+        if not faded_dir.exists():
+            return
+        for cat_file in faded_dir.glob("*.json"):
+            try:
+                with open(cat_file, "r", encoding="utf-8") as read_file:
+                    record = FadedCat(ujson.loads(read_file.read()))
+            except (ujson.JSONDecodeError, KeyError, TypeError):
+                print(f"ERROR: loading faded cat {cat_file}")
+                continue
+            self.records[record.ID] = record
+        # write the archive in place of the folder on the next save
+        self.dirty = bool(self.records)
+
+    def get(self, clan_name: str, cat_id: str) -> Optional[FadedCat]:
+        """Get the record of a faded cat of the Clan, or None if the Clan has no such faded cat"""
+        self.load(clan_name)
+        return self.records.get(cat_id)
+
+    def add(self, clan_name: str, cat: "Cat"):
+        """Add a cat that has just faded to the archive"""
+        self.load(clan_name)
+        self.records[cat.ID] = FadedCat(cat.get_save_dict(faded=True))
+        self.cats.pop(cat.ID, None)
+        self.dirty = True
+
+    def add_faded_offspring(self, clan_name: str, parent: str, offspring: str) -> bool:
+        """
+        Add a faded offspring to a faded parent.
+        :return: False if the parent isn't in the archive
+        """
+        record = self.get(clan_name, parent)
+        if record is None:
+            return False
+        record.faded_offspring.append(offspring)
+        self.cats.pop(parent, None)
+        self.dirty = True
+        return True
+
+    def save(self, clan_name: str):
+        """Write the archive to the Clan's save if it changed, replacing the faded cat folder of older saves"""
+        if self.clan_name != clan_name or not self.dirty:
+            return
+        directory = Path(get_save_dir()) / clan_name
+        lines = [
+            ujson.dumps(record.to_dict()) + "\n" for record in self.records.values()
+        ]
+        # a failed save leaves the old file intact
+        safe_save(directory / FADED_CATS_FILE, "".join(lines), atomic=True)
+        self.dirty = False
+        on_save_failure(setattr, self, "dirty", True)
+
+        faded_dir = directory / FADED_CATS_DIR
+        if faded_dir.exists():
+            run_save_operation(shutil.rmtree, faded_dir, True)
+
+
+faded_archive = FadedArchive()
@@ -35,6 +35,8 @@ class History:
         self.scar_events = scar_events if scar_events else []
         self.murder = murder if murder else {}
         self.cat = cat
+        # set by every change, so only changed histories are written on save
+        self.dirty = False
 
         # fix 'old' history save bugs
         if self.mentor_influence["trait"] is None:
@@ -168,6 +170,7 @@ class History:
         if not game.clan:
             return
 
+        self.dirty = True
         self.beginning = {
             "clan_born": clan_born,
             "birth_season": game.clan.current_season if clan_born else None,
@@ -182,6 +185,7 @@ class History:
 
         if not self.mentor_influence["trait"]:
             return
+        self.dirty = True
 
         if (
             "Benevolent" or "Abrasive" or "Reserved" or "Outgoing"
@@ -264,6 +268,7 @@ class History:
 
         if not self.mentor_influence["skill"]:
             return
+        self.dirty = True
 
         # working under the impression that these blurbs will be preceded by "become better at"
         skill_influence_text = {
@@ -308,6 +313,7 @@ class History:
 
     def add_facet_mentor_influence(self, mentor_id, facet, amount):
         """Adds the history information for a single mentor facet change, that occurs after a patrol."""
+        self.dirty = True
 
         if mentor_id not in self.mentor_influence["trait"]:
             self.mentor_influence["trait"][mentor_id] = {}
@@ -317,6 +323,7 @@ class History:
 
     def add_skill_mentor_influence(self, mentor_id, path, amount):
         """Adds mentor influence on skills."""
+        self.dirty = True
 
         if not isinstance(path, SkillPath):
             path = SkillPath[path]
@@ -335,6 +342,7 @@ class History:
         if not game.clan:
             return
 
+        self.dirty = True
         self.app_ceremony = {
             "honor": honor,
             "graduation_age": self.cat.moons,
@@ -355,6 +363,7 @@ class History:
         :param scar_text: text for scar history
         :param other_cat: cat object of other cat involved.
         """
+        self.dirty = True
 
         # If the condition already exists, we don't want to overwrite it
         if condition in self.possible_history:
@@ -388,6 +397,7 @@ class History:
 
         if condition in self.possible_history:
             self.possible_history.pop(condition)
+            self.dirty = True
 
     def add_death(self, death_text, condition=None, other_cat=None):
         """Adds death to cat's history. If a condition is passed, it will look into
@@ -398,6 +408,7 @@ class History:
         if not game.clan:
             return
 
+        self.dirty = True
         if other_cat is not None:
             other_cat = other_cat.ID
         if condition in self.possible_history:
@@ -414,6 +425,7 @@ class History:
         if not game.clan:
             return
 
+        self.dirty = True
         if other_cat is not None:
             other_cat = other_cat.ID
         if condition in self.possible_history:
@@ -435,6 +447,8 @@ class History:
         """
         if not game.clan:
             return
+        self.dirty = True
+        victim.history.dirty = True
         if "is_murderer" not in self.murder:
             self.murder["is_murderer"] = []
         if "is_victim" not in victim.history.murder:
@@ -475,6 +489,8 @@ class History:
         """
         if aware_individuals is None:
             aware_individuals = []
+        self.dirty = True
+        victim.history.dirty = True
 
         for murder in self.murder["is_murderer"]:
             if murder["victim"] == victim.ID:
@@ -516,6 +532,7 @@ class History:
         """
 
         self.lead_ceremony = self.cat.generate_lead_ceremony()
+        self.dirty = True
 
     # ---------------------------------------------------------------------------- #
     #                                 retrieving                                   #
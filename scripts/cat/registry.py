@@ -0,0 +1,218 @@
+"""
+The registry behind Cat.all_cats.
+
+It is a dict of cat ID to Cat like any other, but it also keeps every cat filed by their current
+group, rank and age. Status and Cat report every change to those through CatRegistry.refile, so
+finding e.g. all living Clan cats or all medicine cats only looks at the cats that match, instead
+of going through every cat that ever lived.
+
+The cats are also filed in mate pools, by what Cat.is_potential_mate needs to be the same for two
+cats or rules out on its own: being dead, being an outsider, age and the no_mates toggle. Looking
+for possible mates of a cat only goes through the pools that could hold one.
+"""
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from scripts.cat.enums import CatAge, CatGroup, CatRank
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+AFTERLIFE_GROUPS = (CatGroup.STARCLAN, CatGroup.DARK_FOREST, CatGroup.UNKNOWN_RESIDENCE)
+OUTSIDER_RANKS = (CatRank.LONER, CatRank.ROGUE, CatRank.KITTYPET)
+
+
+class CatRegistry(dict):
+    """
+    Dict of cat ID to Cat, which keeps the cats indexed by group, rank and age.
+    All the query methods return new lists, so they are safe to change or to loop over while cats
+    are being changed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._by_group: Dict[Optional[CatGroup], Dict[str, "Cat"]] = defaultdict(dict)
+        self._by_rank: Dict[CatRank, Dict[str, "Cat"]] = defaultdict(dict)
+        self._by_age: Dict[Optional[CatAge], Dict[str, "Cat"]] = defaultdict(dict)
+        self._mate_pools: Dict[Tuple, Dict[str, "Cat"]] = defaultdict(dict)
+        self._filed_under: Dict[str, Tuple] = {}
+
+    # ---------------------------------------------------------------------------- #
+    #                                   indexing                                   #
+    # ---------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _index_key(cat: "Cat") -> Tuple:
+        status = cat.status
+        return status.group, status.rank, cat.age, cat.no_mates
+
+    @staticmethod
+    def _mate_pool_key(cat: "Cat", age: Optional[CatAge], no_mates: bool) -> Tuple:
+        # dead is kept as is, as is_potential_mate compares it as is: outsiders have no group, so it's None for them
+        return cat.dead, cat.status.is_outsider, age, no_mates
+
+    def _file(self, cat: "Cat"):
+        group, rank, age, no_mates = key = self._index_key(cat)
+        self._by_group[group][cat.ID] = cat
+        self._by_rank[rank][cat.ID] = cat
+        self._by_age[age][cat.ID] = cat
+        mate_pool_key = self._mate_pool_key(cat, age, no_mates)
+        self._mate_pools[mate_pool_key][cat.ID] = cat
+        self._filed_under[cat.ID] = key + (mate_pool_key,)
+
+    def _unfile(self, cat_id: str):
+        key = self._filed_under.pop(cat_id, None)
+        if key is None:
+            return
+        group, rank, age, _, mate_pool_key = key
+        self._by_group[group].pop(cat_id, None)
+        self._by_rank[rank].pop(cat_id, None)
+        self._by_age[age].pop(cat_id, None)
+        self._mate_pools[mate_pool_key].pop(cat_id, None)
+
+    def refile(self, cat: "Cat"):
+        """Move the cat to the right indexes after their group, rank, age or no_mates toggle changed"""
+        if self.get(getattr(cat, "ID", None)) is not cat:
+            # not registered (yet), e.g. a cat that is still being created and has no ID yet
+            return
+        if self._filed_under.get(cat.ID, ())[:4] == self._index_key(cat):
+            return
+        self._unfile(cat.ID)
+        self._file(cat)
+
+    # ---------------------------------------------------------------------------- #
+    #                                dict interface                                #
+    # ---------------------------------------------------------------------------- #
+
+    def __setitem__(self, cat_id: str, cat: "Cat"):
+        self._unfile(cat_id)
+        super().__setitem__(cat_id, cat)
+        self._file(cat)
+
+    def __delitem__(self, cat_id: str):
+        super().__delitem__(cat_id)
+        self._unfile(cat_id)
+
+    def pop(self, cat_id: str, *default):
+        self._unfile(cat_id)
+        return super().pop(cat_id, *default)
+
+    def popitem(self):
+        cat_id, cat = super().popitem()
+        self._unfile(cat_id)
+        return cat_id, cat
+
+    def setdefault(self, cat_id: str, default=None):
+        if cat_id not in self:
+            self[cat_id] = default
+        return self[cat_id]
+
+    def update(self, *args, **kwargs):
+        for cat_id, cat in dict(*args, **kwargs).items():
+            self[cat_id] = cat
+
+    def clear(self):
+        super().clear()
+        self._by_group.clear()
+        self._by_rank.clear()
+        self._by_age.clear()
+        self._mate_pools.clear()
+        self._filed_under.clear()
+
+    # ---------------------------------------------------------------------------- #
+    #                                    queries                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def in_group(self, group: Optional[CatGroup]) -> List["Cat"]:
+        """All cats currently in the group. Living outsiders have no group (None)."""
+        return list(self._by_group.get(group, {}).values())
+
+    def count_in_group(self, group: Optional[CatGroup]) -> int:
+        return len(self._by_group.get(group, ()))
+
+    def living_clan_cats(self) -> List["Cat"]:
+        """All cats alive in the player Clan, the same as filtering on status.alive_in_player_clan"""
+        return self.in_group(CatGroup.PLAYER_CLAN)
+
+    def afterlife_cats(self) -> List["Cat"]:
+        """All dead cats, from every afterlife"""
+        cats = []
+        for group in AFTERLIFE_GROUPS:
+            cats.extend(self._by_group.get(group, {}).values())
+        return cats
+
+    def outsiders(self, include_dead=False) -> List["Cat"]:
+        """All cats who aren't Clan cats: loners, rogues and kittypets"""
+        cats = self.with_rank(OUTSIDER_RANKS)
+        if include_dead:
+            return cats
+        return [cat for cat in cats if not cat.dead]
+
+    def with_rank(
+        self, ranks: Iterable[CatRank], group: Optional[CatGroup] = ...
+    ) -> List["Cat"]:
+        """
+        All cats holding one of the ranks.
+        :param ranks: the ranks to look for
+        :param group: only include cats of this group, leave out to include cats of every group
+        """
+        cats = []
+        for rank in dict.fromkeys(ranks):
+            rank_index = self._by_rank.get(rank)
+            if not rank_index:
+                continue
+            if group is ...:
+                cats.extend(rank_index.values())
+            else:
+                cats.extend(
+                    cat for cat in rank_index.values() if cat.status.group == group
+                )
+        return cats
+
+    def of_age(
+        self, ages: Iterable[CatAge], group: Optional[CatGroup] = ...
+    ) -> List["Cat"]:
+        """
+        All cats of one of the ages.
+        :param ages: the ages to look for
+        :param group: only include cats of this group, leave out to include cats of every group
+        """
+        cats = []
+        for age in dict.fromkeys(ages):
+            age_index = self._by_age.get(age)
+            if not age_index:
+                continue
+            if group is ...:
+                cats.extend(age_index.values())
+            else:
+                cats.extend(
+                    cat for cat in age_index.values() if cat.status.group == group
+                )
+        return cats
+
+    def mate_candidates(self, cat: "Cat", ignore_no_mates=False) -> List["Cat"]:
+        """
+        The cats who could be a mate of the cat: as dead and as much of an outsider as the cat, of an age that can
+        be a mate of the cat's age, and without no_mates set. This only narrows the cats down, the rest of
+        is_potential_mate (kinship, moons, mentors) still has to be checked for each of them.
+        :param ignore_no_mates: also include cats with no_mates set, and look even if the cat has it set
+        """
+        if cat.no_mates and not ignore_no_mates:
+            return []
+        no_mates_toggles = (False, True) if ignore_no_mates else (False,)
+
+        cats = []
+        for age in CatAge:
+            # is_potential_mate only allows different ages if both can have a mate
+            if age != cat.age and not (age.can_have_mate() and cat.age.can_have_mate()):
+                continue
+            for no_mates in no_mates_toggles:
+                mate_pool = self._mate_pools.get(
+                    self._mate_pool_key(cat, age, no_mates)
+                )
+                if mate_pool:
+                    cats.extend(
+                        other for other in mate_pool.values() if other is not cat
+                    )
+        return cats
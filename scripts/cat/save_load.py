@@ -1,10 +1,21 @@
+import logging
 import os
+import shutil
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Type
 
 import ujson
 
-from scripts.game_structure.game.save_load import safe_save
+from scripts.cat.faded_archive import faded_archive
+from scripts.game_structure.game.save_load import (
+    background_save_running,
+    on_save_failure,
+    run_save_operation,
+    safe_remove,
+    safe_save,
+    wait_for_background_saves,
+)
 from scripts.game_structure.game.settings.settings import game_setting_get
 from scripts.housekeeping.datadir import get_save_dir
 
@@ -12,58 +23,217 @@ if TYPE_CHECKING:
     from scripts.cat.cats import Cat
     from scripts.game_structure.game_essentials import Game
 
+logger = logging.getLogger(__name__)
+
 faded_ids = []
 """List of IDs of faded cats"""
 
 cat_to_fade = []
 """Cats who have been faded since the last save"""
 
+RELATIONSHIP_FILE = "relationships.ndjson"
+"""Single relationship file of a Clan, holding one JSON record per relationship"""
+
+saved_relationship_cats = (None, frozenset())
+"""Clan name and IDs of the cats whose relationships are in the single relationship file"""
+
 
 def save_cats(clanname, cat_class: Type["Cat"], game: "Game"):
-    """Save the cat data."""
+    """Save the cat data. Condition, history and relationship files are only
+    rewritten for cats who changed since the last save."""
 
+    start_time = time.perf_counter()
     directory = Path(get_save_dir()) / clanname
     history_dir = directory / "history"
-    relationships_dir = directory / "relationships"
 
     if not directory.exists():
         directory.mkdir(parents=True)
 
-    # Delete all existing relationship files
-    if not relationships_dir.exists():
-        relationships_dir.mkdir()
-    for f in relationships_dir.glob("*.json"):
-        f.unlink()
-
     save_faded_cats(clanname, cat_class, game)  # Fades cat and saves them, if needed
 
+    # a history is only dumped once it's on disk, and a failed save has marked it dirty again
+    dump_histories = not background_save_running()
+
     clan_cats = []
+    conditions_saved = 0
+    histories_saved = 0
     for inter_cat in cat_class.all_cats.values():
         cat_data = inter_cat.get_save_dict()
         clan_cats.append(cat_data)
 
-        inter_cat.save_condition()
+        if inter_cat.save_condition():
+            conditions_saved += 1
 
-        if inter_cat.history:
+        if inter_cat.history_changed:
             inter_cat.save_history(history_dir)
-            # after saving, dump the history info
+            histories_saved += 1
+        elif dump_histories:
+            # the history is saved, dump it until it's needed again
             inter_cat.history = None
-        if not inter_cat.dead:
-            inter_cat.save_relationship_of_cat(relationships_dir)
+
+    relationships_saved = save_relationships(clanname, cat_class)
 
     safe_save(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
 
+    logger.debug(
+        "Saved %d cats in %.3fs (%d condition, %d history and %d relationship files written)",
+        len(clan_cats),
+        time.perf_counter() - start_time,
+        conditions_saved,
+        histories_saved,
+        relationships_saved,
+    )
+
+
+def save_relationships(clanname, cat_class: Type["Cat"]) -> int:
+    """
+    Save the relationships of all living cats. With the "single relationship file" setting they
+    are written to one file, otherwise every cat gets its own file in the relationships folder.
+    The other layout is removed, so switching the setting converts the save on the next save.
+    :return: the number of files written
+    """
+    global saved_relationship_cats
+
+    directory = Path(get_save_dir()) / clanname
+    relationships_dir = directory / "relationships"
+    relationship_file = directory / RELATIONSHIP_FILE
+    living_cats = [
+        inter_cat for inter_cat in cat_class.all_cats.values() if not inter_cat.dead
+    ]
+
+    if game_setting_get("single relationship file"):
+        files_saved = 0
+        living_ids = frozenset(inter_cat.ID for inter_cat in living_cats)
+        if (
+            not relationship_file.exists()
+            or saved_relationship_cats != (clanname, living_ids)
+            or any(inter_cat.relationships.dirty for inter_cat in living_cats)
+        ):
+            lines = [
+                ujson.dumps(record) + "\n"
+                for inter_cat in living_cats
+                for record in inter_cat.relationships.records()
+            ]
+            # a failed save leaves the old file intact
+            safe_save(relationship_file, "".join(lines), atomic=True)
+            files_saved = 1
+
+            for inter_cat in living_cats:
+                inter_cat.relationships.dirty = False
+            saved_relationship_cats = (clanname, living_ids)
+            on_save_failure(_relationship_file_not_saved, living_cats)
+
+        if relationships_dir.exists():
+            run_save_operation(shutil.rmtree, relationships_dir, True)
+        return files_saved
+
+    # the files can't be trusted if the Clan was just using the single file
+    switching_layout = (
+        saved_relationship_cats[0] is not None or relationship_file.exists()
+    )
+    saved_relationship_cats = (None, frozenset())
+
+    # the single file would be preferred when loading, so it has to go first
+    if relationship_file.exists():
+        safe_remove(relationship_file)
+
+    if not relationships_dir.exists():
+        relationships_dir.mkdir()
+    old_files = {f.name: f for f in relationships_dir.glob("*.json")}
+    if switching_layout:
+        old_files_to_keep = {}
+    else:
+        old_files_to_keep = old_files
+
+    files_saved = 0
+    for inter_cat in living_cats:
+        file_name = f"{inter_cat.ID}_relations.json"
+        if inter_cat.relationships.dirty or file_name not in old_files_to_keep:
+            inter_cat.save_relationship_of_cat(relationships_dir)
+            inter_cat.relationships.dirty = False
+            on_save_failure(setattr, inter_cat.relationships, "dirty", True)
+            files_saved += 1
+        old_files.pop(file_name, None)
+
+    # Delete the files of cats who died or faded
+    for f in old_files.values():
+        safe_remove(f)
+
+    return files_saved
+
+
+def _relationship_file_not_saved(living_cats):
+    """The single relationship file couldn't be written, so it's written again on the next save"""
+    global saved_relationship_cats
+
+    saved_relationship_cats = (None, frozenset())
+    for inter_cat in living_cats:
+        inter_cat.relationships.dirty = True
+
+
+def load_relationships(clanname, cat_class: Type["Cat"]) -> bool:
+    """
+    Load the relationships of all living cats from the single relationship file, one line at a time.
+    :return: False if the Clan has no single relationship file. The relationships then have to be
+        loaded per cat, with Cat.load_relationship_of_cat.
+    """
+    global saved_relationship_cats
+
+    relationship_file = Path(get_save_dir()) / clanname / RELATIONSHIP_FILE
+    if not relationship_file.exists():
+        return False
+
+    all_cats = cat_class.all_cats
+    for inter_cat in all_cats.values():
+        inter_cat.relationships = {}
+    cats_with_records = set()
+
+    with open(relationship_file, "r", encoding="utf-8") as read_file:
+        for line_number, line in enumerate(read_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                rel = ujson.loads(line)
+            except ujson.JSONDecodeError:
+                print(
+                    f"WARNING: Line {line_number} of {relationship_file} is malformed and was skipped."
+                )
+                continue
+
+            cat_from = all_cats.get(rel.get("cat_from_id"))
+            cat_to = all_cats.get(rel.get("cat_to_id"))
+            if cat_from is None or cat_to is None or cat_from is cat_to:
+                continue
+            if cat_from.dead:
+                continue
+            cat_from.relationships.add_record(cat_to, rel)
+            cats_with_records.add(cat_from.ID)
+
+    living_cats = []
+    for inter_cat in all_cats.values():
+        inter_cat.relationships.dirty = False
+        if not inter_cat.dead:
+            living_cats.append(inter_cat)
+    saved_relationship_cats = (
+        clanname,
+        frozenset(inter_cat.ID for inter_cat in living_cats),
+    )
+
+    # like a missing per-cat file, a cat without records gets new relationships both ways
+    for inter_cat in living_cats:
+        if inter_cat.ID in cats_with_records:
+            continue
+        inter_cat.init_all_relationships()
+        for other_cat in living_cats:
+            if other_cat is not inter_cat:
+                other_cat.create_one_relationship(inter_cat)
+    return True
+
 
 def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
     """Deals with fades cats, if needed, adding them as faded"""
     global cat_to_fade
 
-    fade_cat_dir = Path(get_save_dir()) / clanname / "faded_cats"
-
-    if cat_to_fade:
-        if not fade_cat_dir.exists():
-            fade_cat_dir.mkdir()
-
     copy_of_info = ""
     for cat in cat_to_fade:
         inter_cat = cat_class.all_cats[cat]
@@ -84,7 +254,7 @@ def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
             else:
                 parent_faded = add_faded_offspring_to_faded_cat(clanname, x, cat)
                 if not parent_faded:
-                    print(f"WARNING: Can't find parent {x} of {cat.name}")
+                    print(f"WARNING: Can't find parent {x} of {inter_cat.name}")
 
         # Get a copy of info
         if game_setting_get("save_faded_copy"):
@@ -93,10 +263,8 @@ def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
                 + "\n--------------------------------------------------------------------------\n"
             )
 
-        # SAVE TO ITS OWN LITTLE FILE. This is a trimmed-down version for relation keeping only.
-        cat_data = inter_cat.get_save_dict(faded=True)
-        cat_path = fade_cat_dir / f"{cat}.json"
-        safe_save(cat_path, cat_data)
+        # ADD TO THE FADED ARCHIVE. This is a trimmed-down version for relation keeping only.
+        faded_archive.add(clanname, inter_cat)
 
         # Remove the cat from the active cats lists
         game.clan.remove_cat(
@@ -104,6 +272,7 @@ def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
         )  # todo: when catdirectory is added, this dependency injection can be removed
 
     cat_to_fade = []
+    faded_archive.save(clanname)
 
     # Save the copies, flush the file.
     if game_setting_get("save_faded_copy"):
@@ -132,27 +301,11 @@ def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
 
 def add_faded_offspring_to_faded_cat(clanname, parent: str, offspring: str):
     """In order to siblings to work correctly, and not to lose relation info on fading, we have to keep track of
-    both active and faded cat's faded offpsring. This will add a faded offspring to a faded parents file.
+    both active and faded cat's faded offpsring. This will add a faded offspring to a faded parent in the faded
+    archive, which is saved with the rest of the faded cats.
     """
-    faded_parent_path = (
-        Path(get_save_dir()) / clanname / "faded_cats" / (parent + ".json")
-    )
-    try:
-        with open(
-            faded_parent_path,
-            "r",
-            encoding="utf-8",
-        ) as read_file:
-            cat_info = ujson.loads(read_file.read())
-    except IOError:
-        print("ERROR loading faded cat (file read error)")
+    if not faded_archive.add_faded_offspring(clanname, parent, offspring):
+        print("ERROR: loading faded cat (not in the faded archive)")
         return False
-    except ujson.JSONDecodeError:
-        print("ERROR: loading faded cat (invalid JSON)")
-        return False
-
-    cat_info["faded_offspring"].append(offspring)
-
-    safe_save(faded_parent_path, cat_info)
 
     return True
@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+from collections import OrderedDict
 from copy import copy
 
 import pygame
@@ -13,6 +15,50 @@ from scripts.special_dates import SpecialDate, is_today
 logger = logging.getLogger(__name__)
 
 
+class SpriteCache:
+    """Bounded LRU cache of finished cat sprites, or of the masks made from them, keyed by a hashable key.
+    Cached surfaces and masks are shared between every cat that looks the same, so they must not be drawn on.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached surface for key, or None if there isn't one"""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self._surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, key, surface):
+        self._surfaces[key] = surface
+        self._surfaces.move_to_end(key)
+        while len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
 class Sprites:
     cat_tints = {}
     white_patches_tints = {}
@@ -32,6 +78,16 @@ class Sprites:
         # Shared empty sprite for placeholders
         self.blank_sprite = None
 
+        # Finished cat sprites, see utility.generate_sprite
+        self.cat_sprite_cache = SpriteCache()
+        # Clickable masks of the finished sprites by sprite and size, see utility.update_mask
+        self.cat_mask_cache = SpriteCache()
+
+        self.loaded = False
+        # species folders whose sheets have been sliced into self.sprites
+        self.loaded_folders = set()
+        self._species_lock = threading.Lock()
+
         self.load_tints()
 
     def load_tints(self):
@@ -105,10 +161,23 @@ class Sprites:
                 self.sprites[full_name] = new_sprite
                 i += 1
 
-    def load_all(self):
+    def load_all(self, force=False):
+        """
+        Load the spritesheets shared by all species, plus the sheets for every species folder
+        unless lazy species loading is turned on in the game config.
+        :param force: reload even if the sheets were loaded before. Otherwise, repeated calls do nothing.
+        """
+        if self.loaded and not force:
+            return
         if not game.sprite_folders:
             raise Exception("[SPS] Cannot find sprite folders or none exist")
 
+        # anything composed from the old sheets is stale now
+        self.cat_sprite_cache.clear()
+        self.cat_mask_cache.clear()
+        self.loaded_folders.clear()
+        self.clan_symbols = []
+
         lineart = pygame.image.load('sprites/1/lineart.png')
 
         # get the width and height of the spritesheet
@@ -133,357 +202,386 @@ class Sprites:
 
         del width, height  # unneeded
 
-        # load sprite sheets for all folders
-        for f in game.sprite_folders:
-            for x in [
-                "lineart",
-                "lineartdf",
-                "lineartdead",
-                "eyes",
-                "eyes2",
-                "skin",
-                "scars",
-                "missingscars",
-                "medcatherbs",
-                "wild",
-                "collars",
-                "bellcollars",
-                "bowcollars",
-                "nyloncollars",
-                "singlecolours",
-                "speckledcolours",
-                "tabbycolours",
-                "bengalcolours",
-                "marbledcolours",
-                "rosettecolours",
-                "smokecolours",
-                "tickedcolours",
-                "mackerelcolours",
-                "classiccolours",
-                "sokokecolours",
-                "agouticolours",
-                "singlestripecolours",
-                "maskedcolours",
-                "shadersnewwhite",
-                "lightingnew",
-                "whitepatches",
-                "tortiepatchesmasks",
-                "fademask",
-                "fadestarclan",
-                "fadedarkforest",
-                "symbols",
-            ]:
-                if "lineart" in x and (
-                    constants.CONFIG["fun"]["april_fools"]
-                    or is_today(SpecialDate.APRIL_FOOLS)
-                ):
-                    self.spritesheet(f"sprites/{f}/aprilfools{x}.png", x)
-                elif 'symbols' in x:
-                    self.spritesheet(f"sprites/{x}.png", x)
-                else:
-                    self.spritesheet(f"sprites/{f}/{x}.png", x)
-
-            # Line art
-            self.make_group("lineart", (0, 0), f"lines{f}_")
-            self.make_group("shadersnewwhite", (0, 0), f"shaders{f}_")
-            self.make_group("lightingnew", (0, 0), f"lighting{f}_")
+        self.spritesheet("sprites/symbols.png", "symbols")
+        self.load_symbols()
 
-            self.make_group("lineartdead", (0, 0), f"lineartdead{f}_")
-            self.make_group("lineartdf", (0, 0), f"lineartdf{f}_")
+        if not constants.CONFIG["cat_sprites"]["lazy_species_loading"]:
+            for f in game.sprite_folders:
+                self.load_species(f)
 
-            # Fading Fog
-            for i in range(0, 3):
-                self.make_group("fademask", (i, 0), f"fademask{f}_{i}")
-                self.make_group("fadestarclan", (i, 0), f"fadestarclan{f}_{i}")
-                self.make_group("fadedarkforest", (i, 0), f"fadedf{f}_{i}")
+        self.loaded = True
 
-            # Define eye colors
-            eye_colors = [
-                [
-                    "YELLOW",
-                    "AMBER",
-                    "HAZEL",
-                    "PALEGREEN",
-                    "GREEN",
-                    "BLUE",
-                    "DARKBLUE",
-                    "GREY",
-                    "CYAN",
-                    "EMERALD",
-                    "HEATHERBLUE",
-                    "SUNLITICE",
-                ],
-                [
-                    "COPPER",
-                    "SAGE",
-                    "COBALT",
-                    "PALEBLUE",
-                    "BRONZE",
-                    "SILVER",
-                    "PALEYELLOW",
-                    "GOLD",
-                    "GREENYELLOW",
-                    "ORANGE",
-                ],
-            ]
+    def ensure_species_loaded(self, folder):
+        """
+        Make sure the spritesheets for a species folder are sliced into self.sprites,
+        loading them now if this is the first time that species has been drawn.
+        :param folder: the species' sprite folder, the species' index in the species list plus one
+        """
+        folder = str(folder)
+        if folder in self.loaded_folders:
+            return
+        with self._species_lock:
+            # another thread might have gotten here first
+            if folder not in self.loaded_folders:
+                self.load_species(folder)
+
+    def load_species(self, f):
+        """
+        Load and slice every spritesheet from a single species folder.
+        :param f: the name of the folder inside sprites/
+        :raises FileNotFoundError: if the folder or one of its spritesheets is missing
+        :raises pygame.error: if a spritesheet can't be read
+        """
+        f = str(f)
+        if f not in game.sprite_folders:
+            raise FileNotFoundError(f"[SPS] Sprite folder {f} does not exist")
+
+        for x in [
+            "lineart",
+            "lineartdf",
+            "lineartdead",
+            "eyes",
+            "eyes2",
+            "skin",
+            "scars",
+            "missingscars",
+            "medcatherbs",
+            "wild",
+            "collars",
+            "bellcollars",
+            "bowcollars",
+            "nyloncollars",
+            "singlecolours",
+            "speckledcolours",
+            "tabbycolours",
+            "bengalcolours",
+            "marbledcolours",
+            "rosettecolours",
+            "smokecolours",
+            "tickedcolours",
+            "mackerelcolours",
+            "classiccolours",
+            "sokokecolours",
+            "agouticolours",
+            "singlestripecolours",
+            "maskedcolours",
+            "shadersnewwhite",
+            "lightingnew",
+            "whitepatches",
+            "tortiepatchesmasks",
+            "fademask",
+            "fadestarclan",
+            "fadedarkforest",
+        ]:
+            if "lineart" in x and (
+                constants.CONFIG["fun"]["april_fools"]
+                or is_today(SpecialDate.APRIL_FOOLS)
+            ):
+                self.spritesheet(f"sprites/{f}/aprilfools{x}.png", x)
+            else:
+                self.spritesheet(f"sprites/{f}/{x}.png", x)
+
+        # Line art
+        self.make_group("lineart", (0, 0), f"lines{f}_")
+        self.make_group("shadersnewwhite", (0, 0), f"shaders{f}_")
+        self.make_group("lightingnew", (0, 0), f"lighting{f}_")
+
+        self.make_group("lineartdead", (0, 0), f"lineartdead{f}_")
+        self.make_group("lineartdf", (0, 0), f"lineartdf{f}_")
+
+        # Fading Fog
+        for i in range(0, 3):
+            self.make_group("fademask", (i, 0), f"fademask{f}_{i}")
+            self.make_group("fadestarclan", (i, 0), f"fadestarclan{f}_{i}")
+            self.make_group("fadedarkforest", (i, 0), f"fadedf{f}_{i}")
+
+        # Define eye colors
+        eye_colors = [
+            [
+                "YELLOW",
+                "AMBER",
+                "HAZEL",
+                "PALEGREEN",
+                "GREEN",
+                "BLUE",
+                "DARKBLUE",
+                "GREY",
+                "CYAN",
+                "EMERALD",
+                "HEATHERBLUE",
+                "SUNLITICE",
+            ],
+            [
+                "COPPER",
+                "SAGE",
+                "COBALT",
+                "PALEBLUE",
+                "BRONZE",
+                "SILVER",
+                "PALEYELLOW",
+                "GOLD",
+                "GREENYELLOW",
+                "ORANGE",
+            ],
+        ]
 
-            for row, colors in enumerate(eye_colors):
-                for col, color in enumerate(colors):
-                    self.make_group("eyes", (col, row), f"eyes{f}_{color}")
-                    self.make_group("eyes2", (col, row), f"eyes2{f}_{color}")
+        for row, colors in enumerate(eye_colors):
+            for col, color in enumerate(colors):
+                self.make_group("eyes", (col, row), f"eyes{f}_{color}")
+                self.make_group("eyes2", (col, row), f"eyes2{f}_{color}")
 
-            # Define white patches
-            white_patches = [
-                [
-                    "FULLWHITE",
-                    "ANY",
-                    "TUXEDO",
-                    "LITTLE",
-                    "COLOURPOINT",
-                    "VAN",
-                    "ANYTWO",
-                    "MOON",
-                    "PHANTOM",
-                    "POWDER",
-                    "BLEACHED",
-                    "SAVANNAH",
-                    "FADESPOTS",
-                    "PEBBLESHINE",
-                ],
-                [
-                    "EXTRA",
-                    "ONEEAR",
-                    "BROKEN",
-                    "LIGHTTUXEDO",
-                    "BUZZARDFANG",
-                    "RAGDOLL",
-                    "LIGHTSONG",
-                    "VITILIGO",
-                    "BLACKSTAR",
-                    "PIEBALD",
-                    "CURVED",
-                    "PETAL",
-                    "SHIBAINU",
-                    "OWL",
-                ],
-                [
-                    "TIP",
-                    "FANCY",
-                    "FRECKLES",
-                    "RINGTAIL",
-                    "HALFFACE",
-                    "PANTSTWO",
-                    "GOATEE",
-                    "VITILIGOTWO",
-                    "PAWS",
-                    "MITAINE",
-                    "BROKENBLAZE",
-                    "SCOURGE",
-                    "DIVA",
-                    "BEARD",
-                ],
-                [
-                    "TAIL",
-                    "BLAZE",
-                    "PRINCE",
-                    "BIB",
-                    "VEE",
-                    "UNDERS",
-                    "HONEY",
-                    "FAROFA",
-                    "DAMIEN",
-                    "MISTER",
-                    "BELLY",
-                    "TAILTIP",
-                    "TOES",
-                    "TOPCOVER",
-                ],
-                [
-                    "APRON",
-                    "CAPSADDLE",
-                    "MASKMANTLE",
-                    "SQUEAKS",
-                    "STAR",
-                    "TOESTAIL",
-                    "RAVENPAW",
-                    "PANTS",
-                    "REVERSEPANTS",
-                    "SKUNK",
-                    "KARPATI",
-                    "HALFWHITE",
-                    "APPALOOSA",
-                    "DAPPLEPAW",
-                ],
-                [
-                    "HEART",
-                    "LILTWO",
-                    "GLASS",
-                    "MOORISH",
-                    "SEPIAPOINT",
-                    "MINKPOINT",
-                    "SEALPOINT",
-                    "MAO",
-                    "LUNA",
-                    "CHESTSPECK",
-                    "WINGS",
-                    "PAINTED",
-                    "HEARTTWO",
-                    "WOODPECKER",
-                ],
-                [
-                    "BOOTS",
-                    "MISS",
-                    "COW",
-                    "COWTWO",
-                    "BUB",
-                    "BOWTIE",
-                    "MUSTACHE",
-                    "REVERSEHEART",
-                    "SPARROW",
-                    "VEST",
-                    "LOVEBUG",
-                    "TRIXIE",
-                    "SAMMY",
-                    "SPARKLE",
-                ],
-                [
-                    "RIGHTEAR",
-                    "LEFTEAR",
-                    "ESTRELLA",
-                    "SHOOTINGSTAR",
-                    "EYESPOT",
-                    "REVERSEEYE",
-                    "FADEBELLY",
-                    "FRONT",
-                    "BLOSSOMSTEP",
-                    "PEBBLE",
-                    "TAILTWO",
-                    "BUDDY",
-                    "BACKSPOT",
-                    "EYEBAGS",
-                ],
-                [
-                    "BULLSEYE",
-                    "FINN",
-                    "DIGIT",
-                    "KROPKA",
-                    "FCTWO",
-                    "FCONE",
-                    "MIA",
-                    "SCAR",
-                    "BUSTER",
-                    "SMOKEY",
-                    "HAWKBLAZE",
-                    "CAKE",
-                    "ROSINA",
-                    "PRINCESS",
-                ],
-                ["LOCKET", "BLAZEMASK", "TEARS", "DOUGIE"],
-            ]
+        # Define white patches
+        white_patches = [
+            [
+                "FULLWHITE",
+                "ANY",
+                "TUXEDO",
+                "LITTLE",
+                "COLOURPOINT",
+                "VAN",
+                "ANYTWO",
+                "MOON",
+                "PHANTOM",
+                "POWDER",
+                "BLEACHED",
+                "SAVANNAH",
+                "FADESPOTS",
+                "PEBBLESHINE",
+            ],
+            [
+                "EXTRA",
+                "ONEEAR",
+                "BROKEN",
+                "LIGHTTUXEDO",
+                "BUZZARDFANG",
+                "RAGDOLL",
+                "LIGHTSONG",
+                "VITILIGO",
+                "BLACKSTAR",
+                "PIEBALD",
+                "CURVED",
+                "PETAL",
+                "SHIBAINU",
+                "OWL",
+            ],
+            [
+                "TIP",
+                "FANCY",
+                "FRECKLES",
+                "RINGTAIL",
+                "HALFFACE",
+                "PANTSTWO",
+                "GOATEE",
+                "VITILIGOTWO",
+                "PAWS",
+                "MITAINE",
+                "BROKENBLAZE",
+                "SCOURGE",
+                "DIVA",
+                "BEARD",
+            ],
+            [
+                "TAIL",
+                "BLAZE",
+                "PRINCE",
+                "BIB",
+                "VEE",
+                "UNDERS",
+                "HONEY",
+                "FAROFA",
+                "DAMIEN",
+                "MISTER",
+                "BELLY",
+                "TAILTIP",
+                "TOES",
+                "TOPCOVER",
+            ],
+            [
+                "APRON",
+                "CAPSADDLE",
+                "MASKMANTLE",
+                "SQUEAKS",
+                "STAR",
+                "TOESTAIL",
+                "RAVENPAW",
+                "PANTS",
+                "REVERSEPANTS",
+                "SKUNK",
+                "KARPATI",
+                "HALFWHITE",
+                "APPALOOSA",
+                "DAPPLEPAW",
+            ],
+            [
+                "HEART",
+                "LILTWO",
+                "GLASS",
+                "MOORISH",
+                "SEPIAPOINT",
+                "MINKPOINT",
+                "SEALPOINT",
+                "MAO",
+                "LUNA",
+                "CHESTSPECK",
+                "WINGS",
+                "PAINTED",
+                "HEARTTWO",
+                "WOODPECKER",
+            ],
+            [
+                "BOOTS",
+                "MISS",
+                "COW",
+                "COWTWO",
+                "BUB",
+                "BOWTIE",
+                "MUSTACHE",
+                "REVERSEHEART",
+                "SPARROW",
+                "VEST",
+                "LOVEBUG",
+                "TRIXIE",
+                "SAMMY",
+                "SPARKLE",
+            ],
+            [
+                "RIGHTEAR",
+                "LEFTEAR",
+                "ESTRELLA",
+                "SHOOTINGSTAR",
+                "EYESPOT",
+                "REVERSEEYE",
+                "FADEBELLY",
+                "FRONT",
+                "BLOSSOMSTEP",
+                "PEBBLE",
+                "TAILTWO",
+                "BUDDY",
+                "BACKSPOT",
+                "EYEBAGS",
+            ],
+            [
+                "BULLSEYE",
+                "FINN",
+                "DIGIT",
+                "KROPKA",
+                "FCTWO",
+                "FCONE",
+                "MIA",
+                "SCAR",
+                "BUSTER",
+                "SMOKEY",
+                "HAWKBLAZE",
+                "CAKE",
+                "ROSINA",
+                "PRINCESS",
+            ],
+            ["LOCKET", "BLAZEMASK", "TEARS", "DOUGIE"],
+        ]
 
-            for row, patches in enumerate(white_patches):
-                for col, patch in enumerate(patches):
-                    self.make_group("whitepatches", (col, row), f"white{f}_{patch}")
+        for row, patches in enumerate(white_patches):
+            for col, patch in enumerate(patches):
+                self.make_group("whitepatches", (col, row), f"white{f}_{patch}")
 
-            # Define colors and categories
-            color_categories = [
-                ["WHITE", "PALEGREY", "SILVER", "GREY", "DARKGREY", "GHOST", "BLACK"],
-                ["CREAM", "PALEGINGER", "GOLDEN", "GINGER", "DARKGINGER", "SIENNA"],
-                ["LIGHTBROWN", "LILAC", "BROWN", "GOLDEN-BROWN", "DARKBROWN", "CHOCOLATE"],
-            ]
+        # Define colors and categories
+        color_categories = [
+            ["WHITE", "PALEGREY", "SILVER", "GREY", "DARKGREY", "GHOST", "BLACK"],
+            ["CREAM", "PALEGINGER", "GOLDEN", "GINGER", "DARKGINGER", "SIENNA"],
+            ["LIGHTBROWN", "LILAC", "BROWN", "GOLDEN-BROWN", "DARKBROWN", "CHOCOLATE"],
+        ]
 
-            color_types = [
-                "singlecolours",
-                "tabbycolours",
-                "marbledcolours",
-                "rosettecolours",
-                "smokecolours",
-                "tickedcolours",
-                "speckledcolours",
-                "bengalcolours",
-                "mackerelcolours",
-                "classiccolours",
-                "sokokecolours",
-                "agouticolours",
-                "singlestripecolours",
-                "maskedcolours",
-            ]
+        color_types = [
+            "singlecolours",
+            "tabbycolours",
+            "marbledcolours",
+            "rosettecolours",
+            "smokecolours",
+            "tickedcolours",
+            "speckledcolours",
+            "bengalcolours",
+            "mackerelcolours",
+            "classiccolours",
+            "sokokecolours",
+            "agouticolours",
+            "singlestripecolours",
+            "maskedcolours",
+        ]
 
-            for row, colors in enumerate(color_categories):
-                for col, color in enumerate(colors):
-                    for color_type in color_types:
-                        self.make_group(color_type, (col, row), f"{color_type[:-7]}{f}_{color}")
+        for row, colors in enumerate(color_categories):
+            for col, color in enumerate(colors):
+                for color_type in color_types:
+                    self.make_group(color_type, (col, row), f"{color_type[:-7]}{f}_{color}")
 
-            # tortiepatchesmasks
-            tortiepatchesmasks = [
-                [
-                    "ONE",
-                    "TWO",
-                    "THREE",
-                    "FOUR",
-                    "REDTAIL",
-                    "DELILAH",
-                    "HALF",
-                    "STREAK",
-                    "MASK",
-                    "SMOKE",
-                ],
-                [
-                    "MINIMALONE",
-                    "MINIMALTWO",
-                    "MINIMALTHREE",
-                    "MINIMALFOUR",
-                    "OREO",
-                    "SWOOP",
-                    "CHIMERA",
-                    "CHEST",
-                    "ARMTAIL",
-                    "GRUMPYFACE",
-                ],
-                [
-                    "MOTTLED",
-                    "SIDEMASK",
-                    "EYEDOT",
-                    "BANDANA",
-                    "PACMAN",
-                    "STREAMSTRIKE",
-                    "SMUDGED",
-                    "DAUB",
-                    "EMBER",
-                    "BRIE",
-                ],
-                [
-                    "ORIOLE",
-                    "ROBIN",
-                    "BRINDLE",
-                    "PAIGE",
-                    "ROSETAIL",
-                    "SAFI",
-                    "DAPPLENIGHT",
-                    "BLANKET",
-                    "BELOVED",
-                    "BODY",
-                ],
-                ["SHILOH", "FRECKLED", "HEARTBEAT"],
-            ]
+        # tortiepatchesmasks
+        tortiepatchesmasks = [
+            [
+                "ONE",
+                "TWO",
+                "THREE",
+                "FOUR",
+                "REDTAIL",
+                "DELILAH",
+                "HALF",
+                "STREAK",
+                "MASK",
+                "SMOKE",
+            ],
+            [
+                "MINIMALONE",
+                "MINIMALTWO",
+                "MINIMALTHREE",
+                "MINIMALFOUR",
+                "OREO",
+                "SWOOP",
+                "CHIMERA",
+                "CHEST",
+                "ARMTAIL",
+                "GRUMPYFACE",
+            ],
+            [
+                "MOTTLED",
+                "SIDEMASK",
+                "EYEDOT",
+                "BANDANA",
+                "PACMAN",
+                "STREAMSTRIKE",
+                "SMUDGED",
+                "DAUB",
+                "EMBER",
+                "BRIE",
+            ],
+            [
+                "ORIOLE",
+                "ROBIN",
+                "BRINDLE",
+                "PAIGE",
+                "ROSETAIL",
+                "SAFI",
+                "DAPPLENIGHT",
+                "BLANKET",
+                "BELOVED",
+                "BODY",
+            ],
+            ["SHILOH", "FRECKLED", "HEARTBEAT"],
+        ]
 
-            for row, masks in enumerate(tortiepatchesmasks):
-                for col, mask in enumerate(masks):
-                    self.make_group("tortiepatchesmasks", (col, row), f"tortiemask{f}_{mask}")
+        for row, masks in enumerate(tortiepatchesmasks):
+            for col, mask in enumerate(masks):
+                self.make_group("tortiepatchesmasks", (col, row), f"tortiemask{f}_{mask}")
 
-            # Define skin colors
-            skin_colors = [
-                ["BLACK", "RED", "PINK", "DARKBROWN", "BROWN", "LIGHTBROWN"],
-                ["DARK", "DARKGREY", "GREY", "DARKSALMON", "SALMON", "PEACH"],
-                ["DARKMARBLED", "MARBLED", "LIGHTMARBLED", "DARKBLUE", "BLUE", "LIGHTBLUE"],
-            ]
+        # Define skin colors
+        skin_colors = [
+            ["BLACK", "RED", "PINK", "DARKBROWN", "BROWN", "LIGHTBROWN"],
+            ["DARK", "DARKGREY", "GREY", "DARKSALMON", "SALMON", "PEACH"],
+            ["DARKMARBLED", "MARBLED", "LIGHTMARBLED", "DARKBLUE", "BLUE", "LIGHTBLUE"],
+        ]
 
-            for row, colors in enumerate(skin_colors):
-                for col, color in enumerate(colors):
-                    self.make_group("skin", (col, row), f"skin{f}_{color}")
+        for row, colors in enumerate(skin_colors):
+            for col, color in enumerate(colors):
+                self.make_group("skin", (col, row), f"skin{f}_{color}")
 
-            self.load_scars(f)
-        self.load_symbols()
+        self.load_scars(f)
+        self.loaded_folders.add(f)
 
     def load_scars(self, f):
         """
@@ -1,7 +1,7 @@
 from collections import defaultdict
 from itertools import groupby
 from random import choice
-from typing import TypedDict, Optional, List, Dict
+from typing import Callable, TypedDict, Optional, List, Dict
 
 from scripts.cat.enums import CatRank, CatSocial, CatStanding, CatAge, CatGroup
 from scripts.game_structure.game_essentials import game
@@ -48,6 +48,9 @@ class Status:
         """List of dicts containing the keys group, rank, and moons_as. A new dict is added whenever group or rank are
         changed."""
 
+        self.on_change: Optional[Callable[[], None]] = None
+        """Called whenever the group or rank changes. The cat uses this to keep Cat.all_cats up to date."""
+
         self.standing_history = standing_history if standing_history else []
         """List of dicts containing the keys group, standing, and near. Standing is a chronological list of the cat's 
         standings with the group. Near is a bool with True indicating the cat is within interact-able distance of that 
@@ -145,6 +148,11 @@ class Status:
         )
 
         self._start_standing()
+        self._changed()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
 
     def _start_group_history(
         self,
@@ -375,6 +383,7 @@ class Status:
             self.change_standing(standing_with_past_group)
 
         self.group_history.append({"group": new_group, "rank": new_rank, "moons_as": 0})
+        self._changed()
 
         # add member standing for new group
         self.change_standing(CatStanding.MEMBER)
@@ -512,11 +521,13 @@ class Status:
                 self.group_history.remove(last_entry)
                 last_entry = self.group_history[-1]
             if last_entry["group"] == self.group and last_entry["rank"] == new_rank:
+                self._changed()
                 return
 
         self.group_history.append(
             {"group": self.group, "rank": new_rank, "moons_as": 0}
         )
+        self._changed()
 
     def change_group_nearness(self, group: CatGroup):
         """
@@ -1,6 +1,6 @@
 import traceback
 from random import choice
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import i18n
 
@@ -11,6 +11,12 @@ from scripts.game_structure.localization import load_lang_resource
 if TYPE_CHECKING:
     from scripts.cat.cats import Cat
 
+# thought lists for each life_dir/spec_dir/rank, combined with their general thoughts
+_thought_buckets: Dict[Tuple[str, str, str], List[Tuple[dict, bool]]] = {}
+# the buckets above with the static constraints (game mode, biome, season, camp) applied
+_static_thoughts: Dict[tuple, List[Tuple[dict, bool]]] = {}
+_thought_index_lang: Optional[str] = None
+
 
 class Thoughts:
     @staticmethod
@@ -63,6 +69,20 @@ class Thoughts:
         main_cat: "Cat", random_cat: "Cat", thought, game_mode, biome, season, camp
     ) -> bool:
         """Check if the two cats fulfills the thought constraints."""
+        if not Thoughts.thought_fulfill_static_constraints(
+            thought, game_mode, biome, season, camp
+        ):
+            return False
+
+        return Thoughts.cats_fulfill_dynamic_thought_constraints(
+            main_cat, random_cat, thought
+        )
+
+    @staticmethod
+    def thought_fulfill_static_constraints(
+        thought, game_mode, biome, season, camp
+    ) -> bool:
+        """Check the constraints which only depend on the Clan, not on the cats involved."""
 
         # This is for checking biome
         if "biome" in thought:
@@ -79,16 +99,30 @@ class Thoughts:
             if camp not in thought["camp"]:
                 return False
 
+        return True
+
+    @staticmethod
+    def thought_needs_random_cat(thought) -> bool:
+        """Check if any of the thought strings mention the random cat."""
+        return any("r_c" in thought_str for thought_str in thought["thoughts"])
+
+    @staticmethod
+    def cats_fulfill_dynamic_thought_constraints(
+        main_cat: "Cat", random_cat: "Cat", thought, needs_random_cat=None
+    ) -> bool:
+        """Check if the two cats fulfill the cat-dependent thought constraints.
+        :param needs_random_cat: precomputed result of thought_needs_random_cat, if known
+        """
+
         # This is for checking the 'not_working' status
         if "not_working" in thought:
             if thought["not_working"] != main_cat.not_working():
                 return False
 
         # This is for checking if another cat is needed and there is another cat
-        r_c_in = [
-            thought_str for thought_str in thought["thoughts"] if "r_c" in thought_str
-        ]
-        if len(r_c_in) > 0 and not random_cat:
+        if needs_random_cat is None:
+            needs_random_cat = Thoughts.thought_needs_random_cat(thought)
+        if needs_random_cat and not random_cat:
             return False
 
         # This is for filtering certain relationship types between the main cat and random cat.
@@ -180,7 +214,7 @@ class Thoughts:
             ):  # makes sure that outsiders can get thoughts all the time
                 pass
             else:
-                if outside_status and outside_status != "clancat" and len(r_c_in) > 0:
+                if outside_status and outside_status != "clancat" and needs_random_cat:
                     return False
 
         if "has_injuries" in thought:
@@ -321,27 +355,82 @@ class Thoughts:
         else:
             spec_dir = ""
 
-        # newborns only pull from their status thoughts. this is done for convenience
         try:
-            if main_cat.age == "newborn":
-                loaded_thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/newborn.json"
-                )
-            else:
-                thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/{rank}.json"
+            possible_thoughts = Thoughts.get_static_thoughts(
+                life_dir,
+                spec_dir,
+                "newborn" if main_cat.age == "newborn" else rank,
+                game_mode,
+                biome,
+                season,
+                camp,
+            )
+            return [
+                thought
+                for thought, needs_random_cat in possible_thoughts
+                if Thoughts.cats_fulfill_dynamic_thought_constraints(
+                    main_cat, other_cat, thought, needs_random_cat
                 )
-                genthoughts = load_lang_resource(
+            ]
+        except IOError:
+            print("ERROR: loading thoughts")
+
+    @staticmethod
+    def get_thought_bucket(life_dir, spec_dir, rank) -> List[Tuple[dict, bool]]:
+        """
+        Get every thought a cat of this rank and residence can have, paired with whether it needs
+        a random cat. Built once per language, as these files don't change during a game.
+        :param life_dir: "alive" or "dead"
+        :param spec_dir: subfolder for the cat's residence, including its leading slash
+        :param rank: the rank file to load, or "newborn"
+        """
+        Thoughts._check_thought_index_lang()
+        key = (life_dir, spec_dir, rank)
+        if key not in _thought_buckets:
+            # newborns only pull from their status thoughts. this is done for convenience
+            loaded_thoughts = load_lang_resource(
+                f"thoughts/{life_dir}{spec_dir}/{rank}.json"
+            )
+            if rank != "newborn":
+                loaded_thoughts = loaded_thoughts + load_lang_resource(
                     f"thoughts/{life_dir}{spec_dir}/general.json"
                 )
-                loaded_thoughts = thoughts + genthoughts
+            _thought_buckets[key] = [
+                (thought, Thoughts.thought_needs_random_cat(thought))
+                for thought in loaded_thoughts
+            ]
+        return _thought_buckets[key]
 
-            final_thoughts = Thoughts.create_thoughts(
-                loaded_thoughts, main_cat, other_cat, game_mode, biome, season, camp
-            )
-            return final_thoughts
-        except IOError:
-            print("ERROR: loading thoughts")
+    @staticmethod
+    def get_static_thoughts(
+        life_dir, spec_dir, rank, game_mode, biome, season, camp
+    ) -> List[Tuple[dict, bool]]:
+        """
+        Get the thoughts from the matching bucket which pass the Clan-wide constraints.
+        Results are memoized, so only the cat-dependent constraints need checking per cat.
+        """
+        Thoughts._check_thought_index_lang()
+        key = (life_dir, spec_dir, rank, game_mode, biome, season, camp)
+        if key not in _static_thoughts:
+            _static_thoughts[key] = [
+                (thought, needs_random_cat)
+                for thought, needs_random_cat in Thoughts.get_thought_bucket(
+                    life_dir, spec_dir, rank
+                )
+                if Thoughts.thought_fulfill_static_constraints(
+                    thought, game_mode, biome, season, camp
+                )
+            ]
+        return _static_thoughts[key]
+
+    @staticmethod
+    def _check_thought_index_lang():
+        """Drop the thought index if the language has changed since it was built."""
+        global _thought_index_lang
+        if _thought_index_lang != i18n.config.get("locale"):
+            _thought_buckets.clear()
+            _static_thoughts.clear()
+            _thought_index_lang = i18n.config.get("locale")
 
     @staticmethod
     def get_chosen_thought(main_cat, other_cat, game_mode, biome, season, camp):
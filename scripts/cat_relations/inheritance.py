@@ -8,6 +8,10 @@ while mating and for the display of the family tree screen.
 
 """
 
+from collections import defaultdict
+from enum import IntFlag, auto
+from typing import Dict, List, Set, Tuple
+
 import i18n
 from strenum import StrEnum  # pylint: disable=no-name-in-module
 
@@ -31,6 +35,78 @@ BLOOD_RELATIVE_TYPES = [
 ]
 
 
+class Kinship(IntFlag):
+    """What another cat is to a cat. In an inbred family a cat can be more than one of them at once."""
+
+    NONE = 0
+    PARENT = auto()
+    KIT = auto()
+    SIBLING = auto()
+    SIBLINGS_KIT = auto()
+    PARENTS_SIBLING = auto()
+    COUSIN = auto()
+    GRANDPARENT = auto()
+    GRAND_KIT = auto()
+    MATE = auto()
+    KITS_MATE = auto()
+    SIBLINGS_MATE = auto()
+
+
+MATE_KINSHIPS = Kinship.MATE | Kinship.KITS_MATE | Kinship.SIBLINGS_MATE
+"""Kinships by mating only, which don't make the cats related"""
+
+
+class FamilyGraph:
+    """
+    The parent -> kit edges between all cats, blood and adoptive. Cats are filed again whenever their parents are
+    set, so finding the kits of a cat only looks at that cat's edges instead of going through every cat.
+    """
+
+    def __init__(self):
+        self._kits: Dict[str, Dict[str, None]] = defaultdict(
+            dict
+        )  # parent ID: {kit ID: None}
+        self._filed_under: Dict[str, Tuple[str, ...]] = {}  # kit ID: parent IDs
+
+    @staticmethod
+    def _parents_of(cat) -> Tuple[str, ...]:
+        parent_ids = [cat.parent1, cat.parent2]
+        parent_ids.extend(cat.adoptive_parents)
+        return tuple(dict.fromkeys(parent_id for parent_id in parent_ids if parent_id))
+
+    def refile(self, cat):
+        """Update the edges of the cat after their (adoptive) parents changed"""
+        parent_ids = self._parents_of(cat)
+        old_parent_ids = self._filed_under.get(cat.ID, ())
+        if parent_ids == old_parent_ids:
+            return
+        for parent_id in old_parent_ids:
+            kits = self._kits.get(parent_id)
+            if kits is not None:
+                kits.pop(cat.ID, None)
+                if not kits:
+                    del self._kits[parent_id]
+        for parent_id in parent_ids:
+            self._kits[parent_id][cat.ID] = None
+        self._filed_under[cat.ID] = parent_ids
+
+    def kits_of(self, *parent_ids) -> List[str]:
+        """Returns the IDs of all kits of the given parents, without duplicates, faded and removed cats included."""
+        kit_ids = {}
+        for parent_id in parent_ids:
+            kits = self._kits.get(parent_id)
+            if kits:
+                kit_ids.update(kits)
+        return list(kit_ids)
+
+    def reset(self):
+        self._kits.clear()
+        self._filed_under.clear()
+
+
+family_graph = FamilyGraph()
+
+
 class Inheritance:
     all_inheritances = {}  # ID: object
 
@@ -48,10 +124,12 @@ class Inheritance:
         self.cousins = {}
         self.grand_parents = {}
         self.grand_kits = {}
-        self.all_involved = []
-        self.all_but_cousins = []
+        self.kinship: Dict[str, Kinship] = {}
+        self.all_involved: Set[str] = set()
+        self.all_but_cousins: Set[str] = set()
 
         self.cat = cat
+        family_graph.refile(cat)
         self.update_inheritance()
 
         # if the cat is newly born, update all the related cats
@@ -74,8 +152,9 @@ class Inheritance:
         self.cousins = {}
         self.grand_parents = {}
         self.grand_kits = {}
-        self.all_involved = []
-        self.all_but_cousins = []
+        self.kinship = {}
+        self.all_involved = set()
+        self.all_but_cousins = set()
         self.other_mates = []
 
         # helping variables
@@ -90,8 +169,13 @@ class Inheritance:
         # mates
         self.init_mates()
 
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
+        # kits, siblings and parents_siblings are all kits of the cat, its parents or its grandparents,
+        # so only those have to be checked
+        for inter_id in family_graph.kits_of(
+            self.cat.ID, *self.parents, *self.grand_parents
+        ):
+            inter_cat = self.cat.all_cats.get(inter_id)
+            if inter_id == self.cat.ID or not inter_cat:
                 continue
 
             # kits + their mates
@@ -103,12 +187,23 @@ class Inheritance:
             # parents_siblings
             self.init_parents_siblings(inter_id, inter_cat)
 
+        # cousins depend on parents_siblings
+        for inter_id in family_graph.kits_of(*self.parents_siblings):
+            inter_cat = self.cat.all_cats.get(inter_id)
+            if inter_id == self.cat.ID or not inter_cat:
+                continue
+
             # cousins
             self.init_cousins(inter_id, inter_cat)
 
+        # a mate of a kit or sibling might only be found to be related after them
+        self.update_mates_rel_type(self.kits_mates)
+        self.update_mates_rel_type(self.siblings_mates)
+
         # since grand kits depending on kits, ALL KITS HAVE TO BE SET FIRST!
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
+        for inter_id in family_graph.kits_of(*self.kits):
+            inter_cat = self.cat.all_cats.get(inter_id)
+            if inter_id == self.cat.ID or not inter_cat:
                 continue
 
             # grand kits
@@ -151,13 +246,24 @@ class Inheritance:
         This function should be called, when the cat breaks up.
         It renews all inheritances, where this cat is listed as a mate of a kit or sibling.
         """
+        affected_ids = dict.fromkeys(self.all_involved)
         self.update_inheritance()
-        for inter_inheritances in self.all_inheritances.values():
-            if (
-                self.cat.ID in inter_inheritances.other_mates
-                or self.cat.ID in inter_inheritances.all_involved
-            ):
-                inter_inheritances.update_inheritance()
+        affected_ids.update(dict.fromkeys(self.all_involved))
+
+        # the cat is listed as a mate by the parents and siblings of their (previous) mates
+        for mate_id in self.cat.mate + self.cat.previous_mates:
+            affected_ids[mate_id] = None
+            mate = self.cat.all_cats.get(mate_id)
+            if not mate:
+                continue
+            mate_parents = self.get_parents(mate)
+            affected_ids.update(dict.fromkeys(mate_parents))
+            affected_ids.update(dict.fromkeys(family_graph.kits_of(*mate_parents)))
+
+        affected_ids.pop(self.cat.ID, None)
+        for cat_id in affected_ids:
+            if cat_id in self.all_inheritances:
+                self.all_inheritances[cat_id].update_inheritance()
 
     def get_cat_info(self, cat_id) -> dict:
         """Returns a list of the additional information of the given cat id."""
@@ -204,6 +310,7 @@ class Inheritance:
         """Remove the cat the parent dictionary - used to 'update' the adoptive parents."""
         if cat.ID in self.parents:
             del self.parents[cat.ID]
+            self.kinship[cat.ID] = self.get_kinship(cat.ID) & ~Kinship.PARENT
             self.update_all_related_inheritance()
 
     def add_parent(self, parent, rel_type=RelationType.ADOPTIVE):
@@ -221,10 +328,19 @@ class Inheritance:
             and parent.ID not in self.cat.adoptive_parents
         ):
             self.cat.adoptive_parents.append(parent.ID)
-        self.all_involved.append(parent.ID)
-        self.all_but_cousins.append(parent.ID)
+            family_graph.refile(self.cat)
+        self.add_kinship(parent.ID, Kinship.PARENT)
         self.update_all_related_inheritance()
 
+    def add_kinship(self, cat_id, kinship: Kinship):
+        """File the cat as a relative of the given kind, and as related unless it's only by mating."""
+        self.kinship[cat_id] = self.get_kinship(cat_id) | kinship
+        if kinship & MATE_KINSHIPS:
+            return
+        self.all_involved.add(cat_id)
+        if kinship != Kinship.COUSIN:
+            self.all_but_cousins.add(cat_id)
+
     # ---------------------------------------------------------------------------- #
     #                            different init function                           #
     # ---------------------------------------------------------------------------- #
@@ -291,8 +407,7 @@ class Inheritance:
             if not relevant_cat:
                 continue
             self.parents[relevant_id] = {"type": RelationType.BLOOD, "additional": []}
-            self.all_involved.append(relevant_id)
-            self.all_but_cousins.append(relevant_id)
+            self.add_kinship(relevant_id, Kinship.PARENT)
 
         # adoptive
         current_parent_ids = self.get_adoptive_parents()
@@ -304,8 +419,7 @@ class Inheritance:
                 "type": RelationType.ADOPTIVE,
                 "additional": [],
             }
-            self.all_involved.append(relevant_id)
-            self.all_but_cousins.append(relevant_id)
+            self.add_kinship(relevant_id, Kinship.PARENT)
 
     def init_mates(self):
         """Create a mate relationship"""
@@ -318,6 +432,7 @@ class Inheritance:
                 "type": mate_rel,
                 "additional": [i18n.t("inheritance.current_mate")],
             }
+            self.add_kinship(relevant_id, Kinship.MATE)
             self.other_mates.append(relevant_id)
 
         for relevant_id in self.cat.previous_mates:
@@ -329,6 +444,7 @@ class Inheritance:
                 "type": mate_rel,
                 "additional": [i18n.t("inheritance.prev_mate")],
             }
+            self.add_kinship(relevant_id, Kinship.MATE)
             self.other_mates.append(relevant_id)
 
     def init_grandparents(self):
@@ -355,8 +471,7 @@ class Inheritance:
                         "type": grand_type,
                         "additional": [],
                     }
-                    self.all_involved.append(grand_id)
-                    self.all_but_cousins.append(grand_id)
+                    self.add_kinship(grand_id, Kinship.GRANDPARENT)
                 self.grand_parents[grand_id]["additional"].append(
                     i18n.t("inheritance.parent_of_inter", name=str(parent_cat.name))
                 )
@@ -369,8 +484,7 @@ class Inheritance:
         inter_blood_parents = self.get_blood_parents(inter_cat)
         if self.cat.ID in inter_blood_parents:
             self.kits[inter_id] = {"type": RelationType.BLOOD, "additional": []}
-            self.all_involved.append(inter_id)
-            self.all_but_cousins.append(inter_id)
+            self.add_kinship(inter_id, Kinship.KIT)
             if len(inter_blood_parents) > 1:
                 inter_blood_parents.remove(self.cat.ID)
                 other_id = inter_blood_parents.pop()
@@ -382,8 +496,7 @@ class Inheritance:
         # kit - adoptive
         if self.cat.ID in inter_cat.adoptive_parents:
             self.kits[inter_id] = {"type": RelationType.ADOPTIVE, "additional": []}
-            self.all_involved.append(inter_id)
-            self.all_but_cousins.append(inter_id)
+            self.add_kinship(inter_id, Kinship.KIT)
             if len(inter_blood_parents) > 0:
                 name = []
                 for blood_parent_id in inter_blood_parents:
@@ -416,6 +529,7 @@ class Inheritance:
                         i18n.t("inheritance.mate_of_inter", name=str(inter_cat.name))
                     ],
                 }
+                self.add_kinship(mate_id, Kinship.KITS_MATE)
 
     def init_siblings(self, inter_id, inter_cat):
         """Create a sibling relationship."""
@@ -474,8 +588,7 @@ class Inheritance:
 
         if siblings:
             self.siblings[inter_id] = {"type": rel_type, "additional": additional_info}
-            self.all_involved.append(inter_id)
-            self.all_but_cousins.append(inter_id)
+            self.add_kinship(inter_id, Kinship.SIBLING)
 
             for mate_id in inter_cat.mate:
                 mate_rel = RelationType.NOT_BLOOD
@@ -491,10 +604,14 @@ class Inheritance:
                         i18n.t("inheritance.mate_of_inter", name=str(inter_cat.name))
                     ],
                 }
+                self.add_kinship(mate_id, Kinship.SIBLINGS_MATE)
                 self.other_mates.append(mate_id)
 
-            # iterate over all cats, to get the children of the sibling
-            for _c in self.cat.all_cats.values():
+            # get the children of the sibling
+            for _c_id in family_graph.kits_of(inter_id):
+                _c = self.cat.all_cats.get(_c_id)
+                if not _c:
+                    continue
                 _c_parents = self.get_parents(_c)
                 _c_adoptive = self.get_adoptive_parents(_c)
                 if inter_id in _c_parents:
@@ -518,8 +635,20 @@ class Inheritance:
                         "type": kit_rel_type,
                         "additional": [add_info],
                     }
-                    self.all_involved.append(_c.ID)
-                    self.all_but_cousins.append(_c.ID)
+                    self.add_kinship(_c.ID, Kinship.SIBLINGS_KIT)
+
+    def update_mates_rel_type(self, mates_dict):
+        """Update the relation type of the not blood related mates in the dict, which are relatives of the cat."""
+        for mate_id, value in mates_dict.items():
+            if (
+                value["type"] != RelationType.NOT_BLOOD
+                or mate_id not in self.all_involved
+            ):
+                continue
+            if mate_id in self.parents.keys():
+                value["type"] = self.parents[mate_id]["type"]
+            else:
+                value["type"] = self.get_exact_rel_type(mate_id)
 
     def init_parents_siblings(self, inter_id, inter_cat):
         """Create an aunt/uncle (pibling) relationship."""
@@ -543,8 +672,7 @@ class Inheritance:
                         "type": rel_type,
                         "additional": [],
                     }
-                    self.all_involved.append(inter_id)
-                    self.all_but_cousins.append(inter_id)
+                    self.add_kinship(inter_id, Kinship.PARENTS_SIBLING)
 
                 grand_parent_cat = self.cat.fetch_cat(inter_parent_id)
                 if len(self.parents_siblings[inter_id]["additional"]) > 0:
@@ -586,7 +714,7 @@ class Inheritance:
                     )
 
                 self.cousins[inter_id] = {"type": rel_type, "additional": [add_info]}
-                self.all_involved.append(inter_id)
+                self.add_kinship(inter_id, Kinship.COUSIN)
 
     def init_grand_kits(self, inter_id, inter_cat):
         """Create a grandkit relationship."""
@@ -617,13 +745,16 @@ class Inheritance:
                         "type": rel_type,
                         "additional": [add_info],
                     }
-                    self.all_but_cousins.append(inter_id)
-                    self.all_involved.append(inter_id)
+                    self.add_kinship(inter_id, Kinship.GRAND_KIT)
 
     # ---------------------------------------------------------------------------- #
     #                             all getter functions                             #
     # ---------------------------------------------------------------------------- #
 
+    def get_kinship(self, cat_id) -> Kinship:
+        """Returns all the ways the given cat is related to the current cat, Kinship.NONE if they aren't."""
+        return self.kinship.get(cat_id, Kinship.NONE)
+
     @staticmethod
     def get_blood_relatives(relatives_dict):
         """Returns the keys (ids) of the dictionary entries with a blood relation."""
@@ -9,6 +9,12 @@ from scripts.cat_relations.interaction import (
     cats_fulfill_single_interaction_constraints,
     rebuild_relationship_dicts,
 )
+from scripts.cat_relations.relationship_store import (
+    EXISTS,
+    FAMILY,
+    MATES,
+    clamp_stat,
+)
 from scripts.event_class import Single_Event
 from scripts.game_structure.game_essentials import game
 from scripts.utility import get_personality_compatibility, process_text
@@ -20,10 +26,80 @@ import scripts.cat_relations.interaction as interactions
 # ---------------------------------------------------------------------------- #
 
 
+class _RelationshipStat:
+    """A stat which lives in the cat's RelationshipRow once the relationship is stored there."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.detached_name = f"_{name}"
+
+    def __get__(self, relationship, owner=None):
+        if relationship is None:
+            return self
+        if relationship._row is None:
+            return getattr(relationship, self.detached_name)
+        return relationship._row.columns[self.name][relationship._slot]
+
+    def __set__(self, relationship, value):
+        # each stat can go from 0 to 100
+        if value > 100:
+            value = 100
+        if value < 0:
+            value = 0
+        if relationship._row is None:
+            setattr(relationship, self.detached_name, value)
+        else:
+            relationship._row.columns[self.name][relationship._slot] = clamp_stat(value)
+            relationship._row.dirty = True
+
+
+class _RelationshipFlag:
+    """A boolean which lives in the flag column of the cat's RelationshipRow once stored there."""
+
+    def __init__(self, bit):
+        self.bit = bit
+
+    def __set_name__(self, owner, name):
+        self.detached_name = f"_{name}"
+
+    def __get__(self, relationship, owner=None):
+        if relationship is None:
+            return self
+        if relationship._row is None:
+            return getattr(relationship, self.detached_name)
+        return bool(relationship._row.flags[relationship._slot] & self.bit)
+
+    def __set__(self, relationship, value):
+        if relationship._row is None:
+            setattr(relationship, self.detached_name, value)
+        else:
+            if value:
+                relationship._row.flags[relationship._slot] |= self.bit
+            else:
+                relationship._row.flags[relationship._slot] &= ~self.bit
+            relationship._row.dirty = True
+
+
 class Relationship:
+    """
+    The relationship of cat_from towards cat_to.
+    A freshly created Relationship keeps its own values. Once it is stored in
+    cat.relationships, it becomes a view onto that cat's RelationshipRow.
+    """
+
     used_interaction_ids = []
     currently_loaded_lang = None
 
+    romantic_love = _RelationshipStat()
+    platonic_like = _RelationshipStat()
+    dislike = _RelationshipStat()
+    admiration = _RelationshipStat()
+    comfortable = _RelationshipStat()
+    jealousy = _RelationshipStat()
+    trust = _RelationshipStat()
+    mates = _RelationshipFlag(MATES)
+    family = _RelationshipFlag(FAMILY)
+
     def __init__(
         self,
         cat_from,
@@ -39,6 +115,8 @@ class Relationship:
         trust=0,
         log=None,
     ) -> None:
+        self._row = None
+        self._slot = None
         self.chosen_interaction = None
         self.cat_from = cat_from
         self.cat_to = cat_to
@@ -63,6 +141,72 @@ class Relationship:
         self.jealousy = jealousy
         self.trust = trust
 
+    @classmethod
+    def from_row(cls, row, slot) -> "Relationship":
+        """Create a view onto a relationship which is stored in a RelationshipRow"""
+        relationship = cls.__new__(cls)
+        relationship._row = row
+        relationship._slot = slot
+        relationship._opposite_relationship = None
+        relationship.chosen_interaction = None
+        relationship.cat_from = row.cat_from
+        relationship.cat_to = row.index.cat_at(slot)
+        relationship.interaction_str = ""
+        relationship.triggered_event = False
+        return relationship
+
+    def bind(self, row, slot) -> bool:
+        """
+        Turn this relationship into a view onto the given row slot. The values must already be written there.
+        :return: False if the relationship is already a view onto somewhere else
+        """
+        if self._row is not None and (self._row is not row or self._slot != slot):
+            return False
+        self._row = row
+        self._slot = slot
+        return True
+
+    def unbind(self):
+        """Copy the values out of the row, after the relationship was removed from it"""
+        row, slot = self._row, self._slot
+        flag = row.flags[slot] | EXISTS
+        values = {stat: column[slot] for stat, column in row.columns.items()}
+        log = row.logs.get(slot, [])
+        self._row = None
+        self._slot = None
+        for stat, value in values.items():
+            setattr(self, stat, value)
+        self.mates = bool(flag & MATES)
+        self.family = bool(flag & FAMILY)
+        self.log = log
+
+    @property
+    def log(self) -> list:
+        if self._row is None:
+            return self._log
+        # the log is handed out to be appended to, the row notices when its length changes
+        return self._row.logs.setdefault(self._slot, [])
+
+    @log.setter
+    def log(self, value):
+        if self._row is None:
+            self._log = value
+        else:
+            self._row.logs[self._slot] = value
+            self._row.dirty = True
+
+    @property
+    def opposite_relationship(self):
+        if self._row is not None:
+            opposite_relationships = getattr(self.cat_to, "relationships", None)
+            if opposite_relationships and self.cat_from.ID in opposite_relationships:
+                return opposite_relationships[self.cat_from.ID]
+        return self._opposite_relationship
+
+    @opposite_relationship.setter
+    def opposite_relationship(self, value):
+        self._opposite_relationship = value
+
     def link_relationship(self):
         """Add the other relationship object to this easily access and change the other side."""
         if self.cat_from.ID in self.cat_to.relationships:
@@ -624,91 +768,3 @@ class Relationship:
         if value > 0:
             self.comfortable += buff
             self.dislike -= buff
-
-    # ---------------------------------------------------------------------------- #
-    #                                   property                                   #
-    # ---------------------------------------------------------------------------- #
-
-    @property
-    def romantic_love(self):
-        return self._romantic_love
-
-    @romantic_love.setter
-    def romantic_love(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._romantic_love = value
-
-    @property
-    def platonic_like(self):
-        return self._platonic_like
-
-    @platonic_like.setter
-    def platonic_like(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._platonic_like = value
-
-    @property
-    def dislike(self):
-        return self._dislike
-
-    @dislike.setter
-    def dislike(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._dislike = value
-
-    @property
-    def admiration(self):
-        return self._admiration
-
-    @admiration.setter
-    def admiration(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._admiration = value
-
-    @property
-    def comfortable(self):
-        return self._comfortable
-
-    @comfortable.setter
-    def comfortable(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._comfortable = value
-
-    @property
-    def jealousy(self):
-        return self._jealousy
-
-    @jealousy.setter
-    def jealousy(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._jealousy = value
-
-    @property
-    def trust(self):
-        return self._trust
-
-    @trust.setter
-    def trust(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._trust = value
@@ -0,0 +1,274 @@
+"""
+Compact storage for the relationships between cats.
+
+Every cat ID gets a dense slot number from the shared RelationshipIndex. Each cat then keeps
+a RelationshipRow: one bytearray per relationship stat, indexed by the other cat's slot, plus
+a flag column and a sparse table for the logs. Together the rows form the full relationship
+matrix of the Clan while costing only a few bytes per pair.
+
+Relationship objects are only created when they are asked for, as views onto a row.
+"""
+
+import weakref
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+    from scripts.cat_relations.relationship import Relationship
+
+STATS = (
+    "romantic_love",
+    "platonic_like",
+    "dislike",
+    "admiration",
+    "comfortable",
+    "jealousy",
+    "trust",
+)
+
+# bits of RelationshipRow.flags
+EXISTS = 1
+MATES = 2
+FAMILY = 4
+
+
+class RelationshipIndex:
+    """Hands out a dense slot number for every cat ID that takes part in a relationship."""
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._cats: List[Optional["Cat"]] = []
+
+    def slot_for(self, cat: "Cat") -> int:
+        """Get the slot of the cat, registering it if it has none yet"""
+        slot = self._slots.get(cat.ID)
+        if slot is None:
+            slot = len(self._cats)
+            self._slots[cat.ID] = slot
+            self._cats.append(cat)
+        elif self._cats[slot] is not cat:
+            # the cat was reloaded, keep the newest object
+            self._cats[slot] = cat
+        return slot
+
+    def find_slot(self, cat_id: str) -> Optional[int]:
+        """Get the slot of the cat ID, or None if it has never been registered"""
+        return self._slots.get(cat_id)
+
+    def cat_at(self, slot: int) -> "Cat":
+        return self._cats[slot]
+
+    def reset(self):
+        """Forget every cat. Any row built before this is no longer valid."""
+        self._slots.clear()
+        self._cats.clear()
+
+    def __len__(self):
+        return len(self._cats)
+
+
+relationship_index = RelationshipIndex()
+
+
+class RelationshipRow(MutableMapping):
+    """
+    All relationships from one cat to the others, as a mapping of cat ID to Relationship.
+    Stats are whole numbers between 0 and 100, stored in one byte each.
+    """
+
+    def __init__(self, cat_from: "Cat", index: RelationshipIndex = None):
+        self.cat_from = cat_from
+        self.index = index if index is not None else relationship_index
+        self.flags = bytearray()
+        self.columns: Dict[str, bytearray] = {stat: bytearray() for stat in STATS}
+        self.logs: Dict[int, List[str]] = {}
+        # slot: length of the log when the row was last saved or loaded
+        self._saved_log_sizes: Dict[int, int] = {}
+        self._count = 0
+        # set whenever the row changes, cleared once it has been saved or loaded
+        self.dirty = True
+        # views which are still referenced somewhere, so repeated lookups give the same object
+        self._views = weakref.WeakValueDictionary()
+
+    @property
+    def dirty(self) -> bool:
+        """
+        If the row changed since it was last saved or loaded. Logs are handed out to be appended to, so a log
+        counts as changed once its length differs from the saved one.
+        """
+        if self._dirty:
+            return True
+        saved_log_sizes = self._saved_log_sizes
+        return any(
+            len(log) != saved_log_sizes.get(slot, 0) for slot, log in self.logs.items()
+        )
+
+    @dirty.setter
+    def dirty(self, value: bool):
+        self._dirty = value
+        if not value:
+            self._saved_log_sizes = {slot: len(log) for slot, log in self.logs.items()}
+
+    def _ensure_capacity(self, slot: int):
+        if slot < len(self.flags):
+            return
+        grow_by = max(slot + 1, len(self.flags) * 2) - len(self.flags)
+        padding = bytes(grow_by)
+        self.flags.extend(padding)
+        for column in self.columns.values():
+            column.extend(padding)
+
+    def _slot_of(self, cat_id) -> Optional[int]:
+        slot = self.index.find_slot(cat_id)
+        if slot is None or slot >= len(self.flags) or not self.flags[slot] & EXISTS:
+            return None
+        return slot
+
+    def add(
+        self,
+        cat_to: "Cat",
+        mates=False,
+        family=False,
+        romantic_love=0,
+        platonic_like=0,
+        dislike=0,
+        admiration=0,
+        comfortable=0,
+        jealousy=0,
+        trust=0,
+        log=None,
+    ) -> int:
+        """
+        Write a relationship to cat_to straight into the row, without creating a Relationship.
+        Overwrites the existing relationship, if there is one.
+        :return: the slot of cat_to
+        """
+        slot = self.index.slot_for(cat_to)
+        self._ensure_capacity(slot)
+        self.dirty = True
+        if not self.flags[slot] & EXISTS:
+            self._count += 1
+        self.flags[slot] = EXISTS | (MATES if mates else 0) | (FAMILY if family else 0)
+        columns = self.columns
+        columns["romantic_love"][slot] = clamp_stat(romantic_love)
+        columns["platonic_like"][slot] = clamp_stat(platonic_like)
+        columns["dislike"][slot] = clamp_stat(dislike)
+        columns["admiration"][slot] = clamp_stat(admiration)
+        columns["comfortable"][slot] = clamp_stat(comfortable)
+        columns["jealousy"][slot] = clamp_stat(jealousy)
+        columns["trust"][slot] = clamp_stat(trust)
+        if log:
+            self.logs[slot] = log
+        else:
+            self.logs.pop(slot, None)
+        return slot
+
+    def add_record(self, cat_to: "Cat", record: dict) -> int:
+        """
+        Write a relationship in the save file format into the row, the inverse of records().
+        Missing or empty values fall back to the defaults.
+        :return: the slot of cat_to
+        """
+        return self.add(
+            cat_to,
+            mates=record.get("mates") or False,
+            family=record.get("family") or False,
+            romantic_love=record.get("romantic_love") or 0,
+            platonic_like=record.get("platonic_like") or 0,
+            dislike=record.get("dislike") or 0,
+            admiration=record.get("admiration") or 0,
+            comfortable=record.get("comfortable") or 0,
+            jealousy=record.get("jealousy") or 0,
+            trust=record.get("trust") or 0,
+            log=record.get("log"),
+        )
+
+    def records(self) -> Iterator[dict]:
+        """Yield every relationship of the row in the save file format"""
+        cat_from_id = self.cat_from.ID
+        columns = [(stat, self.columns[stat]) for stat in STATS]
+        for slot, flag in enumerate(self.flags):
+            if not flag & EXISTS:
+                continue
+            record = {
+                "cat_from_id": cat_from_id,
+                "cat_to_id": self.index.cat_at(slot).ID,
+                "mates": bool(flag & MATES),
+                "family": bool(flag & FAMILY),
+            }
+            for stat, column in columns:
+                record[stat] = column[slot]
+            record["log"] = self.logs.get(slot, [])
+            yield record
+
+    def __getitem__(self, cat_id) -> "Relationship":
+        slot = self._slot_of(cat_id)
+        if slot is None:
+            raise KeyError(cat_id)
+        view = self._views.get(slot)
+        if view is None:
+            from scripts.cat_relations.relationship import Relationship
+
+            view = Relationship.from_row(self, slot)
+            self._views[slot] = view
+        return view
+
+    def __setitem__(self, cat_id, relationship: "Relationship"):
+        if relationship.cat_to.ID != cat_id:
+            raise ValueError(
+                f"Relationship to {relationship.cat_to.ID} can't be stored under {cat_id}"
+            )
+        slot = self.add(
+            relationship.cat_to,
+            mates=relationship.mates,
+            family=relationship.family,
+            romantic_love=relationship.romantic_love,
+            platonic_like=relationship.platonic_like,
+            dislike=relationship.dislike,
+            admiration=relationship.admiration,
+            comfortable=relationship.comfortable,
+            jealousy=relationship.jealousy,
+            trust=relationship.trust,
+            log=relationship.log,
+        )
+        if relationship.bind(self, slot):
+            self._views[slot] = relationship
+        else:
+            self._views.pop(slot, None)
+
+    def __delitem__(self, cat_id):
+        slot = self._slot_of(cat_id)
+        if slot is None:
+            raise KeyError(cat_id)
+        # the view takes the values with it before the slot is cleared
+        view = self._views.pop(slot, None)
+        if view is not None:
+            view.unbind()
+        self.flags[slot] = 0
+        self.logs.pop(slot, None)
+        self._count -= 1
+        self.dirty = True
+
+    def __contains__(self, cat_id):
+        return self._slot_of(cat_id) is not None
+
+    def __iter__(self):
+        for slot, flag in enumerate(self.flags):
+            if flag & EXISTS:
+                yield self.index.cat_at(slot).ID
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"RelationshipRow({self.cat_from.ID}, {len(self)} relationships)"
+
+
+def clamp_stat(value) -> int:
+    """Relationship stats go from 0 to 100"""
+    if value > 100:
+        return 100
+    if value < 0:
+        return 0
+    return int(value)
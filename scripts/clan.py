@@ -17,6 +17,7 @@ import ujson
 
 from scripts.cat.cats import Cat, cat_class
 from scripts.cat.enums import CatRank, CatGroup
+from scripts.cat.faded_archive import faded_archive
 from scripts.cat.names import names
 from scripts.cat.save_load import save_cats
 from scripts.cat.sprites import sprites
@@ -181,6 +182,7 @@ class Clan:
         """
         switch_set_value(Switch.clan_name, self.name)
         reset_loaded_clan_settings()
+        faded_archive.reset()
         instructor_rank = choice(
             (
                 CatRank.APPRENTICE,
@@ -1,5 +1,4 @@
 import random
-from copy import deepcopy
 from typing import List
 
 import i18n
@@ -9,6 +8,7 @@ from scripts.cat.enums import CatRank
 from scripts.cat.skills import SkillPath
 from scripts.clan_package.settings import get_clan_setting
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.profiling import profiled
 from scripts.utility import get_alive_clan_queens
 
 
@@ -47,13 +47,34 @@ class Nutrition:
             value = 0
         self._current_score = value
         self.percentage = self._current_score / self.max_score * 100
-        text_config = game.prey_config["text_nutrition"]
-        self.nutrition_text = text_config["text"][0]
-        for index in range(len(text_config["lower_range"])):
-            if self.percentage >= text_config["lower_range"][index]:
-                self.nutrition_text = i18n.t(
-                    f"conditions.nutrition.{text_config['text'][index]}"
-                )
+        # the text is only looked up when it's shown, the score changes far more often
+        self._text_percentage = self.percentage
+        self._nutrition_text = None
+
+    @property
+    def nutrition_text(self) -> str:
+        if self._nutrition_text is None:
+            self._nutrition_text = get_nutrition_text(self._text_percentage)
+        return self._nutrition_text
+
+    @nutrition_text.setter
+    def nutrition_text(self, value: str) -> None:
+        self._nutrition_text = value
+
+
+def get_nutrition_text(percentage) -> str:
+    """Get the text describing how well fed a cat with this nutrition percentage is.
+
+    :param int|float percentage: the percentage of the cat's nutrition
+    :return str: the translated text of the highest range the percentage is in
+    """
+    text_config = game.prey_config["text_nutrition"]
+    for lower_range, text in zip(
+        reversed(text_config["lower_range"]), reversed(text_config["text"])
+    ):
+        if percentage >= lower_range:
+            return i18n.t(f"conditions.nutrition.{text}")
+    return text_config["text"][0]
 
 
 class FreshkillPile:
@@ -85,7 +106,7 @@ class FreshkillPile:
             self.total_amount = game.prey_config["start_amount"]
         self.nutrition_info = {}
         self.living_cats = []
-        self.already_fed = []
+        self.already_fed = set()
         self.needed_prey = 0
 
     def add_freshkill(self, amount) -> None:
@@ -176,6 +197,7 @@ class FreshkillPile:
 
         self.needed_prey = needed_prey
 
+    @profiled("freshkill")
     def time_skip(self, living_cats: list, event_list: list) -> None:
         """Handles the time skip for the freshkill pile. Decrements the timers on prey items and feeds listed cats
 
@@ -193,9 +215,9 @@ class FreshkillPile:
                 event_list.append(i18n.t("hardcoded.expired_prey", count=amount))
         self.total_amount = sum(self.pile.values())
         value_diff = self.total_amount
-        self.already_fed = []
+        self.already_fed = set()
         self.feed_cats(living_cats)
-        self.already_fed = []
+        self.already_fed = set()
         value_diff -= sum(self.pile.values())
         event_list.append(i18n.t("hardcoded.consumed_prey", count=value_diff))
         self._update_needed_food(living_cats)
@@ -263,21 +285,22 @@ class FreshkillPile:
         :param bool additional_food_round: Determines if not player-initiated, default False
         """
         queen_dict, kits = get_alive_clan_queens(living_cats)
-        fed_kits = []
+        fed_kits = set()
         relevant_queens = []
         # kits under 3 months are feed by the queen
         for queen_id, their_kits in queen_dict.items():
             queen = Cat.fetch_cat(queen_id)
             young_kits = [kit for kit in their_kits if kit.moons < 3]
             if len(young_kits) > 0:
-                fed_kits.extend(young_kits)
+                fed_kits.update(young_kits)
                 relevant_queens.append(queen)
 
         pregnant_cats = [
             cat
             for cat in living_cats
-            if "pregnant" in cat.injuries and cat.ID not in queen_dict.keys()
+            if "pregnant" in cat.injuries and cat.ID not in queen_dict
         ]
+        queens_and_pregnant = set(relevant_queens).union(pregnant_cats)
 
         for feeding_status in FEEDING_ORDER:
             if feeding_status == CatRank.NEWBORN:
@@ -295,14 +318,12 @@ class FreshkillPile:
             elif feeding_status == "queen/pregnant":
                 relevant_group = relevant_queens + pregnant_cats
             else:
-                relevant_group = [
-                    cat for cat in living_cats if str(cat.status.rank) == feeding_status
-                ]
-                # remove all cats, which are also queens / pregnant
+                # leave out all cats, which are also queens / pregnant
                 relevant_group = [
                     cat
-                    for cat in relevant_group
-                    if cat not in relevant_queens and cat not in pregnant_cats
+                    for cat in living_cats
+                    if str(cat.status.rank) == feeding_status
+                    and cat not in queens_and_pregnant
                 ]
 
             if len(relevant_group) == 0:
@@ -340,20 +361,15 @@ class FreshkillPile:
 
         # first get special groups, which need to be looked out for when feeding
         queen_dict, kits = get_alive_clan_queens(living_cats)
-        fed_kits = []
-        relevant_queens = []
+        fed_kits = set()
         # kits under 3 months are feed by the queen
         for queen_id, their_kits in queen_dict.items():
-            queen = Cat.fetch_cat(queen_id)
-            young_kits = [kit for kit in their_kits if kit.moons < 3]
-            if len(young_kits) > 0:
-                fed_kits.extend(young_kits)
-                relevant_queens.append(queen)
-        pregnant_cats = [
+            fed_kits.update(kit for kit in their_kits if kit.moons < 3)
+        pregnant_cats = {
             cat
             for cat in living_cats
-            if "pregnant" in cat.injuries and cat.ID not in queen_dict.keys()
-        ]
+            if "pregnant" in cat.injuries and cat.ID not in queen_dict
+        }
 
         # first split nutrition information into low nutrition and satisfied
         ration_prey = get_clan_setting("ration prey")
@@ -377,6 +393,9 @@ class FreshkillPile:
         # use living_cats to fetch cat for testing
         fetch_cat = living_cats[0]
 
+        # the clan needs the same amount of prey however many cats are fed already
+        needed_prey = self.amount_food_needed()
+
         # first feed the cats with the lowest nutrition
         for cat_id, v in sorted_nutrition.items():
             cat = Cat.all_cats[cat_id]
@@ -401,12 +420,12 @@ class FreshkillPile:
                     feeding_amount = feeding_amount / 2
 
             if (
-                self.amount_food_needed() < self.total_amount * 1.2
+                needed_prey < self.total_amount * 1.2
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 1
             elif (
-                self.amount_food_needed() < self.total_amount
+                needed_prey < self.total_amount
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 0.5
@@ -439,25 +458,26 @@ class FreshkillPile:
         :param list living_cats: Cats to feed
         :param bool additional_food_round: Determines if not player-initiated, default False
         """
+        hunters_by_tier = {search_rank: [] for search_rank in range(1, 4)}
+        for cat in living_cats:
+            if not cat.skills:
+                continue
+            hunter_tiers = [
+                skill.tier
+                for skill in (cat.skills.primary, cat.skills.secondary)
+                if skill
+                and skill.path == SkillPath.HUNTER
+                and skill.tier in hunters_by_tier
+            ]
+            if hunter_tiers:
+                hunters_by_tier[min(hunter_tiers)].append(cat)
+
+        # the best hunters are fed first, the last found of a tier before the others
         best_hunter = []
-        for search_rank in range(1, 4):
-            for cat in living_cats.copy():
-                if not cat.skills:
-                    continue
-                if (
-                    cat.skills.primary
-                    and cat.skills.primary.path == SkillPath.HUNTER
-                    and cat.skills.primary.tier == search_rank
-                ):
-                    best_hunter.insert(0, cat)
-                    living_cats.remove(cat)
-                elif (
-                    cat.skills.secondary
-                    and cat.skills.secondary.path == SkillPath.HUNTER
-                    and cat.skills.secondary.tier == search_rank
-                ):
-                    best_hunter.insert(0, cat)
-                    living_cats.remove(cat)
+        for search_rank in range(3, 0, -1):
+            best_hunter.extend(reversed(hunters_by_tier[search_rank]))
+        hunters = set(best_hunter)
+        living_cats[:] = [cat for cat in living_cats if cat not in hunters]
 
         self.feed_group(best_hunter, additional_food_round)
         self.tactic_status(living_cats, additional_food_round)
@@ -497,6 +517,9 @@ class FreshkillPile:
         # first split nutrition information into low nutrition and satisfied
         ration_prey = get_clan_setting("ration prey")
 
+        # the clan needs the same amount of prey however many cats are fed already
+        needed_prey = self.amount_food_needed()
+
         # first feed the cats with the lowest nutrition
         for cat in group:
             if cat in self.already_fed:
@@ -522,22 +545,22 @@ class FreshkillPile:
                     feeding_amount = feeding_amount / 2
 
             if (
-                self.total_amount * 2 > self.amount_food_needed()
+                self.total_amount * 2 > needed_prey
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 2
             if (
-                self.total_amount * 1.8 > self.amount_food_needed()
+                self.total_amount * 1.8 > needed_prey
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 1.5
             elif (
-                self.total_amount * 1.2 > self.amount_food_needed()
+                self.total_amount * 1.2 > needed_prey
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 1
             elif (
-                self.total_amount > self.amount_food_needed()
+                self.total_amount > needed_prey
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 0.5
@@ -565,7 +588,7 @@ class FreshkillPile:
         order = ["expires_in_1", "expires_in_2", "expires_in_3", "expires_in_4"]
         for key in order:
             remaining_amount = self.take_from_pile(key, remaining_amount)
-        self.already_fed.append(cat)
+        self.already_fed.add(cat)
 
         if remaining_amount > 0 and amount_difference == 0:
             self.nutrition_info[cat.ID].current_score -= remaining_amount
@@ -625,7 +648,7 @@ class FreshkillPile:
             living_cats : list
                 the list of the current living cats, where the nutrition should be stored
         """
-        old_nutrition_info = deepcopy(self.nutrition_info)
+        old_nutrition_info = self.nutrition_info
         self.nutrition_info = {}
         queen_dict, kits = get_alive_clan_queens(self.living_cats)
 
@@ -654,21 +677,24 @@ class FreshkillPile:
                         current_score / previous_max * required_max
                     )
             else:
-                self.add_cat_to_nutrition(cat)
+                self.add_cat_to_nutrition(cat, queen_dict)
 
-    def add_cat_to_nutrition(self, cat: Cat) -> None:
+    def add_cat_to_nutrition(self, cat: Cat, queen_dict: dict = None) -> None:
         """
         Parameters
         ----------
         cat : Cat
             the cat, which should be added to the nutrition info
+        queen_dict : dict
+            the queens of the living cats and their kits, found again if not given
         """
         nutrition = Nutrition()
         factor = 3
         if cat.status.rank in [CatRank.NEWBORN, CatRank.KITTEN, CatRank.ELDER]:
             factor = 2
 
-        queen_dict, kits = get_alive_clan_queens(self.living_cats)
+        if queen_dict is None:
+            queen_dict, kits = get_alive_clan_queens(self.living_cats)
         prey_status = cat.status.rank
         if cat.ID in queen_dict.keys() or "pregnant" in cat.injuries:
             prey_status = "queen/pregnant"
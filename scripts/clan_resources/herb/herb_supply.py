@@ -10,6 +10,7 @@ from scripts.clan_resources.supply import Supply
 from scripts.game_structure import constants
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.localization import load_lang_resource
+from scripts.game_structure.profiling import profiled
 from scripts.utility import (
     adjust_list_text,
     event_text_adjust,
@@ -177,6 +178,7 @@ class HerbSupply:
                     num_collected=randint(self.adequate_qualifier, self.full_qualifier),
                 )
 
+    @profiled("herbs")
     def handle_moon(self, clan_size: int, clan_cats: list, med_cats: list):
         """
         handle herbs on moon skip: add collected to supply, use herbs where needed, expire old herbs, look for new herbs
@@ -1,11 +1,13 @@
 from typing import List
 
+from scripts.debug_commands.cache import CacheCommand
 from scripts.debug_commands.cat import CatsCommand
 from scripts.debug_commands.cat_pregnancy import PregnanciesCommand
 from scripts.debug_commands.command import Command
 from scripts.debug_commands.eval import EvalCommand, UnderstandRisksCommand
 from scripts.debug_commands.fps import FpsCommand
 from scripts.debug_commands.help import HelpCommand
+from scripts.debug_commands.profile import ProfileCommand
 from scripts.debug_commands.settings import ToggleCommand, SetCommand, GetCommand
 from scripts.debug_commands.cat_pregnancy import PregnanciesCommand
 from scripts.debug_commands.clan import ClanCommand
@@ -24,6 +26,8 @@ commandList: List[Command] = [
     CatsCommand(),
     ClanCommand(),
     PregnanciesCommand(),
+    CacheCommand(),
+    ProfileCommand(),
 ]
 
 helpCommand = HelpCommand(commandList)
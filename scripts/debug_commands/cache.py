@@ -0,0 +1,58 @@
+from typing import List
+
+from scripts.cat.sprites import sprites
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.game_structure.localization import (
+    get_lang_resource_cache_stats,
+    clear_lang_resource_cache,
+)
+
+
+class CacheStatsCommand(Command):
+    name = "stats"
+    description = "Show hit rates for the sprite, mask and lang resource caches"
+    aliases = ["s"]
+
+    def callback(self, args: List[str]):
+        sprite_stats = sprites.cat_sprite_cache.stats()
+        add_output_line_to_log(
+            f"Cat sprites: {sprite_stats['size']}/{sprite_stats['max_entries']} cached, "
+            f"{sprite_stats['hits']} hits, {sprite_stats['misses']} misses "
+            f"({sprite_stats['hit_rate']:.1%}), {sprite_stats['evictions']} evictions"
+        )
+        mask_stats = sprites.cat_mask_cache.stats()
+        add_output_line_to_log(
+            f"Cat masks: {mask_stats['size']}/{mask_stats['max_entries']} cached, "
+            f"{mask_stats['hits']} hits, {mask_stats['misses']} misses "
+            f"({mask_stats['hit_rate']:.1%}), {mask_stats['evictions']} evictions"
+        )
+        lang_stats = get_lang_resource_cache_stats()
+        add_output_line_to_log(
+            f"Lang resources: {lang_stats['size']} cached, "
+            f"{lang_stats['hits']} hits, {lang_stats['misses']} misses, "
+            f"{lang_stats['evictions']} evictions"
+        )
+
+
+class CacheClearCommand(Command):
+    name = "clear"
+    description = "Empty the sprite, mask and lang resource caches"
+    aliases = ["c"]
+
+    def callback(self, args: List[str]):
+        sprites.cat_sprite_cache.clear()
+        sprites.cat_mask_cache.clear()
+        clear_lang_resource_cache()
+        add_output_line_to_log("Caches cleared")
+
+
+class CacheCommand(Command):
+    name = "cache"
+    description = "Inspect in-memory caches"
+    aliases = ["caches"]
+
+    sub_commands = [CacheStatsCommand(), CacheClearCommand()]
+
+    def callback(self, args: List[str]):
+        add_output_line_to_log("Please specify a subcommand")
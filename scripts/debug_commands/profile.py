@@ -0,0 +1,95 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure.profiling import profiler
+
+
+class ProfileOnCommand(Command):
+    name = "on"
+    description = "Start timing the timeskips"
+
+    def callback(self, args: List[str]):
+        profiler.enabled = True
+        add_output_line_to_log("Timeskip profiling enabled")
+
+
+class ProfileOffCommand(Command):
+    name = "off"
+    description = "Stop timing the timeskips"
+
+    def callback(self, args: List[str]):
+        profiler.enabled = False
+        add_output_line_to_log("Timeskip profiling disabled")
+
+
+class ProfileLastCommand(Command):
+    name = "last"
+    description = "Show the breakdown of the latest timeskip"
+    aliases = ["l"]
+
+    def callback(self, args: List[str]):
+        if profiler.latest is None:
+            add_output_line_to_log(
+                "No timeskip has been timed yet, use 'profile on' first"
+            )
+            return
+        for line in profiler.latest.lines():
+            add_output_line_to_log(line)
+
+
+class ProfileTotalsCommand(Command):
+    name = "totals"
+    description = (
+        "Show the total time of each part of the timeskips since the last reset"
+    )
+    aliases = ["t"]
+
+    def callback(self, args: List[str]):
+        if not profiler.totals:
+            add_output_line_to_log("Nothing has been timed yet")
+            return
+        for line in profiler.total_lines():
+            add_output_line_to_log(line)
+
+
+class ProfileResetCommand(Command):
+    name = "reset"
+    description = "Forget the timed timeskips"
+
+    def callback(self, args: List[str]):
+        profiler.reset()
+        add_output_line_to_log("Timeskip profiling reset")
+
+
+class ProfileOverlayCommand(Command):
+    name = "overlay"
+    description = "Toggle showing the breakdown of the latest timeskip on screen"
+    aliases = ["o"]
+
+    def callback(self, args: List[str]):
+        game.debug_settings["showtimeskip"] = not game.debug_settings["showtimeskip"]
+        if game.debug_settings["showtimeskip"]:
+            profiler.enabled = True
+        add_output_line_to_log(
+            f"Set showtimeskip to {game.debug_settings['showtimeskip']}"
+        )
+
+
+class ProfileCommand(Command):
+    name = "profile"
+    description = "Time the parts of the timeskips"
+    aliases = ["prof"]
+
+    sub_commands = [
+        ProfileOnCommand(),
+        ProfileOffCommand(),
+        ProfileLastCommand(),
+        ProfileTotalsCommand(),
+        ProfileResetCommand(),
+        ProfileOverlayCommand(),
+    ]
+
+    def callback(self, args: List[str]):
+        add_output_line_to_log("Please specify a subcommand")
@@ -11,6 +11,7 @@ from scripts.utility import ui_scale
 from scripts.debug_commands import commandList
 from scripts.debug_commands.utils import set_debug_class
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.profiling import profiler
 from scripts.game_structure.screen_settings import MANAGER, offset, screen_scale
 from scripts.utility import get_text_box_theme
 
@@ -159,6 +160,8 @@ class DebugMode:
     debug_menu: DebugMenu = None
     coords_display = None
     fps_display = None
+    timeskip_display = None
+    timeskip_runs = 0
 
     def __init__(self):
         self.rebuild_console()
@@ -193,6 +196,15 @@ class DebugMode:
             pygame.Rect((0, 0), (-1, -1)), "0 fps", object_id=get_text_box_theme()
         )
 
+        self.timeskip_display = UITextBox(
+            "",
+            pygame.Rect((0, 30), (400, -1)),
+            object_id=get_text_box_theme("#text_box_22_horizleft"),
+        )
+        self.timeskip_display.change_layer(9000)
+        self.timeskip_display.hide()
+        self.timeskip_runs = 0
+
         self.debug_menu = DebugMenu(
             pygame.Rect(
                 (0, 0),
@@ -237,6 +249,23 @@ class DebugMode:
                 self.fps_display.hide()
                 self.fps_display.set_text("(0, 0)")
 
+        # Showtimeskip
+        if game.debug_settings["showtimeskip"]:
+            if self.timeskip_display.visible == 0:
+                self.timeskip_display.show()
+
+            if profiler.latest is not None and profiler.runs != self.timeskip_runs:
+                self.timeskip_runs = profiler.runs
+                self.timeskip_display.set_text(
+                    "<br>".join(
+                        html.escape(line).replace(" ", "&nbsp;")
+                        for line in profiler.latest.lines(min_share=0.02)
+                    )
+                )
+        else:
+            if self.timeskip_display.visible == 1:
+                self.timeskip_display.hide()
+
         # Showbounds
 
         # visual_debug_mode
@@ -33,6 +33,7 @@ from scripts.events_module.relationship.relation_events import Relation_Events
 from scripts.events_module.short.condition_events import Condition_Events
 from scripts.events_module.short.handle_short_events import handle_short_events
 from scripts.game_structure import constants
+from scripts.game_structure.game.save_load import save_batch, save_in_background
 from scripts.game_structure.game.switches import (
     Switch,
     switch_get_value,
@@ -40,6 +41,7 @@ from scripts.game_structure.game.switches import (
 )
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.localization import load_lang_resource
+from scripts.game_structure.profiling import profiled, profiler
 from scripts.game_structure.windows import SaveError
 from scripts.utility import (
     change_clan_relations,
@@ -74,9 +76,12 @@ class Events:
         self.load_ceremonies()
         self.load_war_resources()
 
-    def one_moon(self):
+    @profiled("moon", root=True)
+    def one_moon(self, batch=False):
         """
         Handles the moon skipping of the whole Clan.
+        :param batch: True if the moon is skipped as part of skip_moons, which sorts and autosaves the Clan once
+            all of its moons are done
         """
         game.cur_events_list = []
         game.herb_events_list = []
@@ -89,9 +94,9 @@ class Events:
         game.patrolled.clear()
         game.just_died.clear()
 
-        if any(
-            cat.status.rank.is_active_clan_rank() and cat.status.alive_in_player_clan
-            for cat in Cat.all_cats.values()
+        if Cat.all_cats.with_rank(
+            [rank for rank in CatRank if rank.is_active_clan_rank()],
+            group=CatGroup.PLAYER_CLAN,
         ):
             # todo: this links nowhere, can it be removed?
             switch_set_value(Switch.no_able_left, False)
@@ -182,11 +187,7 @@ class Events:
                 )
 
                 if len(ghost_names) > 2:
-                    alive_cats = [
-                        kitty
-                        for kitty in Cat.all_cats.values()
-                        if kitty.status.alive_in_player_clan
-                    ]
+                    alive_cats = Cat.all_cats.living_clan_cats()
 
                     # finds a percentage of the living Clan to become shaken
 
@@ -269,17 +270,16 @@ class Events:
         if game.clan.game_mode in ("expanded", "cruel season"):
             amount_per_med = get_amount_cat_for_one_medic(game.clan)
             med_fulfilled = medicine_cats_can_cover_clan(
-                Cat.all_cats.values(), amount_per_med
+                Cat.all_cats.living_clan_cats(), amount_per_med
             )
 
             if not med_fulfilled:
                 string = i18n.t("defaults.warn_low_medcats")
                 game.cur_events_list.insert(0, Single_Event(string, "health"))
         else:
-            has_med = any(
-                cat.status.rank.is_any_medicine_rank()
-                and cat.status.alive_in_player_clan
-                for cat in Cat.all_cats.values()
+            has_med = Cat.all_cats.with_rank(
+                (CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE),
+                group=CatGroup.PLAYER_CLAN,
             )
             if not has_med:
                 string = i18n.t("defaults.warn_no_medcats")
@@ -292,23 +292,75 @@ class Events:
         self.check_and_promote_leader()
         self.check_and_promote_deputy()
 
+        # Drop the loaded events whose files or language changed, the rest is kept for the next moon.
+        GenerateEvents.refresh_loaded_events()
+
+        if batch:
+            return
+
         # Resort
         if switch_get_value(Switch.sort_type) != "id":
-            Cat.sort_cats()
-
-        # Clear all the loaded event dicts.
-        GenerateEvents.clear_loaded_events()
+            with profiler.span("sorting"):
+                Cat.sort_cats()
 
         # autosave
         if get_clan_setting("autosave") and game.clan.age % 5 == 0:
-            try:
+            self.autosave()
+
+    @profiled("skip moons", root=True)
+    def skip_moons(self, moons: int):
+        """
+        Handles skipping several moons in a row. Only the moons themselves are simulated one after another, the
+        cats are sorted and the Clan is autosaved once at the end.
+        The events of all the moons are kept in game.cur_events_list, each moon's events after a heading with the
+        Clan's age. The herb events in game.herb_events_list are kept the same way, for the moons that had any.
+        :param moons: the number of moons to skip, stops early if there are no cats left in the Clan
+        """
+        skipped_events = []
+        skipped_herb_events = []
+        autosave = False
+        for _ in range(moons):
+            self.one_moon(batch=True)
+
+            heading = i18n.t("screens.events.skipped_moon", age=game.clan.age)
+            skipped_events.append(Single_Event(heading))
+            skipped_events.extend(game.cur_events_list)
+            if game.herb_events_list:
+                skipped_herb_events.append(heading)
+                skipped_herb_events.extend(game.herb_events_list)
+            if game.clan.age % 5 == 0:
+                autosave = True
+
+            if get_living_clan_cat_count(Cat) == 0:
+                break
+
+        game.cur_events_list = skipped_events
+        game.herb_events_list = skipped_herb_events
+
+        # Resort
+        if switch_get_value(Switch.sort_type) != "id":
+            with profiler.span("sorting"):
+                Cat.sort_cats()
+
+        # autosave
+        if get_clan_setting("autosave") and autosave:
+            self.autosave()
+
+    @staticmethod
+    @profiled("autosave")
+    def autosave():
+        """Saves the cats, Clan and events in the background"""
+        try:
+            with save_batch() as batch:
                 save_cats(switch_get_value(Switch.clan_name), Cat, game)
                 game.clan.save_clan()
                 game.clan.save_pregnancy(game.clan)
                 game.save_events()
-            except:
-                SaveError(traceback.format_exc())
+            save_in_background(batch)
+        except:
+            SaveError(traceback.format_exc())
 
+    @profiled("future events")
     def handle_future_events(self):
         """
         Handles aging future events and triggering them.
@@ -328,6 +380,7 @@ class Events:
             if event in game.clan.future_events:
                 game.clan.future_events.remove(event)
 
+    @profiled("leader den")
     def handle_lead_den_event(self):
         """
         Handles the events that are chosen in the leaders den the previous moon and resets the relevant clan settings
@@ -535,6 +588,7 @@ class Events:
                 )
                 cat.rank_change(CatRank.MEDIATOR)
 
+    @profiled("freshkill")
     def get_moon_freshkill(self):
         """Adding auto freshkill for the current moon."""
         healthy_hunter = list(
@@ -561,6 +615,7 @@ class Events:
         )
         game.clan.freshkill_pile.add_freshkill(prey_amount)
 
+    @profiled("focus")
     def handle_focus(self):
         """
         This function should be called late in the 'one_moon' function and handles all focuses which are possible to handle here:
@@ -763,6 +818,7 @@ class Events:
         if focus_text:
             game.cur_events_list.insert(0, Single_Event(focus_text, "misc"))
 
+    @profiled("lost cats")
     def handle_lost_cats_return(self, predetermined_cat_IDs: list = None):
         """
         TODO: DOCS
@@ -820,6 +876,7 @@ class Events:
                 elif not x.status.rank.is_any_apprentice_rank() and x.moons >= 6:
                     self.ceremony(x, CatRank.APPRENTICE)
 
+    @profiled("fading")
     def handle_fading(self, cat):
         """
         TODO: DOCS
@@ -878,6 +935,7 @@ class Events:
                 save_load.cat_to_fade.append(cat.ID)
                 cat.set_faded()
 
+    @profiled("outside cats")
     def one_moon_outside_cat(self, cat):
         """
         exiled cat events
@@ -894,6 +952,7 @@ class Events:
         if not cat.dead:
             OutsiderEvents.killing_outsiders(cat)
 
+    @profiled("cats")
     def one_moon_cat(self, cat):
         """
         Triggers various moon events for a cat.
@@ -1036,6 +1095,7 @@ class Events:
         self.WAR_TXT = load_lang_resource("events/war.json")
         Events.war_lang = i18n.config.get("locale")
 
+    @profiled("war")
     def check_war(self):
         """
         interactions with other clans
@@ -1132,6 +1192,7 @@ class Events:
         )
         game.cur_events_list.append(Single_Event(event, "other_clans"))
 
+    @profiled("ceremonies")
     def perform_ceremonies(self, cat):
         """
         ceremonies
@@ -1215,12 +1276,10 @@ class Events:
             # apprentice a kitten to either med or warrior
             if cat.moons == cat_class.age_moons[CatAge.ADOLESCENT][0]:
                 if cat.status.rank == CatRank.KITTEN:
-                    med_cat_list = [
-                        i
-                        for i in Cat.all_cats_list
-                        if i.status.rank.is_any_medicine_rank()
-                        and i.status.alive_in_player_clan
-                    ]
+                    med_cat_list = Cat.all_cats.with_rank(
+                        (CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE),
+                        group=CatGroup.PLAYER_CLAN,
+                    )
 
                     # check if the medicine cat is an elder
                     has_elder_med = [
@@ -1237,7 +1296,7 @@ class Events:
 
                     # check if the Clan has sufficient med cats
                     has_med = medicine_cats_can_cover_clan(
-                        Cat.all_cats.values(),
+                        Cat.all_cats.living_clan_cats(),
                         amount_per_med=get_amount_cat_for_one_medic(game.clan),
                     )
 
@@ -1659,6 +1718,7 @@ class Events:
         )
         # game.ceremony_events_list.append(f'{cat.name}{ceremony_text}')
 
+    @profiled("accessories")
     def gain_accessories(self, cat):
         """
         accessories
@@ -1798,6 +1858,7 @@ class Events:
 
             cat.experience += max(exp * mentor_modifier, 1)
 
+    @profiled("new cats")
     def invite_new_cats(self, cat):
         """
         new cats
@@ -1865,6 +1926,7 @@ class Events:
                 freshkill_pile=game.clan.freshkill_pile,
             )
 
+    @profiled("misc events")
     def other_interactions(self, cat):
         """
         TODO: DOCS
@@ -1887,6 +1949,7 @@ class Events:
             freshkill_pile=game.clan.freshkill_pile,
         )
 
+    @profiled("injuries and deaths")
     def handle_injuries_or_general_death(self, cat):
         """
         decide if cat dies
@@ -1976,6 +2039,7 @@ class Events:
 
             return triggered_death
 
+    @profiled("murder")
     def handle_murder(self, cat):
         """Handles murder"""
         relationships = cat.relationships.values()
@@ -2098,6 +2162,7 @@ class Events:
                     freshkill_pile=game.clan.freshkill_pile,
                 )
 
+    @profiled("illnesses")
     def handle_illnesses_or_illness_deaths(self, cat):
         """
         This function will handle:
@@ -2115,6 +2180,7 @@ class Events:
         )
         return triggered_death
 
+    @profiled("outbreaks")
     def handle_outbreaks(self, cat):
         """Try to infect some cats."""
         # check if the cat is ill,
@@ -2245,6 +2311,7 @@ class Events:
                 # game.health_events_list.append(event)
                 break
 
+    @profiled("coming out")
     def coming_out(self, cat):
         """turnin' the kitties trans..."""
 
@@ -2269,6 +2336,7 @@ class Events:
 
         return
 
+    @profiled("promotions")
     def check_and_promote_leader(self):
         """Checks if a new leader need to be promoted, and promotes them, if needed."""
         # check for leader
@@ -2299,6 +2367,7 @@ class Events:
                     ),
                 )
 
+    @profiled("promotions")
     def check_and_promote_deputy(self):
         # TODO: can these events be handled as ceremony events?
 
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: ascii -*-
+import logging
+import os
 import random
+import time
 
 import i18n
 import ujson
 
 from scripts.events_module.event_filters import (
-    event_for_location,
-    event_for_season,
     event_for_tags,
     event_for_reputation,
     event_for_cat,
@@ -18,6 +19,7 @@ from scripts.events_module.event_filters import (
 )
 from scripts.events_module.ongoing.ongoing_event import OngoingEvent
 from scripts.events_module.short.short_event import ShortEvent
+from scripts.events_module.short.short_event_index import ShortEventIndex
 from scripts.game_structure import constants
 from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.game_structure.game_essentials import game
@@ -26,11 +28,21 @@ from scripts.utility import (
     get_living_clan_cat_count,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def get_resource_directory(fallback=False):
     return f"resources/lang/{i18n.config.get('locale') if not fallback else i18n.config.get('fallback')}/events/"
 
 
+def get_modified_time(path):
+    """Returns the last modification time of the file, or None if it doesn't exist"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
 # ---------------------------------------------------------------------------- #
 #                Tagging Guidelines can be found at the bottom                 #
 # ---------------------------------------------------------------------------- #
@@ -38,6 +50,10 @@ def get_resource_directory(fallback=False):
 
 class GenerateEvents:
     loaded_events = {}
+    # load name: {path: modification time} of the files the loaded events were read from
+    loaded_events_files = {}
+    # the language and biome override the loaded events belong to
+    loaded_events_version = None
 
     with open(
         f"resources/dicts/conditions/injuries.json", "r", encoding="utf-8"
@@ -99,6 +115,42 @@ class GenerateEvents:
     @staticmethod
     def clear_loaded_events():
         GenerateEvents.loaded_events = {}
+        GenerateEvents.loaded_events_files = {}
+
+    @staticmethod
+    def check_loaded_events_version():
+        """Clear the loaded events if the language or biome override changed since they were loaded."""
+        version = (
+            i18n.config.get("locale"),
+            i18n.config.get("fallback"),
+            game.clan.override_biome if game.clan else None,
+        )
+        if version != GenerateEvents.loaded_events_version:
+            GenerateEvents.clear_loaded_events()
+            GenerateEvents.loaded_events_version = version
+
+    @staticmethod
+    def refresh_loaded_events():
+        """
+        Drop the loaded events which are out of date, so they're loaded again the next time they're needed.
+        All of them if the language or biome override changed, otherwise only the ones whose files were changed.
+        """
+        GenerateEvents.check_loaded_events_version()
+        for load_name, files in list(GenerateEvents.loaded_events_files.items()):
+            if any(
+                get_modified_time(path) != modified_time
+                for path, modified_time in files.items()
+            ):
+                GenerateEvents.loaded_events.pop(load_name, None)
+                del GenerateEvents.loaded_events_files[load_name]
+
+    @staticmethod
+    def get_short_event_file(file_path):
+        """Returns the path of the short event file in the loaded language, or the fallback language"""
+        path = get_resource_directory() + file_path
+        if os.path.exists(path):
+            return path
+        return get_resource_directory(fallback=True) + file_path
 
     @staticmethod
     def generate_short_events(event_triggered, biome, frequency):
@@ -109,6 +161,9 @@ class GenerateEvents:
             if load_name in GenerateEvents.loaded_events:
                 return GenerateEvents.loaded_events[load_name]
             else:
+                start_time = time.perf_counter()
+                source_path = GenerateEvents.get_short_event_file(file_path)
+                modified_time = get_modified_time(source_path)
                 events_dict = GenerateEvents.get_short_event_dicts(file_path)
 
                 event_list = []
@@ -165,6 +220,16 @@ class GenerateEvents:
 
                 # Add to loaded events.
                 GenerateEvents.loaded_events[load_name] = event_list
+                GenerateEvents.loaded_events_files[load_name] = {
+                    source_path: modified_time
+                }
+                logger.debug(
+                    "Loaded %d events from %s (frequency %s) in %.1f ms",
+                    len(event_list),
+                    file_path,
+                    frequency,
+                    (time.perf_counter() - start_time) * 1000,
+                )
                 return event_list
         except:
             print(f"WARNING: {file_path} was not found, check short event generation")
@@ -222,9 +287,7 @@ class GenerateEvents:
     def possible_short_events(
         frequency,
         event_type=None,
-    ):
-        event_list = []
-
+    ) -> ShortEventIndex:
         # skip the rest of the loading if there is an unrecognised biome
         temp_biome = (
             game.clan.biome
@@ -239,6 +302,13 @@ class GenerateEvents:
 
         biome = temp_biome.lower()
 
+        GenerateEvents.check_loaded_events_version()
+        load_name = f"{event_type}/{biome}+general_{frequency}"
+        if load_name in GenerateEvents.loaded_events:
+            return GenerateEvents.loaded_events[load_name]
+
+        event_list = []
+
         # biome specific events
         event_list.extend(
             GenerateEvents.generate_short_events(event_type, biome, frequency)
@@ -249,7 +319,17 @@ class GenerateEvents:
             GenerateEvents.generate_short_events(event_type, "general", frequency)
         )
 
-        return event_list
+        event_index = ShortEventIndex(event_list)
+        GenerateEvents.loaded_events[load_name] = event_index
+        GenerateEvents.loaded_events_files[load_name] = {
+            **GenerateEvents.loaded_events_files.get(
+                f"{event_type}/{biome}.json_{frequency}", {}
+            ),
+            **GenerateEvents.loaded_events_files.get(
+                f"{event_type}/general.json_{frequency}", {}
+            ),
+        }
+        return event_index
 
     @staticmethod
     def filter_possible_short_events(
@@ -266,31 +346,19 @@ class GenerateEvents:
         ignore_subtyping=False,
     ):
         final_events = []
-        incorrect_format = []
 
-        for event in possible_events:
-            if event.history:
-                if (
-                    not isinstance(event.history, list)
-                    or "cats" not in event.history[0]
-                ):
-                    if (
-                        f"{event.event_id} history formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} history formatted incorrectly"
-                        )
-            if event.injury:
-                if not isinstance(event.injury, list) or "cats" not in event.injury[0]:
-                    if (
-                        f"{event.event_id} injury formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} injury formatted incorrectly"
-                        )
+        # the index checks the format of the events once, and already leaves out events with the wrong
+        # sub_type, location or season
+        if not isinstance(possible_events, ShortEventIndex):
+            possible_events = ShortEventIndex(possible_events)
+        if constants.CONFIG["event_generation"]["debug_override_requirements"]:
+            candidate_events = possible_events
+        else:
+            candidate_events = possible_events.candidates(
+                None if ignore_subtyping else sub_types
+            )
 
+        for event in candidate_events:
             # check if event is in allowed or excluded
             if allowed_events and event.event_id not in allowed_events:
                 continue
@@ -302,17 +370,6 @@ class GenerateEvents:
                 final_events.append(event)
                 continue
 
-            # check for event sub_type
-            if not ignore_subtyping:
-                if set(event.sub_type) != set(sub_types):
-                    continue
-
-            if not event_for_location(event.location):
-                continue
-
-            if not event_for_season(event.season):
-                continue
-
             # check tags
             if not event_for_tags(event.tags, cat, random_cat):
                 continue
@@ -508,9 +565,6 @@ class GenerateEvents:
             else:
                 break
 
-        for notice in incorrect_format:
-            print(notice)
-
         return chosen_event, chosen_cat
 
     @staticmethod
@@ -15,12 +15,17 @@ from scripts.cat.enums import CatAge, CatRank
 from scripts.clan import Clan
 from scripts.clan_package.settings import get_clan_setting
 from scripts.events_module.event_filters import event_for_tags
+from scripts.events_module.patrol.patrol_catalogue import (
+    PATROL_TYPE_REQUIREMENTS,
+    PatrolIndex,
+    patrol_catalogue,
+    patrol_events_from_info,
+)
 from scripts.events_module.patrol.patrol_event import PatrolEvent
 from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
 from scripts.game_structure import localization, constants
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game_essentials import game
-from scripts.game_structure.localization import load_lang_resource
 from scripts.utility import (
     get_personality_compatibility,
     check_relationship_value,
@@ -34,6 +39,29 @@ from scripts.utility import (
 
 logger = logging.getLogger(__name__)
 
+# Patrol attribute: location of the patrol file it is loaded from
+PATROL_RESOURCES = {
+    "HUNTING_SZN": "{biome_dir}hunting/{leaf}.json",
+    "HUNTING": "{biome_dir}hunting/any.json",
+    "BORDER_SZN": "{biome_dir}border/{leaf}.json",
+    "BORDER": "{biome_dir}border/any.json",
+    "TRAINING_SZN": "{biome_dir}training/{leaf}.json",
+    "TRAINING": "{biome_dir}training/any.json",
+    "MEDCAT_SZN": "{biome_dir}med/{leaf}.json",
+    "MEDCAT": "{biome_dir}med/any.json",
+    "NEW_CAT": "new_cat.json",
+    "NEW_CAT_HOSTILE": "new_cat_hostile.json",
+    "NEW_CAT_WELCOMING": "new_cat_welcoming.json",
+    "OTHER_CLAN": "other_clan.json",
+    "OTHER_CLAN_HOSTILE": "other_clan_hostile.json",
+    "OTHER_CLAN_ALLIES": "other_clan_allies.json",
+    "HUNTING_GEN": "general/hunting.json",
+    "BORDER_GEN": "general/border.json",
+    "MEDCAT_GEN": "general/medcat.json",
+    "TRAINING_GEN": "general/training.json",
+    "DISASTER": "disaster.json",
+}
+
 # ---------------------------------------------------------------------------- #
 #                              PATROL CLASS START                              #
 # ---------------------------------------------------------------------------- #
@@ -288,7 +316,7 @@ class Patrol:
         biome_dir = f"{biome}/"
         self.update_resources(biome_dir, leaf)
 
-        possible_patrols = []
+        patrol_sources: List[PatrolIndex] = []
         # This is for debugging purposes, load-in *ALL* the possible patrols when debug_override_patrol_stat_requirements is true. (May require longer loading time)
         if constants.CONFIG["patrol_generation"][
             "debug_override_patrol_stat_requirements"
@@ -298,51 +326,8 @@ class Patrol:
                 for leaf in leaves:
                     biome_dir = f"{biome.lower()}/"
                     self.update_resources(biome_dir, leaf)
-                    possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_SZN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_GEN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
-                    possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                    )
+                    for patrol_property in PATROL_RESOURCES:
+                        patrol_sources.append(getattr(self, patrol_property))
 
         # this next one is needed for Classic specifically
         patrol_type = (
@@ -397,49 +382,42 @@ class Patrol:
             welcoming_rep = True
             chance = welcoming_chance
 
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_GEN))
+        patrol_sources.append(self.HUNTING)
+        patrol_sources.append(self.HUNTING_SZN)
+        patrol_sources.append(self.BORDER)
+        patrol_sources.append(self.BORDER_SZN)
+        patrol_sources.append(self.TRAINING)
+        patrol_sources.append(self.TRAINING_SZN)
+        patrol_sources.append(self.MEDCAT)
+        patrol_sources.append(self.MEDCAT_SZN)
+        patrol_sources.append(self.HUNTING_GEN)
+        patrol_sources.append(self.BORDER_GEN)
+        patrol_sources.append(self.TRAINING_GEN)
+        patrol_sources.append(self.MEDCAT_GEN)
 
         if game_setting_disaster:
             dis_chance = int(random.getrandbits(3))  # disaster patrol chance
             if dis_chance == 1:
-                possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
+                patrol_sources.append(self.DISASTER)
 
         # new cat patrols
         if chance == 1:
             if welcoming_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                )
+                patrol_sources.append(self.NEW_CAT_WELCOMING)
             elif neutral_rep:
-                possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
+                patrol_sources.append(self.NEW_CAT)
             elif hostile_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                )
+                patrol_sources.append(self.NEW_CAT_HOSTILE)
 
         # other Clan patrols
         if other_clan_chance == 1:
             if clan_neutral:
-                possible_patrols.extend(self.generate_patrol_events(self.OTHER_CLAN))
+                patrol_sources.append(self.OTHER_CLAN)
             elif clan_allies:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                )
+                patrol_sources.append(self.OTHER_CLAN_ALLIES)
             elif clan_hostile:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                )
+                patrol_sources.append(self.OTHER_CLAN_HOSTILE)
+        possible_patrols = [patrol for source in patrol_sources for patrol in source]
         patrol_ids = [patrol.patrol_id for patrol in possible_patrols]
         if self.debug_patrol and self.debug_patrol not in patrol_ids:
             print(
@@ -447,7 +425,7 @@ class Patrol:
             )
 
         final_patrols, final_romance_patrols = self.get_filtered_patrols(
-            possible_patrols, biome, camp, current_season, patrol_type
+            patrol_sources, biome, camp, current_season, patrol_type
         )
 
         # This is a debug option, this allows you to remove any constraints of a patrol regarding location, session, biomes, etc.
@@ -580,7 +558,7 @@ class Patrol:
 
     def _filter_patrols(
         self,
-        possible_patrols: List[PatrolEvent],
+        patrol_sources: List[PatrolIndex],
         biome: str,
         camp: str,
         current_season: str,
@@ -593,102 +571,96 @@ class Patrol:
         if patrol_type == "general":
             patrol_type = random.choice(["hunting", "border", "training"])
 
-        # makes sure that it grabs patrols in the correct biomes, season, with the correct number of cats
-        for patrol in possible_patrols:
-            if not self._check_constraints(patrol):
-                continue
+        # the index gives the patrols in the correct biomes, season, with the correct number of cats,
+        # only the checks depending on the patrol cats and the Clan are left
+        patrol_size = len(self.patrol_cats)
+        for source in patrol_sources:
+            normal_candidates, romantic_candidates = source.candidates(
+                biome, camp, current_season, patrol_type, patrol_size
+            )
+            if self.debug_patrol:
+                debug_event = source.find(self.debug_patrol)
+                if debug_event:
+                    self._debug_patrol_index_mismatch(
+                        debug_event, biome, camp, current_season, patrol_type
+                    )
 
-            # Don't check for repeat patrols if ensure_patrol_id is being used.
-            if (
-                not isinstance(
-                    constants.CONFIG["patrol_generation"]["debug_ensure_patrol_id"], str
-                )
-                and patrol.patrol_id in self.used_patrols
-            ):
-                continue
+            filtered_patrols.extend(
+                patrol for patrol in normal_candidates if self._patrol_allowed(patrol)
+            )
+            romantic_patrols.extend(
+                patrol for patrol in romantic_candidates if self._patrol_allowed(patrol)
+            )
 
-            if not (patrol.min_cats <= len(self.patrol_cats) <= patrol.max_cats):
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print(
-                        "DEBUG: requested patrol does not meet constraints (min or max cats range)"
-                    )
-                continue
+        # make sure the hunting patrols are balanced
+        if patrol_type == "hunting":
+            filtered_patrols = self.balance_hunting(filtered_patrols)
 
-            flag = False
-            for sta, num in patrol.min_max_status.items():
-                if len(num) != 2:
-                    print(f"Issue with status limits: {patrol.patrol_id}")
-                    continue
+        return filtered_patrols, romantic_patrols
 
-                if not (num[0] <= self.patrol_statuses.get(sta, -1) <= num[1]):
-                    flag = True
-                    break
-            if flag:
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print(
-                        "DEBUG: requested patrol does not meet constraints (min max status)"
-                    )
-                continue
+    def _patrol_allowed(self, patrol: PatrolEvent) -> bool:
+        """Checks the parts of a patrol which depend on the patrol cats and the Clan"""
+        if not self._check_constraints(patrol):
+            return False
 
-            if not event_for_tags(patrol.tags, Cat):
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print("DEBUG: requested patrol does not meet constraints (tags)")
-                continue
+        # Don't check for repeat patrols if ensure_patrol_id is being used.
+        if (
+            not isinstance(
+                constants.CONFIG["patrol_generation"]["debug_ensure_patrol_id"], str
+            )
+            and patrol.patrol_id in self.used_patrols
+        ):
+            return False
 
-            if biome not in patrol.biome and "any" not in patrol.biome:
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print("DEBUG: requested patrol does not meet constraints (biome)")
-                continue
-            if camp not in patrol.camp and "any" not in patrol.camp:
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print("DEBUG: requested patrol does not meet constraints (camp)")
-                continue
-            if current_season not in patrol.season and "any" not in patrol.season:
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print("DEBUG: requested patrol does not meet constraints (season)")
+        for sta, num in patrol.min_max_status.items():
+            if len(num) != 2:
+                print(f"Issue with status limits: {patrol.patrol_id}")
                 continue
 
-            if "hunting" not in patrol.types and patrol_type == "hunting":
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print(
-                        "DEBUG: requested patrol does not meet constraints (patrol type)"
-                    )
-                continue
-            elif "border" not in patrol.types and patrol_type == "border":
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print(
-                        "DEBUG: requested patrol does not meet constraints (patrol type)"
-                    )
-                continue
-            elif "training" not in patrol.types and patrol_type == "training":
+            if not (num[0] <= self.patrol_statuses.get(sta, -1) <= num[1]):
                 if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
                     print(
-                        "DEBUG: requested patrol does not meet constraints (patrol type)"
-                    )
-                continue
-            elif "herb_gathering" not in patrol.types and patrol_type == "med":
-                if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
-                    print(
-                        "DEBUG: requested patrol does not meet constraints (patrol type)"
+                        "DEBUG: requested patrol does not meet constraints (min max status)"
                     )
-                continue
+                return False
 
-            if "romantic" in patrol.tags:
-                romantic_patrols.append(patrol)
-            else:
-                filtered_patrols.append(patrol)
+        if not event_for_tags(patrol.tags, Cat):
+            if self.debug_patrol and self.debug_patrol == patrol.patrol_id:
+                print("DEBUG: requested patrol does not meet constraints (tags)")
+            return False
 
-        # make sure the hunting patrols are balanced
-        if patrol_type == "hunting":
-            filtered_patrols = self.balance_hunting(filtered_patrols)
+        return True
 
-        return filtered_patrols, romantic_patrols
+    def _debug_patrol_index_mismatch(
+        self,
+        patrol: PatrolEvent,
+        biome: str,
+        camp: str,
+        current_season: str,
+        patrol_type: str,
+    ):
+        """Prints why the requested debug patrol was left out by the patrol index, if it was"""
+        if not (patrol.min_cats <= len(self.patrol_cats) <= patrol.max_cats):
+            print(
+                "DEBUG: requested patrol does not meet constraints (min or max cats range)"
+            )
+        elif biome not in patrol.biome and "any" not in patrol.biome:
+            print("DEBUG: requested patrol does not meet constraints (biome)")
+        elif camp not in patrol.camp and "any" not in patrol.camp:
+            print("DEBUG: requested patrol does not meet constraints (camp)")
+        elif current_season not in patrol.season and "any" not in patrol.season:
+            print("DEBUG: requested patrol does not meet constraints (season)")
+        elif (
+            patrol_type in PATROL_TYPE_REQUIREMENTS
+            and PATROL_TYPE_REQUIREMENTS[patrol_type] not in patrol.types
+        ):
+            print("DEBUG: requested patrol does not meet constraints (patrol type)")
 
     def get_filtered_patrols(
-        self, possible_patrols, biome, camp, current_season, patrol_type
+        self, patrol_sources, biome, camp, current_season, patrol_type
     ):
         filtered_patrols, romantic_patrols = self._filter_patrols(
-            possible_patrols, biome, camp, current_season, patrol_type
+            patrol_sources, biome, camp, current_season, patrol_type
         )
 
         if patrol_type == "herb_gathering":
@@ -730,7 +702,7 @@ class Patrol:
             self.used_patrols.clear()
             print("used patrols cleared", self.used_patrols)
             filtered_patrols, romantic_patrols = self._filter_patrols(
-                possible_patrols, biome, camp, current_season, patrol_type
+                patrol_sources, biome, camp, current_season, patrol_type
             )
 
             if not filtered_patrols:
@@ -741,44 +713,7 @@ class Patrol:
         return filtered_patrols, romantic_patrols
 
     def generate_patrol_events(self, patrol_dict):
-        all_patrol_events = []
-        for patrol in patrol_dict:
-            patrol_event = PatrolEvent(
-                patrol_id=patrol.get("patrol_id"),
-                biome=patrol.get("biome"),
-                camp=patrol.get("camp"),
-                season=patrol.get("season"),
-                tags=patrol.get("tags"),
-                weight=patrol.get("weight", 20),
-                types=patrol.get("types"),
-                intro_text=patrol.get("intro_text"),
-                patrol_art=patrol.get("patrol_art"),
-                patrol_art_clean=patrol.get("patrol_art_clean"),
-                success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("success_outcomes")
-                ),
-                fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("fail_outcomes"), success=False
-                ),
-                decline_text=patrol.get("decline_text"),
-                chance_of_success=patrol.get("chance_of_success"),
-                min_cats=patrol.get("min_cats", 1),
-                max_cats=patrol.get("max_cats", 6),
-                min_max_status=patrol.get("min_max_status"),
-                antag_success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_success_outcomes"), antagonize=True
-                ),
-                antag_fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_fail_outcomes"), success=False, antagonize=True
-                ),
-                relationship_constraints=patrol.get("relationship_constraint"),
-                pl_skill_constraints=patrol.get("pl_skill_constraint"),
-                pl_trait_constraints=patrol.get("pl_trait_constraints"),
-            )
-
-            all_patrol_events.append(patrol_event)
-
-        return all_patrol_events
+        return patrol_events_from_info(patrol_dict)
 
     def determine_outcome(self, antagonize=False) -> Tuple[str, str, Optional[str]]:
         if self.patrol_event is None:
@@ -891,31 +826,14 @@ class Patrol:
         return (success_outcome if success else fail_outcome, success)
 
     def update_resources(self, biome_dir, leaf):
-        resources = [
-            ("HUNTING_SZN", f"{biome_dir}hunting/{leaf}.json"),
-            ("HUNTING", f"{biome_dir}hunting/any.json"),
-            ("BORDER_SZN", f"{biome_dir}border/{leaf}.json"),
-            ("BORDER", f"{biome_dir}border/any.json"),
-            ("TRAINING_SZN", f"{biome_dir}training/{leaf}.json"),
-            ("TRAINING", f"{biome_dir}training/any.json"),
-            ("MEDCAT_SZN", f"{biome_dir}med/{leaf}.json"),
-            ("MEDCAT", f"{biome_dir}med/any.json"),
-            ("NEW_CAT", "new_cat.json"),
-            ("NEW_CAT_HOSTILE", "new_cat_hostile.json"),
-            ("NEW_CAT_WELCOMING", "new_cat_welcoming.json"),
-            ("OTHER_CLAN", "other_clan.json"),
-            ("OTHER_CLAN_HOSTILE", "other_clan_hostile.json"),
-            ("OTHER_CLAN_ALLIES", "other_clan_allies.json"),
-            ("HUNTING_GEN", "general/hunting.json"),
-            ("BORDER_GEN", "general/border.json"),
-            ("MEDCAT_GEN", "general/medcat.json"),
-            ("TRAINING_GEN", "general/training.json"),
-            ("DISASTER", "disaster.json"),
-        ]
-        for patrol_property, location in resources:
+        for patrol_property, location in PATROL_RESOURCES.items():
             try:
                 setattr(
-                    self, patrol_property, load_lang_resource(f"patrols/{location}")
+                    self,
+                    patrol_property,
+                    patrol_catalogue.get(
+                        location.format(biome_dir=biome_dir, leaf=leaf)
+                    ),
                 )
             except:
                 raise Exception("Something went wrong loading patrols!")
@@ -0,0 +1,198 @@
+"""
+The patrol catalogue: every patrol file, parsed once into PatrolEvents.
+
+Patrols used to be read from their JSON and turned into PatrolEvents again for every patrol the player
+started. The catalogue keeps the PatrolEvents of each file for the loaded language instead, so only the
+first patrol in a biome and season pays for parsing them.
+
+Each file is kept as a PatrolIndex, which also indexes its patrols by everything about them that never
+changes. Finding the patrols for a biome, camp, season, patrol type and patrol size is then a few set
+intersections, and only the checks that depend on the Clan have to look at single patrols.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import i18n
+
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
+from scripts.game_structure.localization import load_lang_resource
+
+
+def patrol_events_from_info(patrol_dicts: List[dict]) -> List[PatrolEvent]:
+    """Create the PatrolEvents from the dicts of a patrol file"""
+    all_patrol_events = []
+    for patrol in patrol_dicts:
+        patrol_event = PatrolEvent(
+            patrol_id=patrol.get("patrol_id"),
+            biome=patrol.get("biome"),
+            camp=patrol.get("camp"),
+            season=patrol.get("season"),
+            tags=patrol.get("tags"),
+            weight=patrol.get("weight", 20),
+            types=patrol.get("types"),
+            intro_text=patrol.get("intro_text"),
+            patrol_art=patrol.get("patrol_art"),
+            patrol_art_clean=patrol.get("patrol_art_clean"),
+            success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("success_outcomes")
+            ),
+            fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("fail_outcomes"), success=False
+            ),
+            decline_text=patrol.get("decline_text"),
+            chance_of_success=patrol.get("chance_of_success"),
+            min_cats=patrol.get("min_cats", 1),
+            max_cats=patrol.get("max_cats", 6),
+            min_max_status=patrol.get("min_max_status"),
+            antag_success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_success_outcomes"), antagonize=True
+            ),
+            antag_fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_fail_outcomes"), success=False, antagonize=True
+            ),
+            relationship_constraints=patrol.get("relationship_constraint"),
+            pl_skill_constraints=patrol.get("pl_skill_constraint"),
+            pl_trait_constraints=patrol.get("pl_trait_constraints"),
+        )
+
+        all_patrol_events.append(patrol_event)
+
+    return all_patrol_events
+
+
+# patrol type: the type a patrol needs to have to be chosen for it
+PATROL_TYPE_REQUIREMENTS = {
+    "hunting": "hunting",
+    "border": "border",
+    "training": "training",
+    "med": "herb_gathering",
+}
+
+
+class PatrolIndex:
+    """
+    The PatrolEvents of one patrol file, indexed by biome, camp, season, type, number of cats and whether they
+    are romantic. Iterating over it gives the PatrolEvents in the order of the file.
+    """
+
+    def __init__(self, events: Iterable[PatrolEvent]):
+        self.events: Tuple[PatrolEvent, ...] = tuple(events)
+        self._by_biome = self._postings("biome")
+        self._by_camp = self._postings("camp")
+        self._by_season = self._postings("season")
+        self._by_type = self._postings("types")
+        self._romantic = {
+            slot for slot, event in enumerate(self.events) if "romantic" in event.tags
+        }
+        self._by_size: Dict[int, Set[int]] = {}
+        self._queries: Dict[tuple, Tuple[List[PatrolEvent], List[PatrolEvent]]] = {}
+
+    def _postings(self, attribute: str) -> Dict[str, Set[int]]:
+        postings = {}
+        for slot, event in enumerate(self.events):
+            for value in getattr(event, attribute):
+                postings.setdefault(value, set()).add(slot)
+        return postings
+
+    @staticmethod
+    def _matching(postings: Dict[str, Set[int]], value: str) -> Set[int]:
+        """The slots of the patrols which allow the value, or "any" value"""
+        return postings.get(value, set()) | postings.get("any", set())
+
+    def _fitting_size(self, patrol_size: int) -> Set[int]:
+        slots = self._by_size.get(patrol_size)
+        if slots is None:
+            slots = {
+                slot
+                for slot, event in enumerate(self.events)
+                if event.min_cats <= patrol_size <= event.max_cats
+            }
+            self._by_size[patrol_size] = slots
+        return slots
+
+    def candidates(
+        self, biome: str, camp: str, season: str, patrol_type: str, patrol_size: int
+    ) -> Tuple[List[PatrolEvent], List[PatrolEvent]]:
+        """
+        Returns the normal and the romantic patrols of the file which fit the biome, camp, season, patrol type and
+        number of cats, in the order of the file. Don't modify the returned lists, they are reused for the same
+        query.
+        """
+        key = (biome, camp, season, patrol_type, patrol_size)
+        result = self._queries.get(key)
+        if result is not None:
+            return result
+
+        slots = (
+            self._matching(self._by_biome, biome)
+            & self._matching(self._by_camp, camp)
+            & self._matching(self._by_season, season)
+            & self._fitting_size(patrol_size)
+        )
+        required_type = PATROL_TYPE_REQUIREMENTS.get(patrol_type)
+        if required_type:
+            slots &= self._by_type.get(required_type, set())
+
+        normal_patrols = []
+        romantic_patrols = []
+        for slot in sorted(slots):
+            if slot in self._romantic:
+                romantic_patrols.append(self.events[slot])
+            else:
+                normal_patrols.append(self.events[slot])
+
+        result = (normal_patrols, romantic_patrols)
+        self._queries[key] = result
+        return result
+
+    def find(self, patrol_id: str) -> Optional[PatrolEvent]:
+        for event in self.events:
+            if event.patrol_id == patrol_id:
+                return event
+        return None
+
+    def __iter__(self) -> Iterator[PatrolEvent]:
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+
+class PatrolCatalogue:
+    """
+    The PatrolEvents of every patrol file that has been asked for, for the loaded language.
+    The PatrolEvents are shared by all patrols, so they must be treated as read-only. The only exception is the
+    stat cat of their outcomes, which is chosen again for every patrol.
+    """
+
+    def __init__(self):
+        self._locale = None
+        self._files: Dict[str, PatrolIndex] = {}
+
+    def get(self, location: str) -> PatrolIndex:
+        """
+        Get the PatrolEvents of a patrol file, parsing it if this is the first time it's asked for.
+        :param location: location of the file, relative to the resources/lang/[language]/patrols/ folder
+        :exception FileNotFoundError: If the file doesn't exist in the selected locale or fallback
+        """
+        locale = (str(i18n.config.get("locale")), str(i18n.config.get("fallback")))
+        if locale != self._locale:
+            # language was changed, the patrols have to be read again
+            self._files.clear()
+            self._locale = locale
+
+        events = self._files.get(location)
+        if events is None:
+            events = PatrolIndex(
+                patrol_events_from_info(load_lang_resource(f"patrols/{location}"))
+            )
+            self._files[location] = events
+        return events
+
+    def clear(self):
+        """Forget all parsed patrols, e.g. after the patrol files were changed"""
+        self._files.clear()
+
+
+patrol_catalogue = PatrolCatalogue()
@@ -370,6 +370,9 @@ class PatrolOutcome:
         )
         print(f"Can Have Stat: {self.can_have_stat}")
 
+        # outcomes are shared between patrols, forget the stat cat of the last one
+        self.stat_cat = None
+
         # Grab any specfic stat cat requirements:
         allowed_specific = [
             x
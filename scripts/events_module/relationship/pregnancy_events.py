@@ -15,6 +15,7 @@ from scripts.events_module.short.condition_events import Condition_Events
 from scripts.game_structure import constants
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.localization import load_lang_resource
+from scripts.game_structure.profiling import profiled
 from scripts.utility import (
     create_new_cat,
     get_highest_romantic_relation,
@@ -29,7 +30,7 @@ from scripts.utility import (
 class Pregnancy_Events:
     """All events which are related to pregnancy such as kitting and defining who are the parents."""
 
-    biggest_family = {}
+    biggest_family = set()
     PREGNANT_STRINGS: Optional[Dict[str, Union[List, Dict[str, List]]]] = {}
     currently_loaded_lang: str = None
 
@@ -45,16 +46,18 @@ class Pregnancy_Events:
     @staticmethod
     def set_biggest_family():
         """Gets the biggest family of the clan."""
-        biggest_family = None
-        for cat in Cat.all_cats.values():
-            ancestors = cat.get_relatives()
-            if not biggest_family:
-                biggest_family = ancestors
-                biggest_family.append(cat.ID)
-            elif len(biggest_family) < len(ancestors) + 1:
-                biggest_family = ancestors
-                biggest_family.append(cat.ID)
-        Pregnancy_Events.biggest_family = biggest_family
+        biggest_cat = max(
+            Cat.all_cats.values(),
+            key=lambda cat: len(cat.get_relatives()),
+            default=None,
+        )
+        if biggest_cat is None:
+            Pregnancy_Events.biggest_family = set()
+            return
+        # a new set, so the cat isn't added to their own relatives
+        Pregnancy_Events.biggest_family = biggest_cat.get_relatives() | {
+            biggest_cat.ID
+        }
 
     @staticmethod
     def biggest_family_is_big():
@@ -66,12 +69,14 @@ class Pregnancy_Events:
         return len(Pregnancy_Events.biggest_family) > (living_cats / 10)
 
     @staticmethod
+    @profiled("pregnancy")
     def handle_pregnancy_age(clan):
         """Increase the moon for each pregnancy in the pregnancy dictionary"""
         for pregnancy_key in clan.pregnancy_data.keys():
             clan.pregnancy_data[pregnancy_key]["moons"] += 1
 
     @staticmethod
+    @profiled("pregnancy")
     def handle_having_kits(cat, clan):
         """Handles pregnancy of a cat."""
         if not clan:
@@ -723,7 +728,7 @@ class Pregnancy_Events:
         if not int(random.random() * chance):
             possible_affair_partners = [
                 i
-                for i in Cat.all_cats_list
+                for i in Cat.all_cats.mate_candidates(cat)
                 if i.is_potential_mate(cat, for_love_interest=True)
                 and (samesex or i.gender != cat.gender)
                 and i.ID not in cat.mate
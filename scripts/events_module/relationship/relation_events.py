@@ -10,6 +10,7 @@ from scripts.cat.enums import CatRank
 from scripts.events_module.relationship.group_events import GroupEvents
 from scripts.events_module.relationship.romantic_events import RomanticEvents
 from scripts.events_module.relationship.welcoming_events import Welcoming_Events
+from scripts.game_structure.profiling import profiled
 from scripts.utility import (
     get_cats_same_age,
     get_cats_of_romantic_interest,
@@ -31,6 +32,7 @@ class Relation_Events:
     del base_path
 
     @staticmethod
+    @profiled("relationships")
     def handle_relationships(cat: Cat):
         """Checks the relationships of the cat and trigger additional events if possible.
 
@@ -271,12 +273,7 @@ class Relation_Events:
     @staticmethod
     def cats_with_relationship_constraints(main_cat, constraint):
         """Returns a list of cats, where the relationship from main_cat towards the cat fulfill the given constraints."""
-        cat_list = list(
-            filter(
-                lambda cat: cat.status.alive_in_player_clan,
-                Cat.all_cats.values(),
-            )
-        )
+        cat_list = Cat.all_cats.living_clan_cats()
         cat_list.remove(main_cat)
         filtered_cat_list = []
 
@@ -30,6 +30,7 @@ from scripts.game_structure.game.switches import (
 )
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.localization import load_lang_resource
+from scripts.game_structure.profiling import profiled
 from scripts.utility import (
     event_text_adjust,
     find_alive_cats_with_rank,
@@ -129,6 +130,7 @@ class Condition_Events:
         cls.current_loaded_lang = i18n.config.get("locale")
 
     @staticmethod
+    @profiled("conditions")
     def handle_nutrient(cat: Cat, nutrition_info: dict) -> None:
         """
         Handles gaining conditions or death for cats with low nutrient.
@@ -254,6 +256,7 @@ class Condition_Events:
             )
 
     @staticmethod
+    @profiled("conditions")
     def handle_illnesses(cat, season=None):
         """
         This function handles the illnesses overall by randomly making cat ill (or not).
@@ -347,6 +350,7 @@ class Condition_Events:
         return triggered
 
     @staticmethod
+    @profiled("conditions")
     def handle_injuries(cat, random_cat=None):
         """
         This function handles injuries overall by randomly injuring cat (or not).
@@ -845,6 +849,7 @@ class Condition_Events:
         return triggered
 
     @staticmethod
+    @profiled("conditions")
     def handle_already_disabled(cat):
         """
         this function handles what happens if the cat already has a permanent condition.
@@ -1,3 +1,4 @@
+from copy import copy
 from random import choice, choices, randrange, sample, randint
 from typing import List
 
@@ -174,7 +175,8 @@ class HandleShortEvents:
         #                               do the event                                   #
         # ---------------------------------------------------------------------------- #
         if chosen_event:
-            self.chosen_event = chosen_event
+            # the loaded events are kept between moons, so this event's text mustn't be changed for this cat
+            self.chosen_event = copy(chosen_event)
             self.random_cat = random_cat
             self.future_event_failed = False
         else:
@@ -0,0 +1,94 @@
+"""
+An index of ShortEvents, so finding the events for a cat doesn't have to look at every event.
+
+The events are grouped by their sub_types, locations and seasons, which never change. A query only checks
+each group once against the Clan's location and season, and remembers the result for as long as the Clan
+stays where and when it is. The format of every event is also checked once, when the index is built.
+"""
+
+from heapq import merge
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from scripts.events_module.event_filters import event_for_location, event_for_season
+from scripts.events_module.short.short_event import ShortEvent
+from scripts.game_structure.game_essentials import game
+
+
+class ShortEventIndex:
+    """
+    ShortEvents grouped by sub_type, location and season. Iterating over the index gives the events in the
+    order they were added.
+    """
+
+    def __init__(self, events: Iterable[ShortEvent]):
+        self.events: Tuple[ShortEvent, ...] = tuple(events)
+        self._groups: Dict[
+            Tuple[FrozenSet[str], Tuple[str, ...], Tuple[str, ...]], List[int]
+        ] = {}
+        self._queries: Dict[tuple, List[ShortEvent]] = {}
+
+        self.incorrect_format: List[str] = []
+        for slot, event in enumerate(self.events):
+            key = (
+                frozenset(event.sub_type),
+                tuple(event.location),
+                tuple(event.season),
+            )
+            self._groups.setdefault(key, []).append(slot)
+            self._check_format(event)
+
+        for notice in self.incorrect_format:
+            print(notice)
+
+    def _check_format(self, event: ShortEvent):
+        if event.history and (
+            not isinstance(event.history, list) or "cats" not in event.history[0]
+        ):
+            notice = f"{event.event_id} history formatted incorrectly"
+            if notice not in self.incorrect_format:
+                self.incorrect_format.append(notice)
+        if event.injury and (
+            not isinstance(event.injury, list) or "cats" not in event.injury[0]
+        ):
+            notice = f"{event.event_id} injury formatted incorrectly"
+            if notice not in self.incorrect_format:
+                self.incorrect_format.append(notice)
+
+    def candidates(self, sub_types: Optional[Iterable[str]] = None) -> List[ShortEvent]:
+        """
+        Returns the events which can happen in the Clan's current location and season, in the order they were
+        added. Don't modify the returned list, it is reused for the same query.
+        :param sub_types: only return events with exactly these sub_types, None to ignore the sub_types
+        """
+        sub_types = frozenset(sub_types) if sub_types is not None else None
+        clan = game.clan
+        key = (
+            sub_types,
+            clan.biome,
+            clan.override_biome,
+            clan.camp_bg,
+            clan.current_season,
+        )
+        result = self._queries.get(key)
+        if result is not None:
+            return result
+
+        matching_groups = []
+        for (group_sub_types, locations, seasons), slots in self._groups.items():
+            if sub_types is not None and group_sub_types != sub_types:
+                continue
+            if not event_for_location(locations):
+                continue
+            if not event_for_season(seasons):
+                continue
+            matching_groups.append(slots)
+
+        result = [self.events[slot] for slot in merge(*matching_groups)]
+        self._queries[key] = result
+        return result
+
+    def __iter__(self) -> Iterator[ShortEvent]:
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
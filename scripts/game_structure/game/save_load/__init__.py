@@ -1,5 +1,15 @@
 from scripts.game_structure.game.save_load.save_load import (
     safe_save,
+    safe_remove,
     save_clanlist,
     read_clans,
+    SaveBatch,
+    BackgroundSave,
+    save_batch,
+    save_in_background,
+    background_save_running,
+    wait_for_background_saves,
+    collect_background_save_errors,
+    run_save_operation,
+    on_save_failure,
 )
@@ -1,21 +1,176 @@
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from shutil import move as shutil_move
-from typing import Union, List
+from typing import Callable, Union, List, Optional, Tuple
 
 import ujson
 
+from scripts.game_structure.propagating_thread import PropagatingThread
 from scripts.housekeeping.datadir import get_temp_dir, get_save_dir
 
 
+class SaveBatch:
+    """
+    The file operations of one save, collected on the main thread and carried out later, in order,
+    by a BackgroundSave. Data is serialized as it is collected, which snapshots it: the game can
+    keep changing the originals while the files are being written.
+    """
+
+    def __init__(self):
+        self.operations: List[Tuple[Callable, tuple]] = []
+        self.failure_callbacks: List[Tuple[Callable, tuple]] = []
+        self.done = 0
+
+    def add(self, function: Callable, *args):
+        self.operations.append((function, args))
+
+    def on_failure(self, function: Callable, *args):
+        """Call the function if the batch fails to be written"""
+        self.failure_callbacks.append((function, args))
+
+    def run(self):
+        try:
+            for function, args in self.operations:
+                function(*args)
+                self.done += 1
+        except BaseException:
+            # the rest of the batch isn't written either, so all of it has to be saved again
+            for function, args in self.failure_callbacks:
+                function(*args)
+            raise
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the operations that have been carried out, between 0 and 1"""
+        if not self.operations:
+            return 1.0
+        return self.done / len(self.operations)
+
+
+class BackgroundSave(PropagatingThread):
+    """
+    Carries out a SaveBatch on a worker thread. A save started while an earlier one is still being
+    written waits for it, so the files always end up in the order they were saved in.
+    """
+
+    def __init__(self, batch: SaveBatch, previous: Optional["BackgroundSave"] = None):
+        super().__init__(target=self._write, name="save_thread")
+        self.batch = batch
+        self.previous = previous
+        self.finished = threading.Event()
+
+    def _write(self):
+        if self.previous is not None:
+            # an error in the earlier save is reported for that save
+            self.previous.finished.wait()
+            self.previous = None
+        self.batch.run()
+
+    def run(self):
+        try:
+            super().run()
+        finally:
+            self.finished.set()
+
+    @property
+    def progress(self) -> float:
+        return self.batch.progress
+
+
+_collecting = threading.local()
+_background_saves: List[BackgroundSave] = []
+
+
+@contextmanager
+def save_batch():
+    """
+    Collect every safe_save and run_save_operation made on this thread into a SaveBatch, instead
+    of carrying them out right away. Hand the batch to save_in_background afterwards.
+    """
+    batch = SaveBatch()
+    _collecting.batch = batch
+    try:
+        yield batch
+    finally:
+        _collecting.batch = None
+
+
+def save_in_background(batch: SaveBatch) -> BackgroundSave:
+    """Start writing the collected save on a worker thread"""
+    previous = _background_saves[-1] if _background_saves else None
+    save_thread = BackgroundSave(batch, previous)
+    _background_saves.append(save_thread)
+    save_thread.start()
+    return save_thread
+
+
+def background_save_running() -> bool:
+    return any(not save_thread.finished.is_set() for save_thread in _background_saves)
+
+
+def wait_for_background_saves():
+    """Block until every save started in the background has been written"""
+    for save_thread in list(_background_saves):
+        save_thread.finished.wait()
+
+
+def collect_background_save_errors() -> List[BaseException]:
+    """Forget the background saves that have finished, and return the errors they ran into"""
+    errors = [
+        save_thread.exc
+        for save_thread in _background_saves
+        if save_thread.finished.is_set() and save_thread.exc is not None
+    ]
+    _background_saves[:] = [
+        save_thread
+        for save_thread in _background_saves
+        if not save_thread.finished.is_set()
+    ]
+    return errors
+
+
+def run_save_operation(function: Callable, *args):
+    """
+    Carry out a file operation that belongs to a save, such as removing an outdated file.
+    While a save batch is being collected on this thread, the operation is added to it instead.
+    """
+    batch = getattr(_collecting, "batch", None)
+    if batch is not None:
+        batch.add(function, *args)
+        return
+    # don't write over files that a background save still has to write
+    wait_for_background_saves()
+    function(*args)
+
+
+def on_save_failure(function: Callable, *args):
+    """
+    Call the function if the save that is being collected on this thread fails to be written, so the
+    data that was taken as saved can be marked as changed again. Outside a save batch a failed file
+    operation raises right away, so there is nothing to do.
+    """
+    batch = getattr(_collecting, "batch", None)
+    if batch is not None:
+        batch.on_failure(function, *args)
+
+
 def safe_save(
-    path: Union[str, Path], write_data, check_integrity=False, max_attempts: int = 15
+    path: Union[str, Path],
+    write_data,
+    check_integrity=False,
+    max_attempts: int = 15,
+    atomic=False,
 ):
     """If write_data is not a string, assumes you want this
     in json format. If check_integrity is true, it will read back the file
     to check that the correct data has been written to the file.
+    If atomic is true, the data is written next to the file first and then
+    swapped in, so the old file stays intact if writing fails.
     If not, it will simply write the data to the file with no other
-    checks."""
+    checks.
+    While a save batch is being collected, the write is added to the batch."""
 
     # If write_data is not a string,
     if type(write_data) is not str:
@@ -23,6 +178,31 @@ def safe_save(
     else:
         _data = write_data
 
+    run_save_operation(
+        _write_save_file, path, _data, check_integrity, max_attempts, atomic
+    )
+
+
+def safe_remove(path: Union[str, Path]):
+    """Remove a file of the save, if it exists.
+    While a save batch is being collected, the removal is added to the batch."""
+    run_save_operation(_remove_save_file, path)
+
+
+def _remove_save_file(path: Union[str, Path]):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_save_file(
+    path: Union[str, Path],
+    _data: str,
+    check_integrity: bool,
+    max_attempts: int,
+    atomic: bool,
+):
     dir_name, file_name = os.path.split(path)
 
     if check_integrity:
@@ -58,6 +238,14 @@ def safe_save(
 
             shutil_move(temp_file_path, path)
             return
+    elif atomic:
+        os.makedirs(dir_name, exist_ok=True)
+        temp_file_path = f"{path}.tmp"
+        with open(temp_file_path, "w", encoding="utf-8") as write_file:
+            write_file.write(_data)
+            write_file.flush()
+            os.fsync(write_file.fileno())
+        os.replace(temp_file_path, path)
     else:
         os.makedirs(dir_name, exist_ok=True)
         with open(path, "w", encoding="utf-8") as write_file:
@@ -79,6 +79,7 @@ class Game:
         "showbounds": False,
         "visualdebugmode": False,
         "showfps": False,
+        "showtimeskip": False,
     }
 
     # CLAN
@@ -166,30 +167,15 @@ class Game:
 
     def add_faded_offspring_to_faded_cat(self, parent, offspring):
         """In order to siblings to work correctly, and not to lose relation info on fading, we have to keep track of
-        both active and faded cat's faded offpsring. This will add a faded offspring to a faded parents file.
+        both active and faded cat's faded offpsring. This will add a faded offspring to a faded parent in the faded
+        archive.
         """
-        try:
-            with open(
-                get_save_dir()
-                + "/"
-                + self.clan.name
-                + "/faded_cats/"
-                + parent
-                + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
-        except:
+        from scripts.cat.faded_archive import faded_archive
+
+        if not faded_archive.add_faded_offspring(self.clan.name, parent, offspring):
             print("ERROR: loading faded cat")
             return False
 
-        cat_info["faded_offspring"].append(offspring)
-
-        safe_save(
-            f"{get_save_dir()}/{self.clan.name}/faded_cats/{parent}.json", cat_info
-        )
-
         return True
 
     def load_events(self):
@@ -9,7 +9,10 @@ import ujson
 from scripts.cat.cats import Cat, BACKSTORIES
 from ..cat.enums import CatGroup, CatRank
 from scripts.cat.pelts import Pelt
-from scripts.cat_relations.inheritance import Inheritance
+from scripts.cat.faded_archive import faded_archive
+from scripts.cat.save_load import RELATIONSHIP_FILE, load_relationships
+from scripts.cat_relations.inheritance import Inheritance, family_graph
+from scripts.cat_relations.relationship_store import relationship_index
 from scripts.game_structure.game.switches import (
     switch_get_value,
     switch_set_value,
@@ -41,6 +44,9 @@ def load_cats():
 
 def json_load():
     Cat.all_cats.clear()
+    relationship_index.reset()
+    family_graph.reset()
+    faded_archive.reset()
     Cat.all_cats_list.clear()
     Cat.dead_cats.clear()
     all_cats = []
@@ -293,6 +299,17 @@ def json_load():
             switch_set_value(Switch.traceback, e)
             raise
 
+    try:
+        relationships_loaded = load_relationships(clanname, Cat)
+    except Exception as e:
+        logger.exception("There was an error loading the relationship file.")
+        switch_set_value(
+            Switch.error_message,
+            f"There was an error loading {RELATIONSHIP_FILE}.",
+        )
+        switch_set_value(Switch.traceback, e)
+        raise
+
     # replace cat ids with cat objects and add other needed variables
     for cat in all_cats:
         cat.load_conditions()
@@ -306,7 +323,8 @@ def json_load():
         # load the relationships
         try:
             if not cat.dead:
-                cat.load_relationship_of_cat()
+                if not relationships_loaded:
+                    cat.load_relationship_of_cat()
                 if cat.relationships is not None and len(cat.relationships) < 1:
                     cat.init_all_relationships()
             else:
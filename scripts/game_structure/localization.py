@@ -1,5 +1,6 @@
 import os.path
-from typing import List, Dict, Union, Optional
+from collections import OrderedDict
+from typing import List, Dict, Union, Optional, Tuple, Any
 
 import i18n
 import i18n.translations
@@ -14,6 +15,11 @@ _directory_changed: bool = False
 
 default_pronouns: Dict[str, Dict[str, Dict[str, Union[str, int]]]] = {}
 
+RESOURCE_CACHE_MAX_ENTRIES = 512
+_resource_cache: "OrderedDict[Tuple[str, str, str, str], Any]" = OrderedDict()
+_resource_cache_locale: Optional[Tuple[str, str]] = None
+_resource_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
 
 def get_new_pronouns(genderalign: str) -> List[Dict[str, Union[str, int]]]:
     """
@@ -68,20 +74,53 @@ def get_default_adj():
 
 def load_lang_resource(location: str, *, root_directory=None):
     """
-    Get a resource from the resources/lang folder for the loaded language
+    Get a resource from the resources/lang folder for the loaded language.
+    Parsed resources are cached, so the returned object is shared between callers
+    and must be treated as read-only. Copy it first if you need to modify it.
     :param location: If the language code is required, substitute `{lang}`. Relative location
     from the resources/lang/[language]/ folder. Don't include a slash.
     :param root_directory: for testing only.
     :return: Whatever resource was there, from either the locale or fallback
     :exception FileNotFoundError: If requested resource doesn't exist in selected locale or fallback
     """
+    global _resource_cache_locale
     location = os.path.normpath(location)
     locale, fallback = str(i18n.config.get("locale")), str(i18n.config.get("fallback"))
     if root_directory is None:
         root_directory = os.path.join("resources", "lang")
+    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
+
+    if _resource_cache_locale != (locale, fallback):
+        # language was changed, none of the old entries will be asked for again
+        _resource_cache.clear()
+        _resource_cache_locale = (locale, fallback)
+
+    key = (locale, fallback, root_directory, location)
+    try:
+        resource = _resource_cache[key]
+    except KeyError:
+        pass
+    else:
+        _resource_cache.move_to_end(key)
+        _resource_cache_stats["hits"] += 1
+        return resource
+
+    _resource_cache_stats["misses"] += 1
+    resource = _read_lang_resource(location, locale, fallback, root_directory)
+    _resource_cache[key] = resource
+    if len(_resource_cache) > RESOURCE_CACHE_MAX_ENTRIES:
+        _resource_cache.popitem(last=False)
+        _resource_cache_stats["evictions"] += 1
+    return resource
+
+
+def _read_lang_resource(location: str, locale: str, fallback: str, root_directory):
+    """
+    Read and parse a resource from disk, ignoring the cache.
+    :exception FileNotFoundError: If requested resource doesn't exist in selected locale or fallback
+    """
     resource_directory = os.path.join(root_directory, locale)
     fallback_directory = os.path.join(root_directory, fallback)
-    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
     try:
         with open(
             os.path.join(resource_directory, location.replace("{lang}", locale)),
@@ -98,6 +137,22 @@ def load_lang_resource(location: str, *, root_directory=None):
             return ujson.loads(string_file.read())
 
 
+def clear_lang_resource_cache():
+    """
+    Drop every cached resource, forcing the next load_lang_resource calls to hit the disk.
+    Useful if the files in resources/lang have been edited while the game is running.
+    :return: Nothing
+    """
+    _resource_cache.clear()
+
+
+def get_lang_resource_cache_stats() -> Dict[str, int]:
+    """
+    :return: hit/miss/eviction counters for the resource cache, plus its current size
+    """
+    return {**_resource_cache_stats, "size": len(_resource_cache)}
+
+
 def get_lang_config() -> Dict:
     """
     :return: the config file for the currently-loaded language. Raises error if config doesn't exist.
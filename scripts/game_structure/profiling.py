@@ -0,0 +1,157 @@
+"""
+Lightweight profiling of the moon pipeline.
+
+Code marks the work it does with named spans, either with the `profiled` decorator or the `profiler.span()`
+context manager. A breakdown starts with a root span, like a moon; other spans are only timed inside one, so the
+same functions called by the UI don't show up. Spans opened inside another span are nested in it, and calls of
+the same span inside the same parent are added together, so the breakdown of a timeskip stays small however
+many cats take part in it.
+
+Nothing is timed unless the profiler is enabled, from the debug console with `profile on`.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+
+class Span:
+    """The time spent in a named piece of work, and in the spans opened inside it"""
+
+    __slots__ = ("name", "calls", "time", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.time = 0.0
+        self.children: Dict[str, Span] = {}
+
+    def child(self, name: str) -> "Span":
+        span = self.children.get(name)
+        if span is None:
+            span = Span(name)
+            self.children[name] = span
+        return span
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "time": self.time,
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+    def lines(self, depth: int = 0, min_share: float = 0.0) -> List[str]:
+        """
+        The span and its children as lines of text, the slowest children first
+        :param depth: how far to indent the span
+        :param min_share: leave out children that took less than this share of the span's time
+        """
+        calls = f" x{self.calls}" if self.calls > 1 else ""
+        lines = [f"{'  ' * depth}{self.name}: {self.time * 1000:.1f} ms{calls}"]
+        for child in sorted(self.children.values(), key=lambda s: -s.time):
+            if self.time and child.time / self.time < min_share:
+                continue
+            lines.extend(child.lines(depth + 1, min_share))
+        return lines
+
+
+class _OpenSpan:
+    __slots__ = ("profiler", "name", "span", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack()
+        self.span = stack[-1].child(self.name) if stack else Span(self.name)
+        stack.append(self.span)
+        self.start = time.perf_counter()
+        return self.span
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profiler._stack()
+        stack.pop()
+        self.span.calls += 1
+        self.span.time += elapsed
+
+        # the totals only count the outermost span of a name, so recursion isn't counted twice
+        if all(open_span.name != self.name for open_span in stack):
+            total = self.profiler.totals.setdefault(self.name, [0, 0.0])
+            total[0] += 1
+            total[1] += elapsed
+
+        if not stack:
+            self.profiler.latest = self.span
+            self.profiler.runs += 1
+        return False
+
+
+class Profiler:
+    """
+    Collects the spans. The breakdown of the last finished outermost span is kept in `latest`, the number of
+    calls and total time of every span name since the last reset in `totals`.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.latest: Optional[Span] = None
+        self.totals: Dict[str, List] = {}
+        self.runs = 0
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def span(self, name: str, root: bool = False):
+        """
+        Context manager timing the code inside it as the span `name`, if the profiler is enabled
+        :param root: if the span starts a breakdown, otherwise it's only timed inside another span
+        """
+        if not self.enabled or not (root or self._stack()):
+            return nullcontext()
+        return _OpenSpan(self, name)
+
+    def reset(self):
+        """Forget the latest breakdown and the totals"""
+        self.latest = None
+        self.totals = {}
+
+    def total_lines(self) -> List[str]:
+        """The totals as lines of text, the slowest first"""
+        return [
+            f"{name}: {total * 1000:.1f} ms in {calls} calls"
+            for name, (calls, total) in sorted(
+                self.totals.items(), key=lambda item: -item[1][1]
+            )
+        ]
+
+
+profiler = Profiler()
+
+
+def profiled(name: str, root: bool = False) -> Callable:
+    """
+    Decorator timing every call of the function as the span `name`, if the profiler is enabled
+    :param root: if the span starts a breakdown, otherwise it's only timed inside another span
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            with profiler.span(name, root):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
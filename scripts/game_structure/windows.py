@@ -22,6 +22,7 @@ from scripts.cat.history import History
 from scripts.cat.names import Name
 from scripts.cat.save_load import save_cats
 from scripts.game_structure import image_cache
+from scripts.game_structure.game.save_load import save_batch, save_in_background
 from scripts.game_structure.game.switches import (
     Switch,
     switch_get_value,
@@ -326,6 +327,19 @@ class SaveCheck(UIWindow):
         self.back_button.enable()
         self.main_menu_button.enable()
         self.set_blocking(True)
+        self.save_thread = None
+
+    def update(self, time_delta: float):
+        if self.save_thread is not None and self.save_thread.finished.is_set():
+            self.save_button_saving_state.hide()
+            if self.save_thread.exc is None:
+                self.save_button_saved_state.show()
+            else:
+                # the error is shown by the main loop
+                self.save_button.enable()
+            self.save_thread = None
+
+        super().update(time_delta)
 
     def process_event(self, event):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
@@ -344,12 +358,12 @@ class SaveCheck(UIWindow):
                 if game.clan is not None:
                     self.save_button_saving_state.show()
                     self.save_button.disable()
-                    save_cats(switch_get_value(Switch.clan_name), Cat, game)
-                    game.clan.save_clan()
-                    game.clan.save_pregnancy(game.clan)
-                    game.save_events()
-                    self.save_button_saving_state.hide()
-                    self.save_button_saved_state.show()
+                    with save_batch() as batch:
+                        save_cats(switch_get_value(Switch.clan_name), Cat, game)
+                        game.clan.save_clan()
+                        game.clan.save_pregnancy(game.clan)
+                        game.save_events()
+                    self.save_thread = save_in_background(batch)
             elif event.ui_element == self.back_button:
                 game.is_close_menu_open = False
                 self.kill()
@@ -7,6 +7,7 @@ import pygame_gui
 from pygame_gui.core import ObjectID
 
 from scripts.cat.cats import Cat
+from scripts.cat.sprites import SpriteCache
 from scripts.game_structure import image_cache, constants
 from scripts.game_structure.game.settings import game_settings_save, game_setting_get
 from scripts.game_structure.game_essentials import (
@@ -28,6 +29,7 @@ from .Screens import Screens
 from ..cat.save_load import save_cats
 from ..clan_package.settings import get_clan_setting
 from ..clan_package.settings.clan_settings import set_clan_setting
+from ..game_structure.game.save_load import save_batch, save_in_background
 from ..game_structure.game.switches import switch_set_value, switch_get_value, Switch
 from ..cat.enums import CatRank
 from ..ui.generate_button import ButtonStyles, get_button_dict
@@ -54,29 +56,26 @@ class ClanScreen(Screens):
         self.leader_den_label = None
         self.warrior_den_label = None
         self.layout = None
+        self.save_thread = None
+        self.save_progress = None
+        # what the camp backgrounds were last loaded for, see update_camp_bg
+        self.camp_bg_key = None
+        # blurred pieces of the camp backgrounds behind the cats, by background, placement and blur
+        self.blend_layers = {}
+        # cat sprites shaded by the background behind them, see get_shaded_sprite
+        self.shaded_sprites = SpriteCache()
 
     def on_use(self):
         if not get_clan_setting("backgrounds"):
             self.set_bg(None)
+        self.update_save_progress()
         super().on_use()
 
     def handle_event(self, event):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
             self.mute_button_pressed(event)
             if event.ui_element == self.save_button:
-                try:
-                    self.save_button_saving_state.show()
-                    self.save_button.disable()
-                    save_cats(switch_get_value(Switch.clan_name), Cat, game)
-                    game.clan.save_clan()
-                    game.clan.save_pregnancy(game.clan)
-                    game.save_events()
-                    game_settings_save(self)
-                    switch_set_value(Switch.saved_clan, True)
-                    self.update_buttons_and_text()
-                except RuntimeError:
-                    SaveError(traceback.format_exc())
-                    self.change_screen("start screen")
+                self.save_clan()
             if event.ui_element in self.cat_buttons:
                 switch_set_value(Switch.cat, event.ui_element.return_cat_id())
                 self.change_screen("profile screen")
@@ -102,15 +101,46 @@ class ClanScreen(Screens):
             elif event.key == pygame.K_LEFT:
                 self.change_screen("events screen")
             elif event.key == pygame.K_SPACE:
-                self.save_button_saving_state.show()
-                self.save_button.disable()
+                self.save_clan()
+
+    def save_clan(self):
+        """Start saving the Clan in the background. on_use shows the progress."""
+        try:
+            self.save_button_saving_state.show()
+            self.save_button.disable()
+            with save_batch() as batch:
                 save_cats(switch_get_value(Switch.clan_name), Cat, game)
                 game.clan.save_clan()
                 game.clan.save_pregnancy(game.clan)
                 game.save_events()
                 game_settings_save(self)
-                switch_set_value(Switch.saved_clan, True)
-                self.update_buttons_and_text()
+            self.save_thread = save_in_background(batch)
+        except RuntimeError:
+            SaveError(traceback.format_exc())
+            self.change_screen("start screen")
+
+    def update_save_progress(self):
+        """Update the save button while a save is being written, and once it is done"""
+        if self.save_thread is None:
+            return
+        if not self.save_thread.finished.is_set():
+            progress = int(self.save_thread.progress * 100)
+            if progress != self.save_progress:
+                self.save_progress = progress
+                self.save_button_saving_state.set_text(
+                    "buttons.saving_progress", text_kwargs={"progress": progress}
+                )
+            return
+
+        failed = self.save_thread.exc is not None
+        self.save_thread = None
+        self.save_progress = None
+        if failed:
+            # the error itself is shown once the save thread is collected
+            self.change_screen("start screen")
+            return
+        switch_set_value(Switch.saved_clan, True)
+        self.update_buttons_and_text()
 
     def screen_switches(self):
         super().screen_switches()
@@ -159,48 +189,10 @@ class ClanScreen(Screens):
             used_positions.remove(place)
 
             try:
-                image = x.sprite.convert_alpha()
-                try:
-                    blend_layer = (
-                        self.game_bgs[self.active_bg]
-                        .subsurface(ui_scale(pygame.Rect(tuple(x.placement), (50, 50))))
-                        .convert_alpha()
-                    )
-                    blend_layer = pygame.transform.box_blur(
-                        blend_layer, self.layout["cat_shading"]["blur"]
-                    )
-                except ValueError:
-                    x_diff = ui_scale_value(
-                        50 + (x.placement[0] if x.placement[0] < 0 else 0)
-                    )
-                    y_diff = ui_scale_value(
-                        50 + (x.placement[1] if x.placement[1] < 0 else 0)
-                    )
-                    avg_layer = self.game_bgs[self.active_bg].subsurface(
-                        ui_scale(
-                            pygame.Rect(
-                                (
-                                    x.placement[0] if x.placement[0] > 0 else 0,
-                                    x.placement[1] if x.placement[1] > 0 else 0,
-                                ),
-                                (x_diff, y_diff),
-                            )
-                        )
-                    )
-                    blend_layer = pygame.Surface(ui_scale_dimensions((50, 50)))
-                    blend_layer.fill(pygame.transform.average_color(avg_layer))
-
-                sprite = image.copy()
-                sprite.fill((255, 255, 255, 255), special_flags=pygame.BLEND_RGB_MAX)
-                sprite.blit(blend_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                image.set_alpha(self.layout["cat_shading"]["blend_strength"])
-                sprite.blit(image, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-                sprite.set_alpha(255)
-
                 self.cat_buttons.append(
                     UISpriteButton(
                         ui_scale(pygame.Rect(tuple(x.placement), (50, 50))),
-                        sprite,
+                        self.get_shaded_sprite(x),
                         mask=x.sprite_mask,
                         cat_id=x.ID,
                         starting_height=layers[-1],
@@ -357,6 +349,8 @@ class ClanScreen(Screens):
 
         # reset save status
         switch_set_value(Switch.saved_clan, False)
+        self.save_thread = None
+        self.save_progress = None
 
     def update_camp_bg(self):
         light_dark = "dark" if game_setting_get("dark mode") else "light"
@@ -376,6 +370,16 @@ class ClanScreen(Screens):
             game.clan.biome = biome
         biome = biome.lower()
 
+        # the backgrounds are only loaded again when something they depend on changed
+        camp_bg_key = (biome, camp_nr, light_dark, ui_scale_dimensions((800, 700)))
+        if camp_bg_key == self.camp_bg_key:
+            self.set_bg(get_current_season())
+            return
+        self.camp_bg_key = camp_bg_key
+        # the shading was made from the old backgrounds
+        self.blend_layers.clear()
+        self.shaded_sprites.clear()
+
         all_backgrounds = []
         for leaf in leaves:
             platform_dir = (
@@ -412,6 +416,72 @@ class ClanScreen(Screens):
 
         self.set_bg(get_current_season())
 
+    def get_blend_layer(self, placement: tuple, blur: int) -> pygame.Surface:
+        """Returns the blurred piece of the active background behind a cat at the placement"""
+        key = (self.active_bg, placement, blur)
+        blend_layer = self.blend_layers.get(key)
+        if blend_layer is not None:
+            return blend_layer
+
+        try:
+            blend_layer = (
+                self.game_bgs[self.active_bg]
+                .subsurface(ui_scale(pygame.Rect(placement, (50, 50))))
+                .convert_alpha()
+            )
+            blend_layer = pygame.transform.box_blur(blend_layer, blur)
+        except ValueError:
+            x_diff = ui_scale_value(50 + (placement[0] if placement[0] < 0 else 0))
+            y_diff = ui_scale_value(50 + (placement[1] if placement[1] < 0 else 0))
+            avg_layer = self.game_bgs[self.active_bg].subsurface(
+                ui_scale(
+                    pygame.Rect(
+                        (
+                            placement[0] if placement[0] > 0 else 0,
+                            placement[1] if placement[1] > 0 else 0,
+                        ),
+                        (x_diff, y_diff),
+                    )
+                )
+            )
+            blend_layer = pygame.Surface(ui_scale_dimensions((50, 50)))
+            blend_layer.fill(pygame.transform.average_color(avg_layer))
+
+        self.blend_layers[key] = blend_layer
+        return blend_layer
+
+    def get_shaded_sprite(self, cat) -> pygame.Surface:
+        """
+        Returns the cat's sprite shaded by the camp background behind it. The result only depends on the sprite,
+        the placement, the background and the shading of the layout, so it's cached by those and shared between
+        cats that look the same.
+        """
+        shading = self.layout["cat_shading"]
+        placement = tuple(cat.placement)
+        key = (
+            cat.sprite,
+            placement,
+            self.active_bg,
+            shading["blur"],
+            shading["blend_strength"],
+        )
+        sprite = self.shaded_sprites.get(key)
+        if sprite is not None:
+            return sprite
+
+        image = cat.sprite.convert_alpha()
+        blend_layer = self.get_blend_layer(placement, shading["blur"])
+
+        sprite = image.copy()
+        sprite.fill((255, 255, 255, 255), special_flags=pygame.BLEND_RGB_MAX)
+        sprite.blit(blend_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        image.set_alpha(shading["blend_strength"])
+        sprite.blit(image, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        sprite.set_alpha(255)
+
+        self.shaded_sprites.put(key, sprite)
+        return sprite
+
     def choose_nonoverlapping_positions(self, first_choices, dens, weights=None):
         if not weights:
             weights = [1] * len(dens)
@@ -1,4 +1,5 @@
-from typing import Dict
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
 
 import i18n
 import pygame
@@ -7,7 +8,7 @@ import pygame_gui
 from scripts.cat.cats import Cat
 from scripts.event_class import Single_Event
 from scripts.events import events_class
-from scripts.game_structure import image_cache
+from scripts.game_structure import constants, image_cache
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game.switches import (
     Switch,
@@ -40,7 +41,21 @@ from scripts.utility import (
 )
 
 
+class EventRow:
+    """The panel showing one event of the event list, kept to show another event once it's scrolled out of view"""
+
+    def __init__(self, container, text_box):
+        self.container = container
+        self.text_box = text_box
+        self.involved_cat_button: Optional[IDImageButton] = None
+        self.default_colour = container.background_colour
+        self.alternate_colour = False
+
+
 class EventsScreen(Screens):
+    # rows made beyond the visible ones at either end of the event list
+    event_row_buffer = 4
+
     current_display = "all events"
     selected_display = "all events"
 
@@ -72,6 +87,7 @@ class EventsScreen(Screens):
         self.event_screen_container = None
         self.clan_info = {}
         self.timeskip_button = None
+        self.timeskip_batch_button = None
 
         self.full_event_display_container = None
         self.events_frame = None
@@ -79,8 +95,15 @@ class EventsScreen(Screens):
         self.alert = {}
 
         self.event_display = None
-        self.event_display_containers = []
-        self.event_display_boxes = []
+        # the rows showing an event, by the event's index in display_events
+        self.event_rows: Dict[int, EventRow] = {}
+        # rows not showing an event, ready to show the next one scrolled into view
+        self.spare_event_rows: List[EventRow] = []
+        # the measured height of each event's row, events not shown yet are estimated
+        self.event_row_heights: Dict[Single_Event, int] = {}
+        self.event_row_tops: List[int] = []
+        self.event_row_estimate = 0
+        self.event_display_top = None
         self.cat_profile_buttons = []
         self.involved_cat_container = None
         self.involved_cat_buttons = []
@@ -134,9 +157,19 @@ class EventsScreen(Screens):
                 if self.events_thread is not None and self.events_thread.is_alive():
                     return
                 self.timeskip_button.disable()
+                self.timeskip_batch_button.disable()
                 self.events_thread = self.loading_screen_start_work(
                     events_class.one_moon
                 )
+            elif element == self.timeskip_batch_button:
+                if self.events_thread is not None and self.events_thread.is_alive():
+                    return
+                self.timeskip_button.disable()
+                self.timeskip_batch_button.disable()
+                self.events_thread = self.loading_screen_start_work(
+                    events_class.skip_moons,
+                    args=(constants.CONFIG["timeskip"]["batch_moons"],),
+                )
             elif element in self.involved_cat_buttons:
                 self.make_cat_buttons(element)
             elif element in self.cat_profile_buttons:
@@ -214,6 +247,8 @@ class EventsScreen(Screens):
         """
         if not is_rescale:
             self.save_scroll_position()
+        else:
+            self.event_row_heights.clear()
 
         self.current_display = display_type
         self.update_list_buttons()
@@ -292,7 +327,7 @@ class EventsScreen(Screens):
         )
 
         self.timeskip_button = UISurfaceImageButton(
-            ui_scale(pygame.Rect((310, 218), (180, 30))),
+            ui_scale(pygame.Rect((215, 218), (180, 30))),
             "screens.events.timeskip_button",
             get_button_dict(ButtonStyles.SQUOVAL, (180, 30)),
             object_id="@buttonstyles_squoval",
@@ -301,6 +336,17 @@ class EventsScreen(Screens):
             manager=MANAGER,
             sound_id="timeskip",
         )
+        self.timeskip_batch_button = UISurfaceImageButton(
+            ui_scale(pygame.Rect((405, 218), (180, 30))),
+            "screens.events.timeskip_batch_button",
+            get_button_dict(ButtonStyles.SQUOVAL, (180, 30)),
+            object_id="@buttonstyles_squoval",
+            starting_height=1,
+            container=self.event_screen_container,
+            manager=MANAGER,
+            sound_id="timeskip",
+            text_kwargs={"count": constants.CONFIG["timeskip"]["batch_moons"]},
+        )
 
         self.full_event_display_container = pygame_gui.core.UIContainer(
             ui_scale(pygame.Rect((45, 266), (700, 700))),
@@ -400,6 +446,7 @@ class EventsScreen(Screens):
             starting_height=1,
             manager=MANAGER,
             allow_scroll_y=True,
+            should_grow_automatically=False,
         )
         self.events_frame.join_focus_sets(self.event_display)
 
@@ -424,6 +471,7 @@ class EventsScreen(Screens):
                         - ui_scale_value(size_increase),
                     ),
                 )
+                self.layout_event_rows()
             for ele in self.cat_profile_buttons:
                 ele.kill()
             self.cat_profile_buttons = []
@@ -535,6 +583,7 @@ class EventsScreen(Screens):
                 self.event_display.get_relative_rect()[3],
             )
         )
+        self.layout_event_rows()
 
     def exit_screen(self):
         self.event_display.kill()  # event display isn't put in the screen container due to lag issues
@@ -565,8 +614,8 @@ class EventsScreen(Screens):
 
     def update_events_display(self):
         """
-        Kills and recreates the event display, updates the clan info, sets the event display scroll position if it was
-        previously saved
+        Recreates the event display with the events in view, updates the clan info, sets the event display scroll
+        position if it was previously saved
         """
 
         # UPDATE CLAN INFO
@@ -580,72 +629,147 @@ class EventsScreen(Screens):
 
         self.make_event_scrolling_container()
 
-        for ele in self.event_display_containers:
-            ele.kill()
-        self.event_display_containers = []
-
-        for ele in self.event_display_boxes:
-            ele.kill()
-        self.event_display_boxes = []
-
-        for ele in self.cat_profile_buttons:
-            ele.kill()
+        # the rows were killed with the old container
+        self.event_rows = {}
+        self.spare_event_rows = []
+        self.event_row_tops = []
+        self.event_display_top = None
         self.cat_profile_buttons = []
-
-        for ele in self.involved_cat_buttons:
-            ele.kill()
         self.involved_cat_buttons = []
+        self.involved_cat_container = None
+        self.open_involved_cat_button = None
 
         # Stop if Clan is new, so that events from previously loaded Clan don't show up
         if game.clan.age == 0:
             return
 
-        default_rect = pygame.Rect(
-            ui_scale_offset((5, 0)),
-            (
-                self.event_display.get_relative_rect()[2]
-                - ui_scale_value(10)
-                - self.event_display.scroll_bar_width,
-                ui_scale_value(300),
-            ),
+        for event_object in [
+            event for event in self.display_events if not isinstance(event.text, str)
+        ]:
+            print(
+                f"Incorrectly Formatted Event: {event_object.text}, {type(event_object)}"
+            )
+            self.display_events.remove(event_object)
+
+        self.layout_event_rows()
+
+        # this HAS TO UPDATE before saved scroll position can be set
+        self.event_display.scrollable_container.update(1)
+
+        # set saved scroll position
+        if switch_get_value(Switch.saved_scroll_positions).get(self.current_display):
+            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
+                switch_get_value(Switch.saved_scroll_positions)[self.current_display]
+            )
+            self.event_display.update(0)
+
+        self.update_visible_event_rows()
+
+    def get_event_row_height(self, index: int) -> int:
+        """The height of an event's row, the row's own height if it is shown"""
+        if index in self.event_rows:
+            return self.event_rows[index].container.get_relative_rect()[3]
+        event_object = self.display_events[index]
+        return self.event_row_heights.get(event_object, self.event_row_estimate)
+
+    def layout_event_rows(self):
+        """
+        Works out where each event's row starts, moves the shown rows there and sizes the scrollable area to fit
+        all rows
+        """
+        if not self.event_display:
+            return
+        # rows not measured yet are guessed to be as tall as the others
+        if self.event_row_heights:
+            self.event_row_estimate = sum(self.event_row_heights.values()) // len(
+                self.event_row_heights
+            )
+        else:
+            self.event_row_estimate = ui_scale_value(70)
+
+        self.event_row_tops = []
+        top = 0
+        for index in range(len(self.display_events)):
+            self.event_row_tops.append(top)
+            top += self.get_event_row_height(index)
+
+        for index, row in self.event_rows.items():
+            row.container.set_relative_position(
+                (ui_scale_value(5), self.event_row_tops[index])
+            )
+
+        self.event_display.set_scrollable_area_dimensions(
+            (self.event_display.get_relative_rect()[2], max(top, 1))
         )
 
-        catbutton_rect = ui_scale(pygame.Rect((0, 0), (34, 34)))
-        catbutton_rect.topright = ui_scale_offset((-10, 5))
+    def update_visible_event_rows(self):
+        """
+        Shows the events in view, and the few around them, in rows. Rows scrolled out of view are kept to show the
+        next events scrolled into view.
+        """
+        if not self.event_display or not self.display_events or game.clan.age == 0:
+            return
+
+        # measuring new rows can move the rows after them, so repeat until everything in view is shown
+        for _ in range(5):
+            view_top = -self.event_display.scrollable_container.get_relative_rect()[1]
+            view_bottom = view_top + self.event_display.get_relative_rect()[3]
+            first = max(
+                bisect_right(self.event_row_tops, view_top) - 1 - self.event_row_buffer,
+                0,
+            )
+            last = min(
+                bisect_left(self.event_row_tops, view_bottom) + self.event_row_buffer,
+                len(self.display_events),
+            )
 
-        anchor = {"top": "top"}
+            for index in [i for i in self.event_rows if not first <= i < last]:
+                self.release_event_row(index)
 
-        alternate_color = (
-            pygame.Color(87, 76, 55)
-            if game_setting_get("dark mode")
-            else pygame.Color(167, 148, 111)
+            resized = False
+            for index in range(first, last):
+                if index in self.event_rows:
+                    continue
+                estimated_height = self.get_event_row_height(index)
+                self.show_event_row(index)
+                if self.get_event_row_height(index) != estimated_height:
+                    resized = True
+
+            if not resized:
+                break
+            self.layout_event_rows()
+
+        self.event_display_top = (
+            -self.event_display.scrollable_container.get_relative_rect()[1]
         )
 
-        for i, event_object in enumerate(self.display_events):
-            if not isinstance(event_object.text, str):
-                print(
-                    f"Incorrectly Formatted Event: {event_object.text}, {type(event_object)}"
-                )
-                self.display_events.remove(event_object)
-                continue
+    def show_event_row(self, index: int):
+        """Shows the event at this index of display_events in a row, reusing a spare row if there is one"""
+        event_object = self.display_events[index]
+        width = (
+            self.event_display.get_relative_rect()[2]
+            - ui_scale_value(10)
+            - self.event_display.scroll_bar_width
+        )
 
+        if self.spare_event_rows:
+            row = self.spare_event_rows.pop()
+            row.text_box.set_text(
+                event_object.text, text_kwargs=getattr(event_object, "cat_dict")
+            )
+            row.container.show()
+        else:
             display_element_container = pygame_gui.elements.UIPanel(
-                default_rect,
+                pygame.Rect((0, 0), (width, ui_scale_value(300))),
                 5,
                 MANAGER,
                 container=self.event_display,
                 element_id="event_panel",
                 object_id="#dark" if game_setting_get("dark mode") else None,
                 margins={"top": 0, "bottom": 0, "left": 0, "right": 0},
-                anchors=anchor,
+                anchors={"top": "top"},
             )
 
-            self.event_display_containers.append(display_element_container)
-
-            if i % 2 == 0:
-                display_element_container.background_colour = alternate_color
-                display_element_container.rebuild()
-
             # TEXT BOX
             display_element_event = pygame_gui.elements.UITextBox(
                 event_object.text,
@@ -657,63 +781,72 @@ class EventsScreen(Screens):
                 text_kwargs=getattr(event_object, "cat_dict"),
                 anchors={"left": "left", "right": "right"},
             )
-
-            self.event_display_boxes.append(display_element_event)
-
-            if event_object.cats_involved:
-                involved_cat_button = IDImageButton(
-                    catbutton_rect,
-                    Icon.CAT_HEAD,
-                    get_button_dict(ButtonStyles.ICON, (34, 34)),
-                    ids=event_object.cats_involved,
-                    layer_starting_height=3,
-                    object_id="@buttonstyles_icon",
-                    parent_element=display_element_container,
-                    container=display_element_container,
-                    manager=MANAGER,
-                    anchors={
-                        "right": "right",
-                        "top_target": display_element_event,
-                    },
-                )
-                self.involved_cat_buttons.append(involved_cat_button)
-
-            display_element_container.set_dimensions(
-                (
-                    default_rect[2],
-                    (
-                        display_element_event.get_relative_rect()[3]
-                        + (
-                            involved_cat_button.get_relative_rect()[3]
-                            + ui_scale_value(10)
-                        )
-                        if event_object.cats_involved
-                        else display_element_event.get_relative_rect()[3]
-                    ),
+            row = EventRow(display_element_container, display_element_event)
+
+        self.event_rows[index] = row
+
+        # every other row has a different color
+        if (index % 2 == 0) != row.alternate_colour:
+            row.alternate_colour = index % 2 == 0
+            if row.alternate_colour:
+                row.container.background_colour = (
+                    pygame.Color(87, 76, 55)
+                    if game_setting_get("dark mode")
+                    else pygame.Color(167, 148, 111)
                 )
+            else:
+                row.container.background_colour = row.default_colour
+            row.container.rebuild()
+
+        if event_object.cats_involved:
+            catbutton_rect = ui_scale(pygame.Rect((0, 0), (34, 34)))
+            catbutton_rect.topright = ui_scale_offset((-10, 5))
+            row.involved_cat_button = IDImageButton(
+                catbutton_rect,
+                Icon.CAT_HEAD,
+                get_button_dict(ButtonStyles.ICON, (34, 34)),
+                ids=event_object.cats_involved,
+                layer_starting_height=3,
+                object_id="@buttonstyles_icon",
+                parent_element=row.container,
+                container=row.container,
+                manager=MANAGER,
+                anchors={
+                    "right": "right",
+                    "top_target": row.text_box,
+                },
             )
+            self.involved_cat_buttons.append(row.involved_cat_button)
 
-            anchor = {"top_target": display_element_container}
-
-        del catbutton_rect
-
-        # this HAS TO UPDATE before saved scroll position can be set
-        self.event_display.scrollable_container.update(1)
-
-        # don't ask me why we have to redefine these dimensions, we just do
-        # otherwise the scroll position save will break
-        self.event_display.set_dimensions(
-            (
-                self.event_display.get_relative_rect()[2],
-                self.event_display.get_relative_rect()[3],
+        height = row.text_box.get_relative_rect()[3]
+        if row.involved_cat_button:
+            height += row.involved_cat_button.get_relative_rect()[3] + ui_scale_value(
+                10
             )
+        self.event_row_heights[event_object] = height
+
+        row.container.set_dimensions((width, height))
+        row.container.set_relative_position(
+            (ui_scale_value(5), self.event_row_tops[index])
         )
 
-        # set saved scroll position
-        if switch_get_value(Switch.saved_scroll_positions).get(self.current_display):
-            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
-                switch_get_value(Switch.saved_scroll_positions)[self.current_display]
-            )
+    def release_event_row(self, index: int):
+        """Hides the row of the event at this index of display_events, and keeps it to show another event"""
+        row = self.event_rows.pop(index)
+        if row.involved_cat_button:
+            if self.open_involved_cat_button == row.involved_cat_button:
+                for ele in self.cat_profile_buttons:
+                    ele.kill()
+                self.cat_profile_buttons = []
+                if self.involved_cat_container:
+                    self.involved_cat_container.kill()
+                    self.involved_cat_container = None
+                self.open_involved_cat_button = None
+            self.involved_cat_buttons.remove(row.involved_cat_button)
+            row.involved_cat_button.kill()
+            row.involved_cat_button = None
+        row.container.hide()
+        self.spare_event_rows.append(row)
 
     def update_list_buttons(self):
         """
@@ -728,10 +861,19 @@ class EventsScreen(Screens):
         super().on_use()
         self.loading_screen_on_use(self.events_thread, self.timeskip_done)
 
+        # show the events scrolled into view
+        if (
+            self.event_display
+            and self.event_display_top
+            != -self.event_display.scrollable_container.get_relative_rect()[1]
+        ):
+            self.update_visible_event_rows()
+
     def timeskip_done(self):
         """Various sorting and other tasks that must be done with the timeskip is over."""
 
         switch_set_value(Switch.saved_scroll_positions, {})
+        self.event_row_heights.clear()
 
         if get_living_clan_cat_count(Cat) == 0:
             GameOver("events screen")
@@ -786,3 +928,4 @@ class EventsScreen(Screens):
 
         self.update_events_display()
         self.timeskip_button.enable()
+        self.timeskip_batch_button.enable()
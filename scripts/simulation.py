@@ -0,0 +1,352 @@
+"""
+Headless simulation runner, to measure how long the moons of a Clan take without the game's UI.
+
+Runs a number of moons of a saved Clan, or of a generated Clan of a chosen size, with a fixed random seed and
+reports the time spent on each phase of the moons as JSON:
+
+    python -m scripts.simulation --cats 50 200 1000 --moons 10 --seed 1 --report simulation.json
+    python -m scripts.simulation --save MyClan --moons 10
+
+The phases are timed including everything they call, so "relationships" is also part of "cats". Each run gets a
+fresh process, so the same seed always gives the same moons. The saves are written to a temporary directory, a
+loaded save is never changed.
+"""
+
+import argparse
+import functools
+import itertools
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, ExitStack
+from typing import Dict, List, Optional
+
+import ujson
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from scripts.cat.cats import Cat, create_cat
+from scripts.cat.enums import CatGroup, CatRank
+from scripts.cat.faded_archive import faded_archive
+from scripts.cat.names import names
+from scripts.cat_relations.inheritance import family_graph
+from scripts.cat_relations.relationship_store import relationship_index
+from scripts.clan import Clan, OtherClan, clan_class
+from scripts.clan_package.settings import set_clan_setting
+from scripts.clan_package.settings.clan_settings import reset_loaded_clan_settings
+from scripts.clan_resources.freshkill import FreshkillPile
+from scripts.clan_resources.herb.herb_supply import HerbSupply
+from scripts.events import Events, events_class
+from scripts.events_module.relationship.relation_events import Relation_Events
+from scripts.game_structure.game.save_load import wait_for_background_saves
+from scripts.game_structure.game.switches import Switch, switch_set_value
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure.load_cat import load_cats, version_convert
+from scripts.housekeeping import datadir
+from scripts.utility import get_living_clan_cat_count
+
+# phase: the functions timed for it, as (class, function name)
+PHASES = {
+    "freshkill": ((FreshkillPile, "time_skip"), (Events, "get_moon_freshkill")),
+    "cats": ((Events, "one_moon_cat"), (Events, "one_moon_outside_cat")),
+    "relationships": ((Relation_Events, "handle_relationships"),),
+    "herbs": ((HerbSupply, "handle_moon"),),
+    "autosave": ((Events, "autosave"),),
+}
+
+MEMBER_RANKS = (
+    CatRank.KITTEN,
+    CatRank.APPRENTICE,
+    CatRank.WARRIOR,
+    CatRank.WARRIOR,
+    CatRank.WARRIOR,
+    CatRank.ELDER,
+)
+
+
+class PhaseTimer:
+    """Adds up the time spent in the functions of each phase while it's timing them"""
+
+    def __init__(self):
+        self.times: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+
+    def reset(self):
+        self.times = dict.fromkeys(PHASES, 0.0)
+
+    @contextmanager
+    def timing(self):
+        """Time the phases' functions for as long as the context is open"""
+        with ExitStack() as stack:
+            for phase, functions in PHASES.items():
+                for owner, name in functions:
+                    stack.enter_context(self._timed(owner, name, phase))
+            yield self
+
+    @contextmanager
+    def _timed(self, owner, name: str, phase: str):
+        original = owner.__dict__[name]
+        is_static = isinstance(original, staticmethod)
+        function = original.__func__ if is_static else original
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+                if phase == "autosave":
+                    # the files are written in the background, the save isn't done until they are
+                    wait_for_background_saves()
+                return result
+            finally:
+                self.times[phase] += time.perf_counter() - start
+
+        setattr(owner, name, staticmethod(timed) if is_static else timed)
+        try:
+            yield
+        finally:
+            setattr(owner, name, original)
+
+
+def reset_cats():
+    """Forget all cats, so a new Clan can be made or loaded"""
+    Cat.all_cats.clear()
+    Cat.all_cats_list.clear()
+    Cat.dead_cats.clear()
+    Cat.grief_strings.clear()
+    Cat.id_iter = itertools.count()
+    names.prefix_history.clear()
+    relationship_index.reset()
+    family_graph.reset()
+    faded_archive.reset()
+    game.cur_events_list = []
+    game.clan = None
+
+
+def generate_clan(size: int, game_mode: str = "expanded", biome: str = "Forest"):
+    """
+    Generate a Clan with a leader, deputy, medicine cat and warriors, apprentices, kits and elders, and make it
+    the current Clan.
+    :param size: the number of living cats in the Clan
+    """
+    reset_cats()
+    reset_loaded_clan_settings()
+    switch_set_value(Switch.clan_name, "Simulation")
+    switch_set_value(Switch.clan_list, ["Simulation"])
+    # the cats' thoughts depend on these, set them as the Clan will
+    switch_set_value(Switch.biome, biome)
+    switch_set_value(Switch.camp_bg, "camp1")
+    switch_set_value(Switch.game_mode, game_mode)
+
+    leader = create_cat(rank=CatRank.WARRIOR)
+    deputy = create_cat(rank=CatRank.WARRIOR)
+    medicine_cat = create_cat(rank=CatRank.MEDICINE_CAT)
+    members = [
+        create_cat(rank=random.choice(MEMBER_RANKS)) for _ in range(max(size - 3, 0))
+    ]
+    game.clan = Clan(
+        name="Simulation",
+        leader=leader,
+        deputy=deputy,
+        medicine_cat=medicine_cat,
+        biome=biome,
+        camp_bg="camp1",
+        game_mode=game_mode,
+        starting_members=members,
+    )
+    game.clan.instructor = Cat(
+        status_dict={"rank": CatRank.WARRIOR, "group": CatGroup.STARCLAN}
+    )
+    game.clan.instructor.dead = True
+    game.clan.instructor.dead_for = random.randint(20, 200)
+    game.clan.add_cat(game.clan.instructor)
+    for cat in [leader, deputy, medicine_cat] + members:
+        game.clan.add_cat(cat)
+
+    for name in random.sample(("River", "Wind", "Shadow", "Sky", "Thunder"), 3):
+        game.clan.all_clans.append(
+            OtherClan(name=name, chosen_symbol=f"symbol{name.upper()}0")
+        )
+
+    for cat in Cat.all_cats.values():
+        cat.init_all_relationships()
+        cat.backstory = "clan_founder"
+
+
+def load_clan(clan_name: str, save_dir: str):
+    """
+    Load a saved Clan and make it the current Clan.
+    :param clan_name: the name of the Clan, as in the names of its save files
+    :param save_dir: the directory the Clan's save files are in
+    """
+    os.makedirs(datadir.get_save_dir(), exist_ok=True)
+    for file_name in (f"{clan_name}clan.json", f"{clan_name}clan.txt"):
+        if os.path.exists(f"{save_dir}/{file_name}"):
+            shutil.copy(f"{save_dir}/{file_name}", datadir.get_save_dir())
+    shutil.copytree(f"{save_dir}/{clan_name}", f"{datadir.get_save_dir()}/{clan_name}")
+
+    reset_cats()
+    switch_set_value(Switch.clan_name, clan_name)
+    switch_set_value(Switch.clan_list, [clan_name])
+    load_cats()
+    version_convert(clan_class.load_clan())
+    game.load_events()
+
+
+def run_moons(moons: int, timer: PhaseTimer) -> List[dict]:
+    """Run moons of the current Clan, stopping early if it has no cats left. Returns the report of each moon."""
+    reports = []
+    with timer.timing():
+        for _ in range(moons):
+            timer.reset()
+            start = time.perf_counter()
+            events_class.one_moon()
+            total = time.perf_counter() - start
+
+            reports.append(
+                {
+                    "age": game.clan.age,
+                    "living_cats": get_living_clan_cat_count(Cat),
+                    "events": len(game.cur_events_list),
+                    "total": total,
+                    "phases": dict(timer.times),
+                }
+            )
+            if reports[-1]["living_cats"] == 0:
+                break
+    return reports
+
+
+def summarize(moon_reports: List[dict]) -> dict:
+    """The total and mean time per moon, for the whole moons and for each phase"""
+    total = sum(report["total"] for report in moon_reports)
+    phases = {
+        phase: sum(report["phases"][phase] for report in moon_reports)
+        for phase in PHASES
+    }
+    count = max(len(moon_reports), 1)
+    return {
+        "moons": len(moon_reports),
+        "total": total,
+        "mean_moon": total / count,
+        "phases": phases,
+        "mean_phases": {phase: value / count for phase, value in phases.items()},
+    }
+
+
+def simulate(
+    moons: int,
+    seed: int,
+    cats: Optional[int] = None,
+    save: Optional[str] = None,
+    game_mode: str = "expanded",
+    autosave: bool = True,
+) -> dict:
+    """
+    Simulate moons of a generated or saved Clan, and return the report of the run.
+    :param moons: the number of moons to run
+    :param seed: the random seed, the same seed gives the same moons
+    :param cats: the size of the Clan to generate
+    :param save: the name of the saved Clan to load instead
+    :param game_mode: the game mode of a generated Clan
+    :param autosave: if the Clan should be autosaved every five moons, as the game does
+    """
+    real_save_dir = datadir.get_save_dir()
+    original_get_data_dir = datadir.get_data_dir
+    with tempfile.TemporaryDirectory() as data_dir:
+        # everything the simulation saves goes into the temporary directory
+        datadir.get_data_dir = lambda: data_dir
+        try:
+            random.seed(seed)
+            start = time.perf_counter()
+            if save:
+                load_clan(save, real_save_dir)
+            else:
+                generate_clan(cats, game_mode)
+            setup_time = time.perf_counter() - start
+            set_clan_setting("autosave", autosave)
+            living_cats = get_living_clan_cat_count(Cat)
+
+            moon_reports = run_moons(moons, PhaseTimer())
+        finally:
+            wait_for_background_saves()
+            datadir.get_data_dir = original_get_data_dir
+
+    return {
+        "clan": save if save else "generated",
+        "game_mode": game.clan.game_mode,
+        "cats": living_cats,
+        "seed": seed,
+        "setup": setup_time,
+        "summary": summarize(moon_reports),
+        "moons": moon_reports,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run moons of a Clan without the game's UI and report how long they take."
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--cats",
+        type=int,
+        nargs="+",
+        default=[50],
+        help="sizes of the Clans to generate, one run for each",
+    )
+    source.add_argument("--save", help="name of a saved Clan to run instead")
+    parser.add_argument("--moons", type=int, default=10, help="moons to run")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--mode",
+        default="expanded",
+        choices=("classic", "expanded", "cruel season"),
+        help="game mode of the generated Clans",
+    )
+    parser.add_argument(
+        "--no-autosave", action="store_true", help="don't autosave every five moons"
+    )
+    parser.add_argument(
+        "--report", help="file to write the JSON report to, printed if not given"
+    )
+    args = parser.parse_args(argv)
+
+    if args.save:
+        runs_kwargs = [{"save": args.save}]
+    else:
+        runs_kwargs = [{"cats": size, "game_mode": args.mode} for size in args.cats]
+
+    # each run gets a fresh process, so nothing left over from an earlier run changes its moons
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        runs = [
+            pool.apply(
+                simulate,
+                (args.moons, args.seed),
+                {**run_kwargs, "autosave": not args.no_autosave},
+            )
+            for run_kwargs in runs_kwargs
+        ]
+
+    report = ujson.dumps({"runs": runs}, indent=4)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as write_file:
+            write_file.write(report)
+    else:
+        print(report)
+
+    for run in runs:
+        summary = run["summary"]
+        print(
+            f"{run['cats']} cats: {summary['moons']} moons in {summary['total']:.2f} s, "
+            f"{summary['mean_moon'] * 1000:.1f} ms per moon",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from itertools import combinations
 from math import floor
 from random import choice, choices, randint, random, sample, randrange, getrandbits
 from sys import exit as sys_exit
+from traceback import print_exception
 from typing import List, Tuple, TYPE_CHECKING, Type, Union
 
 import i18n
@@ -21,6 +22,10 @@ import ujson
 from pygame_gui.core import ObjectID
 
 from scripts.clan_package.settings import get_clan_setting
+from scripts.game_structure.game.save_load import (
+    collect_background_save_errors,
+    wait_for_background_saves,
+)
 from scripts.game_structure.game.settings import game_settings_save, game_setting_get
 from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.cat.status import StatusDict
@@ -102,11 +107,7 @@ def find_alive_cats_with_rank(
     :param bool sort: default False, set to True if you would like list sorted by descending moon age
     """
 
-    alive_cats = [
-        i
-        for i in Cat.all_cats.values()
-        if i.status.rank in ranks and i.status.alive_in_player_clan
-    ]
+    alive_cats = Cat.all_cats.with_rank(ranks, group=CatGroup.PLAYER_CLAN)
 
     if working:
         alive_cats = [i for i in alive_cats if not i.not_working()]
@@ -122,12 +123,7 @@ def get_living_cat_count(Cat):
     Returns the int of all living cats, both in and out of the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if the_cat.dead:
-            continue
-        count += 1
-    return count
+    return len(Cat.all_cats) - len(Cat.all_cats.afterlife_cats())
 
 
 def get_living_clan_cat_count(Cat):
@@ -135,12 +131,7 @@ def get_living_clan_cat_count(Cat):
     Returns the int of all living cats within the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if not the_cat.status.alive_in_player_clan:
-            continue
-        count += 1
-    return count
+    return Cat.all_cats.count_in_group(CatGroup.PLAYER_CLAN)
 
 
 def get_cats_same_age(Cat, cat, age_range=10):
@@ -175,7 +166,7 @@ def get_cats_same_age(Cat, cat, age_range=10):
 def get_free_possible_mates(cat):
     """Returns a list of available cats, which are possible mates for the given cat."""
     cats = []
-    for inter_cat in cat.all_cats.values():
+    for inter_cat in cat.all_cats.mate_candidates(cat):
         if not inter_cat.status.alive_in_player_clan:
             continue
         if inter_cat.ID == cat.ID:
@@ -1071,7 +1062,7 @@ def get_personality_compatibility(cat1, cat2):
 def get_cats_of_romantic_interest(cat):
     """Returns a list of cats, those cats are love interest of the given cat"""
     cats = []
-    for inter_cat in cat.all_cats.values():
+    for inter_cat in cat.all_cats.mate_candidates(cat):
         if not inter_cat.status.alive_in_player_clan:
             continue
         if inter_cat.ID == cat.ID:
@@ -1904,13 +1895,11 @@ def get_special_snippet_list(
         if (
             chosen_list == "story_list"
         ):  # story list has some biome specific things to collect
-            snippets = SNIPPETS[chosen_list]["general"]
-            snippets.extend(SNIPPETS[chosen_list][biome])
+            snippets = SNIPPETS[chosen_list]["general"] + SNIPPETS[chosen_list][biome]
         elif (
             chosen_list == "clair_list"
         ):  # the clair list also pulls from the dream list
-            snippets = SNIPPETS[chosen_list]
-            snippets.extend(SNIPPETS["dream_list"])
+            snippets = SNIPPETS[chosen_list] + SNIPPETS["dream_list"]
         else:  # the dream list just gets the one
             snippets = SNIPPETS[chosen_list]
 
@@ -2611,32 +2600,40 @@ def update_sprite(cat):
     cat.all_cats[cat.ID] = cat
 
 
+def inflate_mask(mask: pygame.Mask, padding: int, grow: int) -> pygame.Mask:
+    """
+    Returns a copy of the mask with a border of empty pixels around it, in which every set pixel is grown into a
+    square, so the mask also covers the pixels close to it.
+
+    :param mask: the mask to inflate
+    :param padding: width of the border added on each side
+    :param grow: how many pixels to grow the set pixels by in each direction, at most padding
+    """
+    inflated_mask = pygame.Mask(
+        (mask.get_size()[0] + padding * 2, mask.get_size()[1] + padding * 2)
+    )
+    # convolving with a filled square sets every pixel the square overlaps the mask from
+    square = pygame.Mask((grow * 2 + 1, grow * 2 + 1), fill=True)
+    mask.convolve(square, inflated_mask, (padding - grow, padding - grow))
+    return inflated_mask
+
+
 def update_mask(cat):
     if cat.faded or cat.dead:
         # should never need a mask since they can't appear on the Clan screen
         cat.sprite_mask = None
         return
 
-    val = pygame.mask.from_surface(
-        pygame.transform.scale(cat.sprite, ui_scale_dimensions((50, 50))), threshold=250
-    )
-
-    inflated_mask = pygame.Mask(
-        (
-            val.get_size()[0] + 10,
-            val.get_size()[1] + 10,
+    size = ui_scale_dimensions((50, 50))
+    # cats that look the same share their sprite, so they can share the mask made from it too
+    mask_key = (cat.sprite, size)
+    inflated_mask = sprites.cat_mask_cache.get(mask_key)
+    if inflated_mask is None:
+        val = pygame.mask.from_surface(
+            pygame.transform.scale(cat.sprite, size), threshold=250
         )
-    )
-    inflated_mask.draw(val, (5, 5))
-    for _ in range(3):
-        outline = inflated_mask.outline()
-        for point in outline:
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    try:
-                        inflated_mask.set_at((point[0] + dx, point[1] + dy), 1)
-                    except IndexError:
-                        continue
+        inflated_mask = inflate_mask(val, 5, 3)
+        sprites.cat_mask_cache.put(mask_key, inflated_mask)
     cat.sprite_mask = inflated_mask
 
 
@@ -2726,14 +2723,23 @@ def generate_sprite(
         else:
             cat_sprite = str(cat.pelt.cat_sprites[age])
 
-    new_sprite = pygame.Surface(
-        (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
-    )
-
     # generating the sprite
     try:
         # checks index of cat's species in the species list and uses matching folder's sprites
         n = (list(game.species["species"]).index(cat.species)) + 1 #add 1 because people don't count from 0 smh
+        sprites.ensure_species_loaded(n)
+
+        fade_stage = get_fade_stage(cat, dead)
+        appearance_key = get_sprite_appearance_key(
+            cat, n, cat_sprite, dead, fade_stage, scars_hidden, acc_hidden
+        )
+        cached_sprite = sprites.cat_sprite_cache.get(appearance_key)
+        if cached_sprite is not None:
+            return cached_sprite
+
+        new_sprite = pygame.Surface(
+            (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
+        )
 
         if cat.pelt.name not in ["Tortie", "Calico"]:
             new_sprite.blit(
@@ -2913,20 +2919,8 @@ def generate_sprite(
                             )
 
         # Apply fading fog
-        if (
-            cat.pelt.opacity <= 97
-            and not cat.prevent_fading
-            and get_clan_setting("fading")
-            and dead
-        ):
-            stage = "0"
-            if 80 >= cat.pelt.opacity > 45:
-                # Stage 1
-                stage = "1"
-            elif cat.pelt.opacity <= 45:
-                # Stage 2
-                stage = "2"
-
+        if fade_stage is not None:
+            stage = fade_stage
             new_sprite.blit(
                 sprites.sprites["fademask" + f'{n}_' + stage + cat_sprite],
                 (0, 0),
@@ -2946,7 +2940,9 @@ def generate_sprite(
         if cat.pelt.reverse:
             new_sprite = pygame.transform.flip(new_sprite, True, False)
 
-    except (TypeError, KeyError):
+        sprites.cat_sprite_cache.put(appearance_key, new_sprite)
+
+    except (TypeError, KeyError, FileNotFoundError, pygame.error):
         logger.exception("Failed to load sprite")
 
         # Placeholder image
@@ -2957,6 +2953,62 @@ def generate_sprite(
     return new_sprite
 
 
+def get_fade_stage(cat, dead):
+    """
+    Find which stage of the fading fog should be drawn over the cat.
+    :return: "0", "1" or "2", or None if the cat isn't fading
+    """
+    if (
+        cat.pelt.opacity > 97
+        or cat.prevent_fading
+        or not get_clan_setting("fading")
+        or not dead
+    ):
+        return None
+    if 80 >= cat.pelt.opacity > 45:
+        return "1"
+    elif cat.pelt.opacity <= 45:
+        return "2"
+    return "0"
+
+
+def get_sprite_appearance_key(
+    cat, species_index, cat_sprite, dead, fade_stage, scars_hidden, acc_hidden
+) -> tuple:
+    """
+    Build a hashable key covering everything generate_sprite draws, so cats that look the same
+    can share one finished sprite.
+    """
+    pelt = cat.pelt
+    return (
+        sprites.size,
+        species_index,
+        cat_sprite,
+        pelt.name,
+        pelt.get_sprites_name(),
+        pelt.colour,
+        pelt.tortiebase,
+        pelt.tortiepattern,
+        pelt.tortiecolour,
+        pelt.pattern,
+        pelt.tint,
+        pelt.white_patches,
+        pelt.white_patches_tint,
+        pelt.points,
+        pelt.vitiligo,
+        pelt.eye_colour,
+        pelt.eye_colour2,
+        pelt.skin,
+        None if scars_hidden else tuple(pelt.scars),
+        None if acc_hidden or not pelt.accessory else tuple(pelt.accessory),
+        bool(game_setting_get("shaders")),
+        dead,
+        dead and cat.status.group == CatGroup.DARK_FOREST,
+        fade_stage,
+        bool(pelt.reverse),
+    )
+
+
 def apply_opacity(surface, opacity):
     for x in range(surface.get_width()):
         for y in range(surface.get_height()):
@@ -3013,6 +3065,10 @@ def quit(savesettings=False, clearevents=False):
         game_settings_save(None)
     if clearevents:
         game.cur_events_list.clear()
+    # don't cut a save short
+    wait_for_background_saves()
+    for error in collect_background_save_errors():
+        print_exception(error)
     game.rpc.close_rpc.set()
     game.rpc.update_rpc.set()
     pygame.display.quit()
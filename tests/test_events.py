@@ -0,0 +1,72 @@
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.clan import Clan
+from scripts.event_class import Single_Event
+from scripts.events import Events, events_class
+from scripts.game_structure.game_essentials import game
+
+
+class TestSkipMoons(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(
+            game, "clan", Clan(name="test", biome="Forest", camp_bg="camp1")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "scripts.events.get_living_clan_cat_count",
+            side_effect=lambda _: self.living_cats,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.living_cats = 10
+
+        self.events = events_class
+        self.batches = []
+
+    def one_moon(self, batch=False):
+        self.batches.append(batch)
+        game.clan.age += 1
+        game.cur_events_list = [Single_Event(f"moon {game.clan.age}")]
+        game.herb_events_list = (
+            [f"herbs {game.clan.age}"] if game.clan.age % 2 == 0 else []
+        )
+
+    def test_events_of_all_moons_are_kept(self):
+        with patch.object(self.events, "one_moon", self.one_moon), patch.object(
+            Events, "autosave"
+        ) as autosave, patch("scripts.events.get_clan_setting", return_value=True):
+            self.events.skip_moons(6)
+
+        self.assertEqual(self.batches, [True] * 6)
+        self.assertEqual(
+            [event.text for event in game.cur_events_list if "<b>" not in event.text],
+            [f"moon {age}" for age in range(1, 7)],
+        )
+        self.assertEqual(
+            [event for event in game.herb_events_list if "<b>" not in event],
+            ["herbs 2", "herbs 4", "herbs 6"],
+        )
+        # only the moons with herb events get a heading in the herb log
+        self.assertEqual(len(game.herb_events_list), 6)
+        # moon 5 was skipped, so the Clan is saved once at the end
+        autosave.assert_called_once()
+
+    def test_stops_when_clan_is_gone(self):
+        def one_moon(batch=False):
+            self.one_moon(batch)
+            if game.clan.age == 2:
+                self.living_cats = 0
+
+        with patch.object(self.events, "one_moon", one_moon), patch.object(
+            Events, "autosave"
+        ) as autosave:
+            self.events.skip_moons(6)
+
+        self.assertEqual(game.clan.age, 2)
+        autosave.assert_not_called()
@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.faded_archive import FADED_CATS_DIR, FADED_CATS_FILE, faded_archive
+from scripts.game_structure.game.save_load import (
+    collect_background_save_errors,
+    save_batch,
+    save_in_background,
+    wait_for_background_saves,
+)
+from scripts.game_structure.game_essentials import game
+
+
+class TestFadedArchive(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp()
+        self.clan_dir = os.path.join(self.save_dir, "TestClan")
+        os.makedirs(self.clan_dir)
+        patcher = patch(
+            "scripts.cat.faded_archive.get_save_dir", return_value=self.save_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.save_dir)
+        self.addCleanup(faded_archive.reset)
+        faded_archive.reset()
+
+        self.parent = Cat()
+        self.kit = Cat()
+        self.kit.parent1 = self.parent.ID
+
+    def test_round_trip(self):
+        faded_archive.add("TestClan", self.parent)
+        faded_archive.save("TestClan")
+        self.assertTrue(os.path.exists(os.path.join(self.clan_dir, FADED_CATS_FILE)))
+
+        faded_archive.reset()
+        record = faded_archive.get("TestClan", self.parent.ID)
+        self.assertEqual(record.name_prefix, self.parent.name.prefix)
+        self.assertEqual(record.moons, self.parent.moons)
+        self.assertIsNone(faded_archive.get("TestClan", self.kit.ID))
+
+    def test_failed_save(self):
+        faded_archive.add("TestClan", self.parent)
+        shutil.rmtree(self.clan_dir)
+        # a file in place of the Clan folder makes the write fail
+        with open(self.clan_dir, "w", encoding="utf-8"):
+            pass
+
+        with save_batch() as batch:
+            faded_archive.save("TestClan")
+        save_in_background(batch)
+        wait_for_background_saves()
+
+        self.assertEqual(len(collect_background_save_errors()), 1)
+        self.assertTrue(faded_archive.dirty)
+
+    def test_migration(self):
+        faded_dir = os.path.join(self.clan_dir, FADED_CATS_DIR)
+        os.makedirs(faded_dir)
+        with open(
+            os.path.join(faded_dir, f"{self.parent.ID}.json"), "w", encoding="utf-8"
+        ) as write_file:
+            write_file.write(ujson.dumps(self.parent.get_save_dict(faded=True)))
+
+        self.assertIsNotNone(faded_archive.get("TestClan", self.parent.ID))
+        self.assertTrue(faded_archive.dirty)
+
+        faded_archive.save("TestClan")
+        self.assertFalse(os.path.exists(faded_dir))
+
+        faded_archive.reset()
+        self.assertIsNotNone(faded_archive.get("TestClan", self.parent.ID))
+
+    def test_add_faded_offspring(self):
+        faded_archive.add("TestClan", self.parent)
+
+        self.assertTrue(
+            faded_archive.add_faded_offspring("TestClan", self.parent.ID, self.kit.ID)
+        )
+        self.assertFalse(
+            faded_archive.add_faded_offspring("TestClan", self.kit.ID, self.parent.ID)
+        )
+
+        faded_archive.save("TestClan")
+        faded_archive.reset()
+        self.assertEqual(
+            faded_archive.get("TestClan", self.parent.ID).faded_offspring,
+            [self.kit.ID],
+        )
+
+    def test_fetch_cat_is_cached(self):
+        faded_archive.add("TestClan", self.parent)
+        del Cat.all_cats[self.parent.ID]
+
+        with patch.object(game, "clan", SimpleNamespace(name="TestClan")):
+            faded_cat = Cat.fetch_cat(self.parent.ID)
+            self.assertTrue(faded_cat.faded)
+            self.assertEqual(faded_cat.ID, self.parent.ID)
+            self.assertIs(Cat.fetch_cat(self.parent.ID), faded_cat)
+
+            faded_archive.add_faded_offspring("TestClan", self.parent.ID, self.kit.ID)
+            self.assertEqual(
+                Cat.fetch_cat(self.parent.ID).faded_offspring, [self.kit.ID]
+            )
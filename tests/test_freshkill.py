@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest.mock import patch
 import ujson
 
 from scripts.cat.enums import CatRank
@@ -10,7 +11,11 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 from scripts.cat.cats import Cat
 from scripts.cat.skills import Skill, SkillPath
 from scripts.clan import Clan
-from scripts.clan_resources.freshkill import FreshkillPile
+from scripts.clan_resources.freshkill import (
+    FreshkillPile,
+    Nutrition,
+    get_nutrition_text,
+)
 from scripts.utility import get_alive_clan_queens
 
 
@@ -22,7 +27,7 @@ class FreshkillPileTest(unittest.TestCase):
         self.amount = self.prey_config["start_amount"]
         self.prey_requirement = self.prey_config["prey_requirement"]
         self.condition_increase = self.prey_config["condition_increase"]
-        Cat.all_cats = {}
+        Cat.all_cats.clear()
 
     def test_add_freshkill(self) -> None:
         # given
@@ -425,3 +430,40 @@ class FreshkillPileTest(unittest.TestCase):
         self.assertEqual(freshkill_pile.nutrition_info[injured_cat.ID].percentage, 100)
         self.assertEqual(freshkill_pile.nutrition_info[sick_cat.ID].percentage, 100)
         self.assertLess(freshkill_pile.nutrition_info[healthy_cat.ID].percentage, 70)
+
+    def test_needed_food_counted_once_per_group(self) -> None:
+        # given
+        warriors = [
+            Cat(status_dict={"rank": CatRank.WARRIOR}, moons=20) for _ in range(10)
+        ]
+        freshkill_pile = FreshkillPile()
+        for warrior in warriors:
+            freshkill_pile.add_cat_to_nutrition(warrior)
+
+        # when
+        with patch.object(
+            freshkill_pile,
+            "amount_food_needed",
+            wraps=freshkill_pile.amount_food_needed,
+        ) as amount_food_needed:
+            freshkill_pile.feed_group(warriors)
+
+        # then
+        amount_food_needed.assert_called_once()
+        self.assertEqual(freshkill_pile.already_fed, set(warriors))
+
+    def test_nutrition_text(self) -> None:
+        # given
+        nutrition = Nutrition()
+        nutrition.max_score = 10
+
+        # then
+        with patch("scripts.clan_resources.freshkill.i18n.t") as translate:
+            nutrition.current_score = 5
+            nutrition.current_score = 10
+            translate.assert_not_called()
+            translate.return_value = "stuffed"
+            self.assertEqual(nutrition.nutrition_text, "stuffed")
+            translate.assert_called_once_with("conditions.nutrition.stuffed")
+        nutrition.current_score = 3
+        self.assertEqual(nutrition.nutrition_text, get_nutrition_text(30))
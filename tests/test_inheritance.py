@@ -0,0 +1,109 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat_relations.inheritance import (
+    Inheritance,
+    Kinship,
+    RelationType,
+    family_graph,
+)
+
+
+class TestFamilyGraph(unittest.TestCase):
+    def test_parents_can_change(self):
+        # given
+        parent1 = Cat()
+        parent2 = Cat()
+        kit = Cat(parent1=parent1.ID)
+        self.assertEqual(family_graph.kits_of(parent1.ID), [kit.ID])
+
+        # when
+        kit.parent1 = parent2.ID
+        kit.adoptive_parents = [parent1.ID]
+
+        # then
+        self.assertEqual(family_graph.kits_of(parent1.ID), [kit.ID])
+        self.assertEqual(family_graph.kits_of(parent2.ID), [kit.ID])
+
+        kit.adoptive_parents = []
+        self.assertEqual(family_graph.kits_of(parent1.ID), [])
+
+
+class TestInheritance(unittest.TestCase):
+    def setUp(self):
+        self.grandparent = Cat()
+        self.parent = Cat(parent1=self.grandparent.ID)
+        self.aunt = Cat(parent1=self.grandparent.ID)
+        self.other_parent = Cat()
+        self.cat = Cat(parent1=self.parent.ID, parent2=self.other_parent.ID)
+        self.sibling = Cat(parent1=self.parent.ID, parent2=self.other_parent.ID)
+        self.half_sibling = Cat(parent1=self.parent.ID)
+        self.cousin = Cat(parent1=self.aunt.ID)
+        self.kit = Cat(parent1=self.cat.ID)
+        self.adopted_kit = Cat(adoptive_parents=[self.cat.ID])
+        self.grandkit = Cat(parent1=self.kit.ID)
+        self.stranger = Cat()
+
+    def test_relatives(self):
+        inheritance = Inheritance(self.cat)
+
+        self.assertEqual(
+            set(inheritance.parents), {self.parent.ID, self.other_parent.ID}
+        )
+        self.assertEqual(set(inheritance.grand_parents), {self.grandparent.ID})
+        self.assertEqual(
+            set(inheritance.siblings), {self.sibling.ID, self.half_sibling.ID}
+        )
+        self.assertEqual(
+            inheritance.siblings[self.half_sibling.ID]["type"],
+            RelationType.HALF_BLOOD,
+        )
+        self.assertEqual(set(inheritance.parents_siblings), {self.aunt.ID})
+        self.assertEqual(set(inheritance.cousins), {self.cousin.ID})
+        self.assertEqual(set(inheritance.kits), {self.kit.ID, self.adopted_kit.ID})
+        self.assertEqual(
+            inheritance.kits[self.adopted_kit.ID]["type"], RelationType.ADOPTIVE
+        )
+        self.assertEqual(set(inheritance.grand_kits), {self.grandkit.ID})
+        self.assertNotIn(self.stranger.ID, inheritance.all_involved)
+
+    def test_siblings_kits(self):
+        nephew = Cat(parent1=self.sibling.ID)
+        inheritance = Inheritance(self.cat)
+
+        self.assertEqual(set(inheritance.siblings_kits), {nephew.ID})
+
+    def test_new_mate_updates_mates_family(self):
+        # given
+        mate = Cat()
+        for cat in Cat.all_cats.values():
+            cat.inheritance = Inheritance(cat)
+
+        # when
+        self.sibling.set_mate(mate)
+
+        # then
+        self.assertIn(mate.ID, self.cat.inheritance.siblings_mates)
+        self.assertIn(mate.ID, self.parent.inheritance.kits_mates)
+
+    def test_kinship(self):
+        inheritance = Inheritance(self.cat)
+
+        self.assertEqual(inheritance.get_kinship(self.parent.ID), Kinship.PARENT)
+        self.assertEqual(inheritance.get_kinship(self.cousin.ID), Kinship.COUSIN)
+        self.assertEqual(inheritance.get_kinship(self.stranger.ID), Kinship.NONE)
+        self.assertIn(self.cousin.ID, inheritance.all_involved)
+        self.assertNotIn(self.cousin.ID, inheritance.all_but_cousins)
+        self.assertTrue(self.cat.is_parent(self.kit))
+        self.assertFalse(self.kit.is_parent(self.cat))
+
+        # a mate of a kit is filed, but isn't a relative
+        mate = Cat()
+        self.kit.set_mate(mate)
+        inheritance.update_inheritance()
+        self.assertEqual(inheritance.get_kinship(mate.ID), Kinship.KITS_MATE)
+        self.assertNotIn(mate.ID, inheritance.all_involved)
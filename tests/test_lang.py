@@ -9,6 +9,9 @@ from scripts.game_structure.localization import (
     get_new_pronouns,
     determine_plural_pronouns,
     set_lang_config_directory,
+    load_lang_resource,
+    clear_lang_resource_cache,
+    get_lang_resource_cache_stats,
 )
 from scripts.utility import event_text_adjust
 
@@ -98,3 +101,39 @@ class TestLocalisation(unittest.TestCase):
                     ),
                     value[1]["subject"],
                 )
+
+
+class TestLangResourceCache(unittest.TestCase):
+    def setUp(self):
+        clear_lang_resource_cache()
+
+    def tearDown(self):
+        i18n.config.set("locale", "en")
+        clear_lang_resource_cache()
+
+    def test_repeated_load_hits_cache(self):
+        before = get_lang_resource_cache_stats()
+        first = load_lang_resource("thoughts/alive/general.json")
+        second = load_lang_resource("thoughts/alive/general.json")
+        after = get_lang_resource_cache_stats()
+
+        self.assertIs(first, second)
+        self.assertEqual(after["misses"] - before["misses"], 1)
+        self.assertEqual(after["hits"] - before["hits"], 1)
+
+    def test_path_is_normalised(self):
+        first = load_lang_resource("thoughts/alive/general.json")
+        second = load_lang_resource("/thoughts/alive/../alive/general.json")
+        self.assertIs(first, second)
+
+    def test_locale_change_invalidates(self):
+        first = load_lang_resource("thoughts/alive/general.json")
+        self.assertEqual(get_lang_resource_cache_stats()["size"], 1)
+
+        # no "xx" lang exists, so this falls back to the english file
+        i18n.config.set("locale", "xx")
+        second = load_lang_resource("thoughts/alive/general.json")
+
+        self.assertEqual(get_lang_resource_cache_stats()["size"], 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
@@ -0,0 +1,77 @@
+import os
+import unittest
+
+import i18n
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.events_module.patrol.patrol import PATROL_RESOURCES, Patrol
+from scripts.events_module.patrol.patrol_catalogue import PatrolCatalogue, PatrolIndex
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+
+
+class TestPatrolCatalogue(unittest.TestCase):
+    def tearDown(self):
+        i18n.config.set("locale", "en")
+
+    def test_file_is_parsed_once(self):
+        catalogue = PatrolCatalogue()
+
+        events = catalogue.get("general/border.json")
+
+        self.assertTrue(events)
+        self.assertTrue(all(isinstance(event, PatrolEvent) for event in events))
+        self.assertIs(catalogue.get("general/border.json"), events)
+
+    def test_locale_change_invalidates(self):
+        catalogue = PatrolCatalogue()
+        events = catalogue.get("general/border.json")
+
+        i18n.config.set("locale", "xx")
+        # falls back to english, but is parsed again
+        self.assertIsNot(catalogue.get("general/border.json"), events)
+
+    def test_patrols_share_events(self):
+        patrol1 = Patrol()
+        patrol2 = Patrol()
+
+        patrol1.update_resources("forest/", "greenleaf")
+        patrol2.update_resources("forest/", "greenleaf")
+
+        for patrol_property in PATROL_RESOURCES:
+            self.assertIs(
+                getattr(patrol1, patrol_property), getattr(patrol2, patrol_property)
+            )
+
+
+class TestPatrolIndex(unittest.TestCase):
+    def test_candidates(self):
+        # given
+        hunting = PatrolEvent(
+            "hunt", biome=["forest"], types=["hunting"], min_cats=2, max_cats=3
+        )
+        anywhere = PatrolEvent("any_hunt", types=["hunting"])
+        border = PatrolEvent("border", biome=["forest"], types=["border"])
+        romantic = PatrolEvent("romance", types=["hunting"], tags=["romantic"])
+        leaf_bare = PatrolEvent("cold", season=["leaf-bare"], types=["hunting"])
+        index = PatrolIndex([hunting, anywhere, border, romantic, leaf_bare])
+
+        # then
+        self.assertEqual(
+            index.candidates("forest", "camp1", "greenleaf", "hunting", 2),
+            ([hunting, anywhere], [romantic]),
+        )
+        self.assertEqual(
+            index.candidates("forest", "camp1", "greenleaf", "hunting", 1),
+            ([anywhere], [romantic]),
+        )
+        self.assertEqual(
+            index.candidates("beach", "camp1", "leaf-bare", "hunting", 1),
+            ([anywhere, leaf_bare], [romantic]),
+        )
+        # no type requirement for other patrol types
+        self.assertEqual(
+            index.candidates("forest", "camp1", "greenleaf", "herb_gathering", 2),
+            ([hunting, anywhere, border], [romantic]),
+        )
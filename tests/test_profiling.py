@@ -0,0 +1,78 @@
+import unittest
+
+from scripts.game_structure.profiling import Profiler, profiled, profiler
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = Profiler()
+        self.profiler.enabled = True
+
+    def test_spans_are_nested(self):
+        with self.profiler.span("moon", root=True):
+            for _ in range(3):
+                with self.profiler.span("cats"):
+                    with self.profiler.span("thoughts"):
+                        pass
+            with self.profiler.span("herbs"):
+                pass
+
+        moon = self.profiler.latest
+        self.assertEqual(moon.name, "moon")
+        self.assertEqual(set(moon.children), {"cats", "herbs"})
+        self.assertEqual(moon.children["cats"].calls, 3)
+        self.assertEqual(moon.children["cats"].children["thoughts"].calls, 3)
+        self.assertGreaterEqual(moon.time, moon.children["cats"].time)
+        self.assertEqual(self.profiler.runs, 1)
+
+    def test_totals_count_outermost_spans(self):
+        for _ in range(2):
+            with self.profiler.span("moon", root=True):
+                with self.profiler.span("cats"):
+                    with self.profiler.span("cats"):
+                        pass
+
+        self.assertEqual(self.profiler.totals["moon"][0], 2)
+        self.assertEqual(self.profiler.totals["cats"][0], 2)
+
+        self.profiler.reset()
+        self.assertEqual(self.profiler.totals, {})
+        self.assertIsNone(self.profiler.latest)
+
+    def test_spans_need_a_root(self):
+        with self.profiler.span("cats"):
+            pass
+
+        self.assertIsNone(self.profiler.latest)
+        self.assertEqual(self.profiler.totals, {})
+
+    def test_disabled(self):
+        self.profiler.enabled = False
+        with self.profiler.span("moon", root=True):
+            pass
+
+        self.assertIsNone(self.profiler.latest)
+        self.assertEqual(self.profiler.runs, 0)
+
+
+class TestProfiled(unittest.TestCase):
+    def tearDown(self):
+        profiler.enabled = False
+        profiler.reset()
+
+    def test_decorator(self):
+        @profiled("cats")
+        def cats():
+            return "cats"
+
+        @profiled("moon", root=True)
+        def moon():
+            return cats()
+
+        self.assertEqual(moon(), "cats")
+        self.assertIsNone(profiler.latest)
+
+        profiler.enabled = True
+        self.assertEqual(moon(), "cats")
+        self.assertEqual(profiler.latest.name, "moon")
+        self.assertEqual(profiler.latest.children["cats"].calls, 1)
@@ -0,0 +1,103 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.enums import CatAge, CatGroup, CatRank
+from scripts.cat.status import Status
+from scripts.utility import find_alive_cats_with_rank, get_living_clan_cat_count
+
+
+class TestCatRegistry(unittest.TestCase):
+    def setUp(self):
+        Cat.all_cats.clear()
+
+    def tearDown(self):
+        Cat.all_cats.clear()
+
+    def test_new_cats_are_indexed(self):
+        # given
+        warrior = Cat(status_dict={"rank": CatRank.WARRIOR})
+        kit = Cat(moons=2)
+
+        # then
+        self.assertCountEqual(Cat.all_cats.living_clan_cats(), [warrior, kit])
+        self.assertEqual(Cat.all_cats.with_rank([CatRank.WARRIOR]), [warrior])
+        self.assertEqual(Cat.all_cats.of_age([CatAge.KITTEN]), [kit])
+        self.assertEqual(get_living_clan_cat_count(Cat), 2)
+
+    def test_rank_change_moves_cat(self):
+        # given
+        cat = Cat(status_dict={"rank": CatRank.APPRENTICE})
+
+        # when
+        cat.status._change_rank(CatRank.MEDICINE_APPRENTICE)
+
+        # then
+        self.assertEqual(Cat.all_cats.with_rank([CatRank.APPRENTICE]), [])
+        self.assertEqual(
+            find_alive_cats_with_rank(Cat, [CatRank.MEDICINE_APPRENTICE]), [cat]
+        )
+
+    def test_new_status_moves_cat(self):
+        cat = Cat(status_dict={"rank": CatRank.WARRIOR})
+
+        cat.status = Status(rank=CatRank.ELDER)
+        self.assertEqual(Cat.all_cats.with_rank([CatRank.WARRIOR]), [])
+        self.assertEqual(Cat.all_cats.with_rank([CatRank.ELDER]), [cat])
+
+        # changes to the new status are followed too
+        cat.status._change_rank(CatRank.WARRIOR)
+        self.assertEqual(Cat.all_cats.with_rank([CatRank.WARRIOR]), [cat])
+
+    def test_age_change_moves_cat(self):
+        cat = Cat(moons=5)
+        self.assertEqual(Cat.all_cats.of_age([CatAge.KITTEN]), [cat])
+
+        cat.moons = 6
+        self.assertEqual(Cat.all_cats.of_age([CatAge.KITTEN]), [])
+        self.assertEqual(Cat.all_cats.of_age([CatAge.ADOLESCENT]), [cat])
+
+    def test_dead_and_removed_cats(self):
+        # given
+        cat1 = Cat(status_dict={"rank": CatRank.WARRIOR})
+        cat2 = Cat(status_dict={"rank": CatRank.WARRIOR})
+
+        # when
+        cat1.status.send_to_afterlife(CatGroup.STARCLAN)
+        del Cat.all_cats[cat2.ID]
+
+        # then
+        self.assertEqual(Cat.all_cats.living_clan_cats(), [])
+        self.assertEqual(Cat.all_cats.afterlife_cats(), [cat1])
+        self.assertEqual(Cat.all_cats.with_rank([CatRank.WARRIOR]), [cat1])
+        self.assertEqual(
+            Cat.all_cats.with_rank([CatRank.WARRIOR], group=CatGroup.PLAYER_CLAN), []
+        )
+
+    def test_mate_candidates(self):
+        # given
+        cat = Cat(moons=40)
+        warrior = Cat(moons=45)
+        no_mates = Cat(moons=45)
+        no_mates.no_mates = True
+        kit = Cat(moons=3)
+        dead = Cat(moons=45)
+        dead.status.send_to_afterlife(CatGroup.STARCLAN)
+
+        # then
+        self.assertEqual(Cat.all_cats.mate_candidates(cat), [warrior])
+        self.assertCountEqual(
+            Cat.all_cats.mate_candidates(cat, ignore_no_mates=True),
+            [warrior, no_mates],
+        )
+        self.assertEqual(Cat.all_cats.mate_candidates(no_mates), [])
+
+        # when
+        no_mates.no_mates = False
+
+        # then
+        self.assertCountEqual(Cat.all_cats.mate_candidates(cat), [warrior, no_mates])
+        self.assertEqual(Cat.all_cats.mate_candidates(dead), [])
@@ -0,0 +1,223 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat, Relationship
+from scripts.cat.save_load import (
+    RELATIONSHIP_FILE,
+    load_relationships,
+    save_relationships,
+)
+
+
+class TestRelationshipRow(unittest.TestCase):
+    def test_stored_relationship_becomes_view(self):
+        # given
+        cat1 = Cat()
+        cat2 = Cat()
+        relationship = Relationship(cat1, cat2, romantic_love=20, log=["met"])
+
+        # when
+        cat1.relationships[cat2.ID] = relationship
+        relationship.platonic_like += 15
+
+        # then
+        self.assertIs(cat1.relationships[cat2.ID], relationship)
+        self.assertEqual(
+            cat1.relationships.columns["platonic_like"][
+                cat1.relationships.index.find_slot(cat2.ID)
+            ],
+            15,
+        )
+        self.assertEqual(cat1.relationships[cat2.ID].romantic_love, 20)
+        self.assertEqual(cat1.relationships[cat2.ID].log, ["met"])
+
+    def test_stats_are_clamped(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add(cat2, trust=150, dislike=-20)
+
+        relationship = cat1.relationships[cat2.ID]
+        self.assertEqual(relationship.trust, 100)
+        self.assertEqual(relationship.dislike, 0)
+
+        relationship.comfortable += 300
+        self.assertEqual(relationship.comfortable, 100)
+
+    def test_flags(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add(cat2, family=True)
+
+        relationship = cat1.relationships[cat2.ID]
+        self.assertTrue(relationship.family)
+        self.assertFalse(relationship.mates)
+
+        relationship.mates = True
+        relationship.family = False
+        self.assertTrue(cat1.relationships[cat2.ID].mates)
+        self.assertFalse(cat1.relationships[cat2.ID].family)
+
+    def test_mapping_behaviour(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat3 = Cat()
+        cat1.relationships.add(cat2, mates=True, family=True, log=["hello"])
+        cat1.relationships.add(cat3)
+
+        self.assertEqual(len(cat1.relationships), 2)
+        self.assertEqual(set(cat1.relationships), {cat2.ID, cat3.ID})
+        self.assertNotIn(cat1.ID, cat1.relationships)
+        self.assertIsNone(cat1.relationships.get(cat1.ID))
+
+        removed = cat1.relationships[cat2.ID]
+        removed.trust = 40
+        del cat1.relationships[cat2.ID]
+        self.assertEqual(len(cat1.relationships), 1)
+        self.assertNotIn(cat2.ID, cat1.relationships)
+        # the removed relationship keeps its values
+        self.assertEqual(removed.trust, 40)
+        self.assertTrue(removed.mates)
+        self.assertTrue(removed.family)
+        self.assertEqual(removed.log, ["hello"])
+
+    def test_only_changed_logs_dirty_the_row(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add(cat2, log=["met"])
+        cat1.relationships.dirty = False
+
+        relationship = cat1.relationships[cat2.ID]
+        self.assertEqual(relationship.log[-1], "met")
+        self.assertFalse(cat1.relationships.dirty)
+
+        relationship.log.append("talked")
+        self.assertTrue(cat1.relationships.dirty)
+
+    def test_opposite_relationship(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add(cat2)
+        relationship = cat1.relationships[cat2.ID]
+        self.assertIsNone(relationship.opposite_relationship)
+
+        relationship.link_relationship()
+        self.assertIs(relationship.opposite_relationship, cat2.relationships[cat1.ID])
+
+    def test_records(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add(cat2, mates=True, romantic_love=55, log=["hi"])
+
+        self.assertEqual(
+            list(cat1.relationships.records()),
+            [
+                {
+                    "cat_from_id": cat1.ID,
+                    "cat_to_id": cat2.ID,
+                    "mates": True,
+                    "family": False,
+                    "romantic_love": 55,
+                    "platonic_like": 0,
+                    "dislike": 0,
+                    "admiration": 0,
+                    "comfortable": 0,
+                    "jealousy": 0,
+                    "trust": 0,
+                    "log": ["hi"],
+                }
+            ],
+        )
+
+    def test_replace_all_relationships(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add(cat2)
+
+        cat1.relationships = {}
+        self.assertEqual(len(cat1.relationships), 0)
+
+
+class TestRelationshipFile(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp()
+        self.clan_dir = os.path.join(self.save_dir, "TestClan")
+        os.makedirs(self.clan_dir)
+        patcher = patch(
+            "scripts.cat.save_load.get_save_dir", return_value=self.save_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.save_dir)
+
+        self.cat1 = Cat()
+        self.cat2 = Cat()
+        self.cat1.relationships.add(self.cat2, family=True, trust=30, log=["met"])
+        self.cat2.relationships.add(self.cat1, admiration=12)
+        self.clan = SimpleNamespace(
+            all_cats={self.cat1.ID: self.cat1, self.cat2.ID: self.cat2}
+        )
+
+    def save(self, single_file):
+        with patch("scripts.cat.save_load.game_setting_get", return_value=single_file):
+            return save_relationships("TestClan", self.clan)
+
+    def test_round_trip(self):
+        self.save(single_file=True)
+        self.assertTrue(os.path.exists(os.path.join(self.clan_dir, RELATIONSHIP_FILE)))
+
+        expected = list(self.cat1.relationships.records())
+        self.cat1.relationships = {}
+        self.cat2.relationships = {}
+        self.assertTrue(load_relationships("TestClan", self.clan))
+
+        self.assertEqual(list(self.cat1.relationships.records()), expected)
+        self.assertEqual(self.cat2.relationships[self.cat1.ID].admiration, 12)
+
+    def test_cat_without_records(self):
+        self.save(single_file=True)
+        new_cat = Cat()
+        self.clan.all_cats[new_cat.ID] = new_cat
+
+        self.assertTrue(load_relationships("TestClan", self.clan))
+
+        self.assertIn(self.cat1.ID, new_cat.relationships)
+        self.assertIn(new_cat.ID, self.cat1.relationships)
+        self.assertIn(new_cat.ID, self.cat2.relationships)
+        self.assertTrue(self.cat1.relationships.dirty)
+
+    def test_migration(self):
+        self.save(single_file=False)
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(
+                    self.clan_dir, "relationships", f"{self.cat1.ID}_relations.json"
+                )
+            )
+        )
+        self.assertFalse(load_relationships("TestClan", self.clan))
+
+        self.save(single_file=True)
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, "relationships")))
+
+        self.save(single_file=False)
+        self.assertFalse(os.path.exists(os.path.join(self.clan_dir, RELATIONSHIP_FILE)))
+
+    def test_only_changed_cats_are_saved(self):
+        self.assertEqual(self.save(single_file=False), 2)
+        self.assertEqual(self.save(single_file=False), 0)
+
+        self.cat1.relationships[self.cat2.ID].trust += 5
+        self.assertEqual(self.save(single_file=False), 1)
+
+        self.assertEqual(self.save(single_file=True), 1)
+        self.assertEqual(self.save(single_file=True), 0)
+
+        self.cat2.relationships[self.cat1.ID].log.append("talked")
+        self.assertEqual(self.save(single_file=True), 1)
@@ -1,12 +1,27 @@
 import os
 import shutil
+import tempfile
 import unittest
-
-from scripts.game_structure.game.save_load import read_clans
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scripts.game_structure.game.save_load import (
+    on_save_failure,
+    read_clans,
+    safe_remove,
+    safe_save,
+    save_batch,
+    save_in_background,
+    wait_for_background_saves,
+    collect_background_save_errors,
+)
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+from scripts.cat.cats import Cat
+from scripts.cat.history import History
+from scripts.cat.save_load import save_cats
 from scripts.game_structure.game_essentials import Game
 from scripts.housekeeping.datadir import get_save_dir
 
@@ -147,3 +162,91 @@ class MigrateSave(unittest.TestCase):
                     file_list,
                     "Save " + str(i) + " not migrated correctly",
                 )
+
+
+class BackgroundSave(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.addCleanup(collect_background_save_errors)
+
+    def test_snapshot_is_written_in_order(self):
+        path = os.path.join(self.directory, "data.json")
+        old_path = os.path.join(self.directory, "old.json")
+        safe_save(old_path, [])
+
+        data = {"cats": ["1", "2"]}
+        with save_batch() as batch:
+            safe_save(path, data)
+            safe_remove(old_path)
+        # nothing is written until the batch is started
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(os.path.exists(old_path))
+
+        data["cats"].append("3")
+        save_thread = save_in_background(batch)
+        wait_for_background_saves()
+
+        self.assertEqual(batch.progress, 1)
+        self.assertIsNone(save_thread.exc)
+        with open(path, "r", encoding="utf-8") as read_file:
+            self.assertEqual(
+                read_file.read(),
+                '{\n    "cats": [\n        "1",\n        "2"\n    ]\n}',
+            )
+        self.assertFalse(os.path.exists(old_path))
+
+    def test_errors_are_collected(self):
+        with save_batch() as batch:
+            safe_save(
+                os.path.join(self.directory, "data.json"), {}, check_integrity=True
+            )
+            safe_save(os.path.join(self.directory, "missing", ""), {})
+        save_in_background(batch)
+        wait_for_background_saves()
+
+        errors = collect_background_save_errors()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(collect_background_save_errors(), [])
+
+    def test_failed_save_marks_data_unsaved(self):
+        saved = SimpleNamespace(dirty=False)
+        with save_batch() as batch:
+            safe_save(os.path.join(self.directory, "missing", ""), {})
+            on_save_failure(setattr, saved, "dirty", True)
+        self.assertFalse(saved.dirty)
+
+        save_in_background(batch)
+        wait_for_background_saves()
+
+        self.assertTrue(saved.dirty)
+        self.assertEqual(len(collect_background_save_errors()), 1)
+
+
+class SaveCats(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for patcher in (
+            patch("scripts.cat.save_load.get_save_dir", return_value=directory),
+            patch.object(Cat, "save_condition", return_value=False),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.cat = Cat()
+        self.cat.history = History(cat=self.cat)
+        self.cat.history.dirty = True
+        self.clan = SimpleNamespace(all_cats={self.cat.ID: self.cat})
+
+    def test_history_is_dumped_once_written(self):
+        history = self.cat.history
+        with patch("scripts.cat.save_load.background_save_running", return_value=True):
+            save_cats("TestClan", self.clan, None)
+            self.assertFalse(history.dirty)
+            # the earlier save might still be writing it
+            save_cats("TestClan", self.clan, None)
+            self.assertIs(self.cat.history, history)
+
+        save_cats("TestClan", self.clan, None)
+        self.assertIsNone(self.cat._history)
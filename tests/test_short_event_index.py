@@ -0,0 +1,116 @@
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import i18n
+
+from scripts.clan import Clan
+from scripts.events_module.generate_events import GenerateEvents
+from scripts.events_module.short.short_event import ShortEvent
+from scripts.events_module.short.short_event_index import ShortEventIndex
+from scripts.game_structure.game_essentials import game
+
+
+class TestShortEventIndex(unittest.TestCase):
+    def setUp(self):
+        clan = Clan(name="test", biome="Forest", camp_bg="camp1")
+        clan.current_season = "Greenleaf"
+        patcher = patch.object(game, "clan", clan)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.general = ShortEvent(event_id="general")
+        self.war = ShortEvent(event_id="war", sub_type=["war"])
+        self.forest = ShortEvent(event_id="forest", location=["forest"])
+        self.beach = ShortEvent(event_id="beach", location=["beach"])
+        self.leaf_bare = ShortEvent(event_id="leaf_bare", season=["leaf-bare"])
+        self.also_general = ShortEvent(event_id="also_general")
+        self.index = ShortEventIndex(
+            [
+                self.general,
+                self.war,
+                self.forest,
+                self.beach,
+                self.leaf_bare,
+                self.also_general,
+            ]
+        )
+
+    def test_candidates(self):
+        self.assertEqual(
+            self.index.candidates([]),
+            [self.general, self.forest, self.also_general],
+        )
+        self.assertEqual(self.index.candidates(["war"]), [self.war])
+        self.assertEqual(
+            self.index.candidates(None),
+            [self.general, self.war, self.forest, self.also_general],
+        )
+
+    def test_season_change(self):
+        self.index.candidates([])
+
+        game.clan.current_season = "Leaf-bare"
+
+        self.assertEqual(
+            self.index.candidates([]),
+            [self.general, self.forest, self.leaf_bare, self.also_general],
+        )
+
+    def test_incorrect_format(self):
+        index = ShortEventIndex([ShortEvent(event_id="broken", injury={"m_c": []})])
+
+        self.assertEqual(
+            index.incorrect_format, ["broken injury formatted incorrectly"]
+        )
+
+
+class TestLoadedEvents(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(
+            game, "clan", Clan(name="test", biome="Forest", camp_bg="camp1")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        GenerateEvents.clear_loaded_events()
+        GenerateEvents.check_loaded_events_version()
+
+    def tearDown(self):
+        i18n.config.set("locale", "en")
+        GenerateEvents.clear_loaded_events()
+
+    def test_events_are_kept(self):
+        events = GenerateEvents.possible_short_events(4, "misc")
+
+        GenerateEvents.refresh_loaded_events()
+
+        self.assertIs(GenerateEvents.possible_short_events(4, "misc"), events)
+
+    def test_changed_file_is_loaded_again(self):
+        events = GenerateEvents.possible_short_events(4, "misc")
+        load_name, files = next(
+            (name, files)
+            for name, files in GenerateEvents.loaded_events_files.items()
+            if name.startswith("misc/general.json")
+        )
+        path = next(iter(files))
+        modified_time = os.path.getmtime(path)
+        self.addCleanup(os.utime, path, (modified_time, modified_time))
+
+        os.utime(path, (modified_time + 10, modified_time + 10))
+        GenerateEvents.refresh_loaded_events()
+
+        self.assertNotIn(load_name, GenerateEvents.loaded_events)
+        self.assertIsNot(GenerateEvents.possible_short_events(4, "misc"), events)
+
+    def test_locale_change_clears_events(self):
+        events = GenerateEvents.possible_short_events(4, "misc")
+
+        i18n.config.set("locale", "xx")
+        GenerateEvents.refresh_loaded_events()
+
+        self.assertFalse(GenerateEvents.loaded_events)
+        self.assertIsNot(GenerateEvents.possible_short_events(4, "misc"), events)
@@ -0,0 +1,41 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.housekeeping import datadir
+from scripts.simulation import PHASES, generate_clan, simulate
+
+
+class TestSimulation(unittest.TestCase):
+    def tearDown(self):
+        Cat.all_cats.clear()
+
+    def test_generated_clan(self):
+        generate_clan(12)
+
+        self.assertEqual(
+            len(
+                [
+                    cat
+                    for cat in Cat.all_cats.values()
+                    if cat.status.alive_in_player_clan
+                ]
+            ),
+            12,
+        )
+
+    def test_report(self):
+        get_data_dir = datadir.get_data_dir
+
+        report = simulate(2, 1, cats=12)
+
+        self.assertIs(datadir.get_data_dir, get_data_dir)
+        self.assertEqual(report["cats"], 12)
+        self.assertEqual(len(report["moons"]), report["summary"]["moons"])
+        for moon in report["moons"]:
+            self.assertEqual(set(moon["phases"]), set(PHASES))
+            self.assertGreater(moon["phases"]["cats"], 0)
+            self.assertLessEqual(moon["phases"]["cats"], moon["total"])
@@ -8,6 +8,7 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
 from scripts.cat.thoughts import Thoughts
+from scripts.game_structure.localization import load_lang_resource
 
 
 class TestNotWorkingThoughts(unittest.TestCase):
@@ -138,6 +139,36 @@ class TestsGetStatusThought(unittest.TestCase):
         thoughts = Thoughts.load_thoughts(cat, None, "expanded", biome, season, camp)
 
 
+class TestThoughtIndex(unittest.TestCase):
+    def test_index_matches_full_scan(self):
+        main = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        other = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        raw_thoughts = load_lang_resource("thoughts/alive/warrior.json") + (
+            load_lang_resource("thoughts/alive/general.json")
+        )
+
+        for biome, season in (("Forest", "Newleaf"), ("Beach", "Leaf-bare")):
+            with self.subTest(biome=biome, season=season):
+                expected = Thoughts.create_thoughts(
+                    raw_thoughts, main, other, "expanded", biome, season, "camp2"
+                )
+                indexed = Thoughts.load_thoughts(
+                    main, other, "expanded", biome, season, "camp2"
+                )
+                self.assertEqual(
+                    [t["id"] for t in expected], [t["id"] for t in indexed]
+                )
+
+    def test_static_thoughts_are_memoized(self):
+        first = Thoughts.get_static_thoughts(
+            "alive", "", "warrior", "expanded", "Forest", "Newleaf", "camp2"
+        )
+        second = Thoughts.get_static_thoughts(
+            "alive", "", "warrior", "expanded", "Forest", "Newleaf", "camp2"
+        )
+        self.assertIs(first, second)
+
+
 class TestFamilyThoughts(unittest.TestCase):
     def test_family_thought_young_children(self):
         # given
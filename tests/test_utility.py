@@ -1,5 +1,9 @@
 import os
 import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pygame
 
 from scripts.cat.enums import CatRank
 
@@ -7,12 +11,17 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
+from scripts.cat.sprites import SpriteCache, sprites
 from scripts.cat_relations.relationship import Relationship
 from scripts.utility import (
     get_highest_romantic_relation,
     get_personality_compatibility,
     get_amount_of_cats_with_relation_value_towards,
     get_alive_clan_queens,
+    generate_sprite,
+    get_sprite_appearance_key,
+    inflate_mask,
+    update_mask,
 )
 
 
@@ -411,3 +420,71 @@ class TestGetQueens(unittest.TestCase):
         self.assertEqual(
             [self.test_cat2.ID], list(get_alive_clan_queens(living_cats)[0].keys())
         )
+
+
+class TestSpriteCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = SpriteCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now least recently used
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.stats()["hits"], 3)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_appearance_key(self):
+        cat = Cat()
+        key = get_sprite_appearance_key(cat, 1, "8", False, None, False, False)
+        self.assertEqual(
+            key, get_sprite_appearance_key(cat, 1, "8", False, None, False, False)
+        )
+
+        cat.pelt.scars = ["ONE"]
+        self.assertNotEqual(
+            key, get_sprite_appearance_key(cat, 1, "8", False, None, False, False)
+        )
+        self.assertNotEqual(
+            key, get_sprite_appearance_key(cat, 1, "8", True, "0", False, False)
+        )
+
+    def test_missing_species_sprites(self):
+        pygame.display.set_mode((1, 1))
+        cat = Cat()
+        with patch.object(
+            sprites, "ensure_species_loaded", side_effect=FileNotFoundError
+        ):
+            sprite = generate_sprite(cat)
+
+        # the placeholder is drawn instead
+        self.assertIsInstance(sprite, pygame.Surface)
+
+
+class TestMask(unittest.TestCase):
+    def test_inflate_mask(self):
+        mask = pygame.Mask((10, 10))
+        mask.set_at((0, 4))
+
+        inflated_mask = inflate_mask(mask, 5, 3)
+
+        self.assertEqual(inflated_mask.get_size(), (20, 20))
+        self.assertEqual(inflated_mask.count(), 49)
+        self.assertEqual(inflated_mask.get_bounding_rects(), [pygame.Rect(2, 6, 7, 7)])
+
+    def test_mask_is_shared(self):
+        sprite = pygame.Surface((50, 50), pygame.SRCALPHA)
+        sprite.fill((255, 255, 255, 255), pygame.Rect(20, 20, 10, 10))
+        cat1 = SimpleNamespace(faded=False, dead=False, sprite=sprite)
+        cat2 = SimpleNamespace(faded=False, dead=False, sprite=sprite)
+        sprites.cat_mask_cache.clear()
+
+        update_mask(cat1)
+        update_mask(cat2)
+
+        self.assertIs(cat1.sprite_mask, cat2.sprite_mask)
+        self.assertGreater(cat1.sprite_mask.count(), 100)
+        sprites.cat_mask_cache.clear()